@@ -2,13 +2,104 @@
 Advanced example: Analyzing multiple stocks with RSI strategy
 """
 
-from tradingsuite import TradingViewData, MarketData, Backtest
+from tradingsuite import TradingViewData, Backtest
+from tradingsuite.data import get_market_df
 from tradingsuite.strategies import rsi_strategy, smma_ribbon_strategy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import csv
+import os
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-def analyze_top_stocks():
-    """Analyze top stocks from a sector"""
+# Strategies are looked up by name so only plain strings cross the process boundary
+STRATEGIES = {
+    'rsi': rsi_strategy,
+    'smma_ribbon': smma_ribbon_strategy,
+}
+
+# One row of the results table
+RESULT_DTYPE = np.dtype([
+    ('ticker', 'U12'),
+    ('trades', 'i4'),
+    ('win_ratio', 'f8'),
+    ('avg_result', 'f8'),
+    ('cumulative', 'U16'),
+])
+
+
+def _run_one(ticker, strategy_name, **params):
+    """
+    Download one ticker and backtest it (runs in a worker process)
+
+    Parameters:
+    - ticker: str, ticker symbol
+    - strategy_name: str, key of the STRATEGIES dict
+    - params: additional parameters passed to the strategy function
+
+    Return: results tuple matching RESULT_DTYPE, or the raised exception if the ticker failed
+    """
+    try:
+        df = get_market_df(ticker)
+        backtest = Backtest(df, STRATEGIES[strategy_name], **params)
+        summary = backtest.trades_summary
+        return (ticker, summary['number_of_trades'], summary['win_ratio(%)'],
+                summary['average_res(%)'], summary['cumulative_result'])
+    except Exception as e:
+        return e
+
+
+def run_parallel(tickers, strategy_name, max_workers=None, output_path=None, **params):
+    """
+    Backtest every ticker in a separate process
+
+    Parameters:
+    - tickers: list of ticker symbols
+    - strategy_name: str, key of the STRATEGIES dict
+    - max_workers: int, number of worker processes, defaults to os.cpu_count()
+    - output_path: str, optional CSV file; each row is appended as soon as its ticker
+      finishes, so partial results survive an interrupted run
+    - params: additional parameters passed to the strategy function
+
+    Return: DataFrame with one row per successful ticker
+    """
+    # Preallocated result rows, filled by ticker position as the workers finish
+    out = np.zeros(len(tickers), dtype=RESULT_DTYPE)
+    ok = np.zeros(len(tickers), dtype=bool)
+    
+    out_file = open(output_path, 'w', newline='') if output_path else None
+    try:
+        if out_file:
+            writer = csv.writer(out_file)
+            writer.writerow(RESULT_DTYPE.names)
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {executor.submit(_run_one, ticker, strategy_name, **params): i
+                       for i, ticker in enumerate(tickers)}
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                i = futures[future]
+                result = future.result()
+                if isinstance(result, Exception):
+                    print(f"Error with {tickers[i]}: {result}")
+                    continue
+                out[i] = result
+                ok[i] = True
+                if out_file:
+                    writer.writerow(result)
+                    out_file.flush()
+    finally:
+        if out_file:
+            out_file.close()
+    return pd.DataFrame.from_records(out[ok])
+
+
+def analyze_top_stocks(output_path=None):
+    """
+    Analyze top stocks from a sector
+
+    Parameters:
+    - output_path: str, optional CSV file the result rows are streamed to while the run works
+    """
     
     # 1. Load TradingView data
     print("Loading TradingView data...")
@@ -21,31 +112,12 @@ def analyze_top_stocks():
     
     print(f"\nAnalyzing {len(tech_stocks)} top tech stocks...")
     
-    # 3. Run backtest for each stock
-    results = []
-    for ticker in tqdm(tech_stocks['name']):
-        try:
-            # Get stock data
-            stock = MarketData(ticker)
-            
-            # Run RSI strategy
-            backtest = Backtest(stock.df, rsi_strategy, 
+    # 3. Run backtest for each stock in parallel
+    results_df = run_parallel(tech_stocks['name'].tolist(), 'rsi',
+                              output_path=output_path,
                               buy_threshold=30, sell_threshold=70)
-            
-            # Store results
-            results.append({
-                'ticker': ticker,
-                'trades': backtest.trades_summary['number_of_trades'],
-                'win_ratio': backtest.trades_summary['win_ratio(%)'],
-                'avg_result': backtest.trades_summary['average_res(%)'],
-                'cumulative': backtest.trades_summary['cumulative_result']
-            })
-        except Exception as e:
-            print(f"Error with {ticker}: {e}")
-            continue
     
-    # 4. Create results DataFrame
-    results_df = pd.DataFrame(results)
+    # 4. Sort results
     results_df = results_df.sort_values('avg_result', ascending=False)
     
     # 5. Display results
@@ -59,15 +131,12 @@ def compare_strategies(ticker='AAPL'):
     
     print(f"\nComparing strategies for {ticker}...")
     
-    # Get stock data
-    stock = MarketData(ticker)
-    
-    # Strategy 1: RSI
-    rsi_backtest = Backtest(stock.df, rsi_strategy,
+    # Strategy 1: RSI (stock data is cached, each strategy gets its own copy)
+    rsi_backtest = Backtest(get_market_df(ticker), rsi_strategy,
                             buy_threshold=30, sell_threshold=70)
     
     # Strategy 2: SMMA Ribbon
-    smma_backtest = Backtest(stock.df, smma_ribbon_strategy,
+    smma_backtest = Backtest(get_market_df(ticker), smma_ribbon_strategy,
                              buy_at='gold', sell_at='grey')
     
     # Compare results
@@ -91,7 +160,8 @@ def compare_strategies(ticker='AAPL'):
         ]
     })
     
-    print(comparison)
+    # Aligned text table without the row index
+    print(comparison.to_string(index=False))
     return comparison
 
 if __name__ == "__main__":
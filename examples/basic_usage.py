@@ -3,7 +3,8 @@ Basic usage example for TradingSuite package
 """
 
 # Import the package
-from tradingsuite import TradingViewData, MarketData, Backtest
+from tradingsuite import TradingViewData, Backtest
+from tradingsuite.data import get_market_df
 from tradingsuite.strategies import rsi_strategy
 
 def main():
@@ -17,12 +18,12 @@ def main():
     
     # 2. Get stock price data
     print("\nGetting Tesla stock data...")
-    tesla = MarketData('TSLA')
-    print(f"Loaded {len(tesla.df)} days of TSLA data")
+    tesla_df = get_market_df('TSLA')
+    print(f"Loaded {len(tesla_df)} days of TSLA data")
     
     # 3. Run backtest
     print("\nRunning RSI strategy backtest...")
-    backtest = Backtest(tesla.df, rsi_strategy, buy_threshold=30, sell_threshold=70)
+    backtest = Backtest(tesla_df, rsi_strategy, buy_threshold=30, sell_threshold=70)
     
     # 4. Show results
     print("\nBacktest Results:")
@@ -9,212 +9,263 @@
 # !pip install -e /path/to/TradingSuite
 
 # ============= IMPORTOK =============
-from tradingsuite.data.market_data import MarketData
+from tradingsuite.data.market_data import get_market_df, get_market_dfs
 from tradingsuite.analysis.backtest import Backtest
-from tradingsuite.strategies.sma200 import sma200_strategy, show_indicator_sma200_strategy
+from tradingsuite.strategies.sma200 import sma200_strategy, show_indicator_sma200_strategy, add_sma200_indicators
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 
-# ============= PÉLDA 1: EGYSZERŰ BACKTEST =============
-print("=" * 60)
-print("PÉLDA 1: Alapértelmezett paraméterekkel")
-print("=" * 60)
-
-# Adat betöltés
-ticker = 'AAPL'
-data = MarketData(ticker)
-df = data.df
-
-# Backtest futtatás alapértelmezett paraméterekkel
-backtest = Backtest(df, sma200_strategy)
-
-# Eredmények megjelenítése
-print(f"\nTicker: {ticker}")
-print(f"Trades: {backtest.trades_summary['number_of_trades']}")
-print(f"Win Ratio: {backtest.trades_summary['win_ratio(%)']}%")
-print(f"Average Result: {backtest.trades_summary['average_res(%)']}%")
-print(f"Cumulative Result: {backtest.trades_summary['cumulative_result']}")
-
-# Trade-ek megtekintése
-print("\nTrade details:")
-display(backtest.trades)
-
-# Teljes összefoglaló
-backtest.summarize_strategy()
-
-
-# ============= PÉLDA 2: TESTRESZABOTT PARAMÉTEREKKEL =============
-print("\n" + "=" * 60)
-print("PÉLDA 2: Testreszabott paraméterekkel")
-print("=" * 60)
-
-# Adat betöltés
-ticker = 'TSLA'
-data = MarketData(ticker)
-df = data.df
-
-# Backtest futtatás testreszabott paraméterekkel
-backtest = Backtest(
-    df, 
-    sma200_strategy,
-    rsi_period=14,           # RSI periódus
-    rsi_threshold=60,        # RSI küszöb (konzervatívabb: 60 vs 65)
-    sma_long=200,            # Hosszú távú SMA
-    sma_short=50,            # Rövid távú SMA (kilépéshez)
-    slope_period=10,         # SMA200 meredekség ellenőrzési periódus
-    breakout_period=20,      # Breakout periódus
-    atr_period=14,           # ATR periódus
-    atr_multiplier_body=1.0, # Minimális gyertya test méret (ATR egységben)
-    atr_multiplier_stop=2.5, # Stop loss távolság (ATR egységben) - konzervatívabb
-    atr_multiplier_trail=2.0,# Trailing stop távolság (ATR egységben)
-    max_rise_period=20,      # Parabolikus mozgás ellenőrzési periódus
-    max_rise_percent=12.0    # Maximum emelkedés % (konzervatívabb: 12 vs 15)
-)
-
-print(f"\nTicker: {ticker}")
-print(f"Trades: {backtest.trades_summary['number_of_trades']}")
-print(f"Win Ratio: {backtest.trades_summary['win_ratio(%)']}%")
-print(f"Average Result: {backtest.trades_summary['average_res(%)']}%")
-
-# Teljes összefoglaló
-backtest.summarize_strategy()
-
-
-# ============= PÉLDA 3: VIZUALIZÁCIÓ SHOW_INDICATOR FÜGGVÉNNYEL =============
-print("\n" + "=" * 60)
-print("PÉLDA 3: Vizualizáció show_indicator függvénnyel")
-print("=" * 60)
-
-# Alapértelmezett vizualizáció
-fig = show_indicator_sma200_strategy('NVDA')
-fig.show()
-
-# Testreszabott vizualizáció
-fig = show_indicator_sma200_strategy(
-    'MSFT',
-    rsi_threshold=70,        # Enyhébb RSI szűrő
-    ndays=500,               # Csak az utolsó 500 nap
-    plot_height=1400,        # Magasabb ábra
-    use_tradingview_title=False
-)
-fig.show()
-
-
-# ============= PÉLDA 4: TÖBB TICKER TESZTELÉSE =============
-print("\n" + "=" * 60)
-print("PÉLDA 4: Több ticker összehasonlítása")
-print("=" * 60)
-
-tickers = ['AAPL', 'MSFT', 'GOOGL', 'NVDA', 'TSLA', 'META', 'AMZN']
-results = []
-
-for ticker in tickers:
-    try:
-        print(f"Testing {ticker}...")
-        data = MarketData(ticker)
-        df = data.df
-        
-        backtest = Backtest(df, sma200_strategy)
-        
-        results.append({
-            'ticker': ticker,
-            'trades': backtest.trades_summary['number_of_trades'],
-            'win_ratio': backtest.trades_summary['win_ratio(%)'],
-            'avg_result': backtest.trades_summary['average_res(%)'],
-            'cumulative': backtest.trades_summary['cumulative_result'],
-            'hold_result': backtest.trades_summary['hold_result']
-        })
-    except Exception as e:
-        print(f"Error with {ticker}: {e}")
-        continue
-
-# Eredmények összehasonlítása
-results_df = pd.DataFrame(results)
-results_df = results_df.sort_values('avg_result', ascending=False)
-print("\nÖsszehasonlító eredmények (átlagos eredmény szerint rendezve):")
-display(results_df)
-
-
-# ============= PÉLDA 5: PARAMÉTER OPTIMALIZÁCIÓ =============
-print("\n" + "=" * 60)
-print("PÉLDA 5: Egyszerű paraméter optimalizáció")
-print("=" * 60)
-
-ticker = 'AAPL'
-data = MarketData(ticker)
-df = data.df
-
-# Különböző RSI küszöbök tesztelése
-rsi_thresholds = [55, 60, 65, 70, 75]
-optimization_results = []
-
-for rsi_thresh in rsi_thresholds:
+
+# ============= SEGÉDFÜGGVÉNYEK A PÁRHUZAMOS FUTTATÁSHOZ =============
+# A worker függvényeknek modul szintűeknek kell lenniük, hogy pickle-ölhetők legyenek
+
+# Az eredmények fix sorrendű tuple-ök, a DataFrame egyszer, ezekkel az oszlopokkal épül fel
+TICKER_COLUMNS = ['ticker', 'trades', 'win_ratio', 'avg_result', 'cumulative', 'hold_result']
+PARAM_COLUMNS = ['rsi_threshold', 'trades', 'win_ratio', 'avg_result', 'cumulative']
+
+
+def _bt_ticker(ticker, df):
+    """Egy ticker backtestje (worker processzben fut)"""
+    summary = Backtest(df, sma200_strategy).trades_summary
+    return (ticker, summary['number_of_trades'], summary['win_ratio(%)'],
+            summary['average_res(%)'], summary['cumulative_result'], summary['hold_result'])
+
+
+def _share_df(df):
+    """
+    A backtesthez szükséges oszlopokat egyetlen float64 blokkba másolja megosztott memóriában.
+    A dátum napokban tárolódik, a többi nem numerikus oszlop (ticker, local, ...) az initargs-ban utazik.
+    Visszaadja a SharedMemory-t (a hívó zárja/törli) és az _init_worker argumentumait.
+    """
+    numeric = df.select_dtypes(include=['number', 'bool'])
+    days = pd.to_datetime(df['date']).to_numpy(dtype='datetime64[D]').astype(np.float64)
+    values = np.column_stack([numeric.to_numpy(dtype=np.float64), days])
+    others = {c: df[c].to_numpy() for c in df.columns if c not in numeric.columns and c != 'date'}
+    
+    shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+    return shm, (shm.name, values.shape, numeric.dtypes.to_dict(), others, list(df.columns), df.attrs)
+
+
+_shared_df = None
+_shm = None
+
+def _init_worker(shm_name, shape, dtypes, others, columns, attrs):
+    """A worker a megosztott memóriából építi fel a DataFrame-et, így az adat nem utazik pickle-ölve"""
+    global _shared_df, _shm
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=_shm.buf)
+    
+    df = pd.DataFrame(block[:, :-1], columns=list(dtypes)).astype(dtypes)
+    df['date'] = pd.to_datetime(block[:, -1], unit='D').date
+    for c, values in others.items():
+        df[c] = values
+    # Az eredeti oszlopsorrend, hogy a buy_*/sell_* oszlopok ugyanúgy jöjjenek, mint közvetlen hívásnál
+    df = df[columns]
+    df.attrs.update(attrs)
+    _shared_df = df
+
+
+def _bt_param(rsi_thresh):
+    """Egy RSI küszöb backtestje a megosztott DataFrame-en (worker processzben fut)"""
+    summary = Backtest(_shared_df, sma200_strategy, rsi_threshold=rsi_thresh).trades_summary
+    return (rsi_thresh, summary['number_of_trades'], summary['win_ratio(%)'],
+            summary['average_res(%)'], summary['cumulative_result'])
+
+
+def main():
+    # ============= PÉLDA 1: EGYSZERŰ BACKTEST =============
+    print("=" * 60)
+    print("PÉLDA 1: Alapértelmezett paraméterekkel")
+    print("=" * 60)
+
+    # Adat betöltés (lemez cache-ből, ha friss)
+    # Az AAPL adatot és az alapértelmezett backtestet a PÉLDA 5 és 6 is újrahasználja
+    ticker = 'AAPL'
+    aapl_df = get_market_df(ticker)
+
+    # Backtest futtatás alapértelmezett paraméterekkel
+    aapl_bt = Backtest(aapl_df, sma200_strategy)
+
+    # Eredmények megjelenítése
+    print(f"\nTicker: {ticker}")
+    print(f"Trades: {aapl_bt.trades_summary['number_of_trades']}")
+    print(f"Win Ratio: {aapl_bt.trades_summary['win_ratio(%)']}%")
+    print(f"Average Result: {aapl_bt.trades_summary['average_res(%)']}%")
+    print(f"Cumulative Result: {aapl_bt.trades_summary['cumulative_result']}")
+
+    # Trade-ek megtekintése
+    print("\nTrade details:")
+    display(aapl_bt.trades)
+
+    # Teljes összefoglaló
+    aapl_bt.summarize_strategy()
+
+
+    # ============= PÉLDA 2: TESTRESZABOTT PARAMÉTEREKKEL =============
+    print("\n" + "=" * 60)
+    print("PÉLDA 2: Testreszabott paraméterekkel")
+    print("=" * 60)
+
+    # Adat betöltés
+    ticker = 'TSLA'
+    df = get_market_df(ticker)
+
+    # Backtest futtatás testreszabott paraméterekkel
     backtest = Backtest(
         df, 
         sma200_strategy,
-        rsi_threshold=rsi_thresh
+        rsi_period=14,           # RSI periódus
+        rsi_threshold=60,        # RSI küszöb (konzervatívabb: 60 vs 65)
+        sma_long=200,            # Hosszú távú SMA
+        sma_short=50,            # Rövid távú SMA (kilépéshez)
+        slope_period=10,         # SMA200 meredekség ellenőrzési periódus
+        breakout_period=20,      # Breakout periódus
+        atr_period=14,           # ATR periódus
+        atr_multiplier_body=1.0, # Minimális gyertya test méret (ATR egységben)
+        atr_multiplier_stop=2.5, # Stop loss távolság (ATR egységben) - konzervatívabb
+        atr_multiplier_trail=2.0,# Trailing stop távolság (ATR egységben)
+        max_rise_period=20,      # Parabolikus mozgás ellenőrzési periódus
+        max_rise_percent=12.0    # Maximum emelkedés % (konzervatívabb: 12 vs 15)
     )
-    
-    optimization_results.append({
-        'rsi_threshold': rsi_thresh,
-        'trades': backtest.trades_summary['number_of_trades'],
-        'win_ratio': backtest.trades_summary['win_ratio(%)'],
-        'avg_result': backtest.trades_summary['average_res(%)'],
-        'cumulative': backtest.trades_summary['cumulative_result']
-    })
-
-opt_df = pd.DataFrame(optimization_results)
-print(f"\nRSI küszöb optimalizáció eredményei ({ticker}):")
-display(opt_df)
-
-# Legjobb paraméter
-best_row = opt_df.loc[opt_df['avg_result'].idxmax()]
-print(f"\nLegjobb RSI küszöb: {best_row['rsi_threshold']}")
-print(f"Átlagos eredmény: {best_row['avg_result']}%")
-print(f"Win ratio: {best_row['win_ratio']}%")
-
-
-# ============= PÉLDA 6: RÉSZLETES TRADE ELEMZÉS =============
-print("\n" + "=" * 60)
-print("PÉLDA 6: Részletes trade elemzés")
-print("=" * 60)
-
-ticker = 'AAPL'
-data = MarketData(ticker)
-df = data.df
-
-backtest = Backtest(df, sma200_strategy)
-trades = backtest.trades
-
-if not trades.empty:
-    # Nyerő és vesztes trade-ek
-    winning_trades = trades[trades['result'] > 1]
-    losing_trades = trades[trades['result'] <= 1]
-    
-    print(f"\nTeljes trade-ek: {len(trades)}")
-    print(f"Nyerő trade-ek: {len(winning_trades)}")
-    print(f"Vesztes trade-ek: {len(losing_trades)}")
-    
-    # Kilépési okok elemzése
-    if 'exit_reason' in trades.columns:
-        exit_reasons = trades['exit_reason'].value_counts()
-        print("\nKilépési okok eloszlása:")
-        display(exit_reasons)
-    
-    # Legnyereségesebb trade-ek
-    print("\nTop 5 legnyereségesebb trade:")
-    top_trades = trades.nlargest(5, 'result')[['buy_date', 'sell_date', 
-                                                'buy_price', 'sell_price', 
-                                                'result', 'days_in_trade']]
-    display(top_trades)
-    
-    # Trade időtartamok
-    print(f"\nÁtlagos trade időtartam: {trades['days_in_trade'].mean():.1f} nap")
-    print(f"Medián trade időtartam: {trades['days_in_trade'].median():.1f} nap")
-    print(f"Leghosszabb trade: {trades['days_in_trade'].max()} nap")
-    print(f"Legrövidebb trade: {trades['days_in_trade'].min()} nap")
-else:
-    print("Nincsenek trade-ek ebben az időszakban.")
+
+    print(f"\nTicker: {ticker}")
+    print(f"Trades: {backtest.trades_summary['number_of_trades']}")
+    print(f"Win Ratio: {backtest.trades_summary['win_ratio(%)']}%")
+    print(f"Average Result: {backtest.trades_summary['average_res(%)']}%")
+
+    # Teljes összefoglaló
+    backtest.summarize_strategy()
+
+
+    # ============= PÉLDA 3: VIZUALIZÁCIÓ SHOW_INDICATOR FÜGGVÉNNYEL =============
+    print("\n" + "=" * 60)
+    print("PÉLDA 3: Vizualizáció show_indicator függvénnyel")
+    print("=" * 60)
+
+    # Alapértelmezett vizualizáció
+    fig = show_indicator_sma200_strategy('NVDA')
+    fig.show()
+
+    # Testreszabott vizualizáció
+    fig = show_indicator_sma200_strategy(
+        'MSFT',
+        rsi_threshold=70,        # Enyhébb RSI szűrő
+        ndays=500,               # Csak az utolsó 500 nap
+        plot_height=1400,        # Magasabb ábra
+        use_tradingview_title=False
+    )
+    fig.show()
+
+
+    # ============= PÉLDA 4: TÖBB TICKER TESZTELÉSE =============
+    print("\n" + "=" * 60)
+    print("PÉLDA 4: Több ticker összehasonlítása")
+    print("=" * 60)
+
+    tickers = ['AAPL', 'MSFT', 'GOOGL', 'NVDA', 'TSLA', 'META', 'AMZN']
+    results = []
+
+    # Letöltés egyszerre, szálakon (I/O), majd a backtestek párhuzamosan, processzekben (CPU)
+    dfs = get_market_dfs(tickers)
+
+    with ProcessPoolExecutor() as executor:
+        futures = {executor.submit(_bt_ticker, ticker, df): ticker for ticker, df in dfs.items()}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results.append(future.result())
+                print(f"Tested {ticker}")
+            except Exception as e:
+                print(f"Error with {ticker}: {e}")
+
+    # Eredmények összehasonlítása
+    results_df = pd.DataFrame.from_records(results, columns=TICKER_COLUMNS)
+    results_df = results_df.sort_values('avg_result', ascending=False)
+    print("\nÖsszehasonlító eredmények (átlagos eredmény szerint rendezve):")
+    display(results_df)
+
+
+    # ============= PÉLDA 5: PARAMÉTER OPTIMALIZÁCIÓ =============
+    print("\n" + "=" * 60)
+    print("PÉLDA 5: Egyszerű paraméter optimalizáció")
+    print("=" * 60)
+
+    ticker = 'AAPL'
+    # Az indikátorok egyszer számolódnak, a küszöbök csak az összehasonlítást változtatják
+    df = add_sma200_indicators(aapl_df)
+
+    # Különböző RSI küszöbök tesztelése párhuzamosan
+    # Az adat egyszer kerül megosztott memóriába, a workerek csak a nevét és alakját kapják meg
+    rsi_thresholds = [55, 60, 65, 70, 75]
+
+    shm, shm_args = _share_df(df)
+    try:
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=shm_args) as executor:
+            optimization_results = list(executor.map(_bt_param, rsi_thresholds))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    opt_df = pd.DataFrame.from_records(optimization_results, columns=PARAM_COLUMNS)
+    print(f"\nRSI küszöb optimalizáció eredményei ({ticker}):")
+    display(opt_df)
+
+    # Legjobb paraméter
+    best_row = opt_df.loc[opt_df['avg_result'].idxmax()]
+    print(f"\nLegjobb RSI küszöb: {best_row['rsi_threshold']}")
+    print(f"Átlagos eredmény: {best_row['avg_result']}%")
+    print(f"Win ratio: {best_row['win_ratio']}%")
+
+
+    # ============= PÉLDA 6: RÉSZLETES TRADE ELEMZÉS =============
+    print("\n" + "=" * 60)
+    print("PÉLDA 6: Részletes trade elemzés")
+    print("=" * 60)
+
+    # Ugyanaz a backtest, mint a PÉLDA 1-ben, nem kell újra futtatni
+    trades = aapl_bt.trades.copy()
+
+    if not trades.empty:
+        # Nyerő és vesztes trade-ek
+        winning_trades = trades[trades['result'] > 1]
+        losing_trades = trades[trades['result'] <= 1]
+        
+        print(f"\nTeljes trade-ek: {len(trades)}")
+        print(f"Nyerő trade-ek: {len(winning_trades)}")
+        print(f"Vesztes trade-ek: {len(losing_trades)}")
+        
+        # Kilépési okok elemzése
+        if 'exit_reason' in trades.columns:
+            exit_reasons = trades['exit_reason'].value_counts()
+            print("\nKilépési okok eloszlása:")
+            display(exit_reasons)
+        
+        # Legnyereségesebb trade-ek
+        print("\nTop 5 legnyereségesebb trade:")
+        top_trades = trades.nlargest(5, 'result')[['buy_date', 'sell_date', 
+                                                    'buy_price', 'sell_price', 
+                                                    'result', 'days_in_trade']]
+        print(top_trades.to_string(index=False, formatters={
+            'buy_price': '${:.2f}'.format,
+            'sell_price': '${:.2f}'.format,
+            'result': lambda x: f"{(x - 1) * 100:.2f}%",
+            'days_in_trade': '{:d}'.format
+        }))
+        
+        # Trade időtartamok
+        print(f"\nÁtlagos trade időtartam: {trades['days_in_trade'].mean():.1f} nap")
+        print(f"Medián trade időtartam: {trades['days_in_trade'].median():.1f} nap")
+        print(f"Leghosszabb trade: {trades['days_in_trade'].max()} nap")
+        print(f"Legrövidebb trade: {trades['days_in_trade'].min()} nap")
+    else:
+        print("Nincsenek trade-ek ebben az időszakban.")
+
+    print("\n" + "=" * 60)
+    print("Demo befejezve!")
+    print("=" * 60)
 
 
 # ============= MEGJEGYZÉSEK ÉS TIPPEK =============
@@ -260,6 +311,7 @@ BACKTEST VALIDÁCIÓ:
 - A múltbeli teljesítmény nem garancia a jövőre!
 """
 
-print("\n" + "=" * 60)
-print("Demo befejezve!")
-print("=" * 60)
+# A ProcessPoolExecutor workerei spawn indításnál (macOS, Windows) újraimportálják ezt a fájlt,
+# ezért a példák csak közvetlen futtatáskor indulnak el
+if __name__ == "__main__":
+    main()
@@ -144,7 +144,7 @@ print(f"Tickers: {tickers}")
 
 print("\n4.3 Group by sector:")
 sector_counts = df['GICS Sector'].value_counts()
-print(sector_counts)
+print(sector_counts.to_string(header=False))
 
 print("\n4.4 Export to CSV (optional):")
 # df.to_csv('sp500_filtered.csv', index=False)
@@ -57,8 +57,7 @@ print(f"Hozzáadás után: {len(tv_data.eu_stock)} részvény összesen")
 print("\nVégső európai részvény megoszlás:")
 if not tv_data.eu_stock.empty:
     region_counts = tv_data.eu_stock['region'].value_counts()
-    for region, count in region_counts.items():
-        print(f"  {region}: {count} részvény")
+    print(region_counts.to_string(header=False))
 print()
 
 # ============= EGYEDI INFORMÁCIÓK =============
@@ -92,8 +91,8 @@ if not top_stocks.empty:
     tech_stocks = top_stocks[top_stocks['sector'] == 'Electronic Technology'].head(3)
     if not tech_stocks.empty:
         print("\nElectronic Technology top 3:")
-        for _, row in tech_stocks.iterrows():
-            print(f"  {row['name']}: ${tv_data.moneystring(row['market_cap_basic'])}")
+        tech_stocks = tech_stocks.assign(money_str=tv_data.moneystring_vec(tech_stocks['market_cap_basic']))
+        print(tech_stocks[['name', 'money_str']].to_string(index=False, header=False))
 
 # ============= SEGÉDFÜGGVÉNYEK =============
 
@@ -145,30 +144,28 @@ print("DATAFRAME STATISZTIKÁK:")
 # Amerikai részvények
 if not tv_data.us_stock.empty:
     print(f"\nAmerikai részvények top 5 piaci kap szerint:")
-    top5 = tv_data.us_stock.nlargest(5, 'market_cap_basic')[['name', 'market_cap_basic', 'sector']]
-    for _, row in top5.iterrows():
-        print(f"  {row['name']}: ${tv_data.moneystring(row['market_cap_basic'])} ({row['sector']})")
+    top5 = tv_data.top_k(tv_data.us_stock, 5, 'market_cap_basic')[['name', 'market_cap_basic', 'sector']]
+    top5 = top5.assign(money_str=tv_data.moneystring_vec(top5['market_cap_basic']))
+    print(top5[['name', 'money_str', 'sector']].to_string(index=False, header=False))
 
 # Európai részvények régiónként
 if not tv_data.eu_stock.empty:
     print(f"\nEurópai részvények régiónként:")
     region_counts = tv_data.eu_stock['region'].value_counts()
-    for region, count in region_counts.items():
-        print(f"  {region}: {count} részvény")
+    print(region_counts.to_string(header=False))
 
 # Kriptók top 5
 if not tv_data.crypto.empty:
     print(f"\nTop 5 kriptovaluta:")
     top5_crypto = tv_data.crypto.head(5)[['base_currency', 'market_cap_calc']]
-    for _, row in top5_crypto.iterrows():
-        print(f"  {row['base_currency']}: ${tv_data.moneystring(row['market_cap_calc'])}")
+    top5_crypto = top5_crypto.assign(money_str=tv_data.moneystring_vec(top5_crypto['market_cap_calc']))
+    print(top5_crypto[['base_currency', 'money_str']].to_string(index=False, header=False))
 
 # Amerikai ETF-ek fókusz szerint
 if not tv_data.us_etf.empty:
     print(f"\nAmerikai ETF-ek fókusz szerint (top 5 kategória):")
     focus_counts = tv_data.us_etf['focus.tr'].value_counts().head(5)
-    for focus, count in focus_counts.items():
-        print(f"  {focus}: {count} ETF")
+    print(focus_counts.to_string(header=False))
 
 print("\n" + "="*50)
 print("PÉLDA FUTTATÁS VÉGE")
@@ -19,29 +19,34 @@ setup(
         "Intended Audience :: Financial and Insurance Industry",
         "Topic :: Office/Business :: Financial :: Investment",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
-        "pandas>=1.3.0",
-        "numpy>=1.19.0",
-        "plotly>=5.0.0",
+        "pandas>=2.0.0",
+        "numpy>=1.23.0",
+        "plotly>=5.18.0",
         "requests>=2.26.0",
         "cloudscraper>=1.2.58",
         "pandas-ta>=0.3.14b0",
-        "scipy>=1.7.0",
+        "scipy>=1.10.0",
     ],
     extras_require={
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
+            "pytest-xdist>=2.0",
             "black>=21.0",
             "flake8>=3.9",
         ],
+        "fast": [
+            "orjson>=3.6",
+            "TA-Lib>=0.6",
+        ],
     },
 )
@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: make the package importable from a source checkout
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
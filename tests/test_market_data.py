@@ -0,0 +1,61 @@
+"""
+Offline unit tests for the get_market_df cache (no network access needed)
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from tradingsuite.data import market_data
+from tradingsuite.data.market_data import get_market_df, clear_market_cache, smma
+
+
+def test_market_cache_expires_and_clears(tmp_path, monkeypatch):
+    """Both cache tiers expire with the interval TTL, clear_market_cache drops them"""
+    monkeypatch.setattr(market_data, 'MARKET_CACHE_DIR', str(tmp_path))
+    clear_market_cache(disk=False)
+    downloads = []
+    
+    class FakeMarketData:
+        def __init__(self, ticker, range='18y', interval='1d'):
+            downloads.append(ticker)
+            self.df = pd.DataFrame({'close': [float(len(downloads))]})
+    
+    monkeypatch.setattr(market_data, 'MarketData', FakeMarketData)
+    
+    assert get_market_df('TEST', '1mo', '1h')['close'].iloc[0] == 1
+    assert get_market_df('TEST', '1mo', '1h')['close'].iloc[0] == 1
+    assert os.listdir(tmp_path) == ['TEST_1mo_1h.pkl']  # no temp file left behind
+    
+    # A new session (empty memory tier) reads the fresh pickle
+    clear_market_cache(disk=False)
+    assert get_market_df('TEST', '1mo', '1h')['close'].iloc[0] == 1
+    
+    # After the 1h intraday TTL the in-memory copy is not served any more
+    stale = time.time() - 2 * 3600
+    key = ('TEST', '1mo', '1h')
+    market_data._market_cache[key] = (stale, market_data._market_cache[key][1])
+    os.utime(tmp_path / 'TEST_1mo_1h.pkl', (stale, stale))
+    assert get_market_df('TEST', '1mo', '1h')['close'].iloc[0] == 2
+    
+    clear_market_cache()
+    assert os.listdir(tmp_path) == []
+    assert get_market_df('TEST', '1mo', '1h')['close'].iloc[0] == 3
+    clear_market_cache(disk=False)
+
+
+def test_smma_matches_wilder_recurrence_and_skips_nan():
+    """smma equals the Python SMMA loop on clean data, a NaN does not poison the rest of the series"""
+    hl2 = np.random.default_rng(0).normal(100, 5, 500)
+    expected = [hl2[0]]
+    for value in hl2[1:]:
+        expected.append((expected[-1] * (15 - 1) + value) / 15)
+    np.testing.assert_allclose(smma(pd.Series(hl2), 15).to_numpy(), expected, rtol=1e-12)
+    
+    result = smma(pd.Series([np.nan, 1.0, 2.0, np.nan, 4.0]), 2)
+    assert np.isnan(result.iloc[0])  # leading NaN stays, seeded with the first valid value
+    assert result.iloc[1] == 1.0 and result.iloc[2] == 1.5
+    assert result.iloc[3] == 1.5  # NaN bar repeats the previous value
+    assert result.iloc[4] == 1.5 * 0.5 ** 2 + 4.0 * (1 - 0.5 ** 2)  # old value decayed over the gap
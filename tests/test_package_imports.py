@@ -0,0 +1,22 @@
+"""
+Offline tests for the lazy package-level exports (PEP 562 __getattr__)
+"""
+
+import pytest
+
+import tradingsuite
+
+
+def test_subpackages_resolve_as_attributes():
+    """`import tradingsuite; tradingsuite.data` works without importing the subpackage first"""
+    assert tradingsuite.data.__name__ == 'tradingsuite.data'
+    assert tradingsuite.data.tradingview_data.__name__ == 'tradingsuite.data.tradingview_data'
+    with pytest.raises(AttributeError):
+        tradingsuite.no_such_name
+
+
+def test_dir_lists_resolved_names_once():
+    tradingsuite.data.TradingViewData
+    names = dir(tradingsuite.data)
+    assert names.count('TradingViewData') == 1
+    assert set(tradingsuite.data.__all__) <= set(names)
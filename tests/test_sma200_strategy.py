@@ -1,17 +1,11 @@
 """
-Quick test script for SMA200 Strategy
-Run this to verify the strategy works correctly
+Integration tests for SMA200 Strategy (downloads market data)
+Run with pytest; the tests are independent, so pytest -n auto --dist=loadfile runs them in parallel
 """
 
-import sys
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# Add the tradingsuite to path
-sys.path.insert(0, '/tmp/TradingSuite-main')
-
-from tradingsuite.data.market_data import MarketData
+from tradingsuite.data.market_data import get_market_df, get_market_dfs
 from tradingsuite.analysis.backtest import Backtest
 from tradingsuite.strategies.sma200 import sma200_strategy, show_indicator_sma200_strategy
 
@@ -21,39 +15,30 @@ def test_basic_functionality():
     print("TEST 1: Basic Functionality Test (AAPL)")
     print("=" * 60)
     
-    try:
-        # Load data
-        print("Loading AAPL data...")
-        data = MarketData('AAPL')
-        df = data.df
-        print(f"✓ Data loaded: {len(df)} rows")
-        
-        # Run backtest
-        print("Running backtest with default parameters...")
-        backtest = Backtest(df, sma200_strategy)
-        print(f"✓ Backtest completed")
-        
-        # Check results
-        trades = backtest.trades
-        print(f"✓ Trades generated: {len(trades)}")
-        
-        if len(trades) > 0:
-            print(f"✓ First trade date: {trades['buy_date'].iloc[0]}")
-            print(f"✓ Last trade date: {trades['sell_date'].iloc[-1]}")
-            print(f"✓ Win ratio: {backtest.trades_summary['win_ratio(%)']}%")
-            print(f"✓ Average result: {backtest.trades_summary['average_res(%)']}%")
-            print(f"✓ Cumulative result: {backtest.trades_summary['cumulative_result']}")
-        else:
-            print("⚠ No trades generated (this might be expected with conservative parameters)")
-        
-        print("\n✓ TEST 1 PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"\n✗ TEST 1 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Load data
+    print("Loading AAPL data...")
+    df = get_market_df('AAPL')
+    print(f"✓ Data loaded: {len(df)} rows")
+    
+    # Run backtest
+    print("Running backtest with default parameters...")
+    backtest = Backtest(df, sma200_strategy)
+    print(f"✓ Backtest completed")
+    
+    # Check results
+    trades = backtest.trades
+    print(f"✓ Trades generated: {len(trades)}")
+    
+    if len(trades) > 0:
+        print(f"✓ First trade date: {trades['buy_date'].iloc[0]}")
+        print(f"✓ Last trade date: {trades['sell_date'].iloc[-1]}")
+        print(f"✓ Win ratio: {backtest.trades_summary['win_ratio(%)']}%")
+        print(f"✓ Average result: {backtest.trades_summary['average_res(%)']}%")
+        print(f"✓ Cumulative result: {backtest.trades_summary['cumulative_result']}")
+    else:
+        print("⚠ No trades generated (this might be expected with conservative parameters)")
+    
+    print("\n✓ TEST 1 PASSED")
 
 
 def test_custom_parameters():
@@ -62,43 +47,34 @@ def test_custom_parameters():
     print("TEST 2: Custom Parameters Test")
     print("=" * 60)
     
-    try:
-        data = MarketData('MSFT')
-        df = data.df
-        print(f"✓ Data loaded: {len(df)} rows")
-        
-        # Run with custom parameters
-        print("Running backtest with custom parameters...")
-        backtest = Backtest(
-            df,
-            sma200_strategy,
-            rsi_threshold=70,
-            atr_multiplier_stop=2.5,
-            max_rise_percent=20.0
-        )
-        print(f"✓ Backtest completed with custom params")
-        
-        trades = backtest.trades
-        print(f"✓ Trades generated: {len(trades)}")
-        
-        if len(trades) > 0:
-            # Check if exit_reason column exists
-            if 'exit_reason' in trades.columns:
-                exit_reasons = trades['exit_reason'].value_counts()
-                print(f"✓ Exit reasons: {dict(exit_reasons)}")
-            
-            # Check if stop_loss column exists
-            if 'stop_loss' in trades.columns:
-                print(f"✓ Stop loss values calculated")
-        
-        print("\n✓ TEST 2 PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"\n✗ TEST 2 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    df = get_market_df('MSFT')
+    print(f"✓ Data loaded: {len(df)} rows")
+    
+    # Run with custom parameters
+    print("Running backtest with custom parameters...")
+    backtest = Backtest(
+        df,
+        sma200_strategy,
+        rsi_threshold=70,
+        atr_multiplier_stop=2.5,
+        max_rise_percent=20.0
+    )
+    print(f"✓ Backtest completed with custom params")
+    
+    trades = backtest.trades
+    print(f"✓ Trades generated: {len(trades)}")
+    
+    if len(trades) > 0:
+        # Check if exit_reason column exists
+        if 'exit_reason' in trades.columns:
+            exit_reasons = trades['exit_reason'].value_counts()
+            print(f"✓ Exit reasons: {dict(exit_reasons)}")
+        
+        # Check if stop_loss column exists
+        if 'stop_loss' in trades.columns:
+            print(f"✓ Stop loss values calculated")
+    
+    print("\n✓ TEST 2 PASSED")
 
 
 def test_visualization():
@@ -107,25 +83,22 @@ def test_visualization():
     print("TEST 3: Visualization Test")
     print("=" * 60)
     
-    try:
-        print("Generating visualization for NVDA...")
-        fig = show_indicator_sma200_strategy(
-            'NVDA',
-            ndays=200,
-            plot_height=1000,
-            add_strategy_summary=True
-        )
-        print("✓ Visualization generated successfully")
-        print(f"✓ Figure type: {type(fig)}")
-        
-        print("\n✓ TEST 3 PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"\n✗ TEST 3 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    print("Generating visualization for NVDA...")
+    fig = show_indicator_sma200_strategy(
+        'NVDA',
+        ndays=200,
+        plot_height=1000,
+        add_strategy_summary=True
+    )
+    print("✓ Visualization generated successfully")
+    print(f"✓ Figure type: {type(fig)}")
+    
+    print("\n✓ TEST 3 PASSED")
+
+
+def _run_bt(df):
+    """Backtest one ticker (runs in a worker process, so it must be module level)"""
+    return Backtest(df, sma200_strategy).trades_summary
 
 
 def test_multiple_tickers():
@@ -135,38 +108,25 @@ def test_multiple_tickers():
     print("=" * 60)
     
     tickers = ['AAPL', 'MSFT', 'GOOGL']
-    results = []
-    
-    try:
-        for ticker in tickers:
-            print(f"Testing {ticker}...")
-            data = MarketData(ticker)
-            df = data.df
-            backtest = Backtest(df, sma200_strategy)
-            
-            results.append({
-                'ticker': ticker,
-                'trades': len(backtest.trades),
-                'win_ratio': backtest.trades_summary['win_ratio(%)'],
-                'avg_result': backtest.trades_summary['average_res(%)']
-            })
-            print(f"  ✓ {ticker}: {len(backtest.trades)} trades")
-        
-        print("\n✓ All tickers processed")
-        print("\nSummary:")
-        for r in results:
-            print(f"  {r['ticker']}: {r['trades']} trades, "
-                  f"{r['win_ratio']}% win ratio, "
-                  f"{r['avg_result']}% avg result")
-        
-        print("\n✓ TEST 4 PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"\n✗ TEST 4 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    # Downloads on threads (I/O), backtests on processes (CPU)
+    print(f"Loading {', '.join(tickers)}...")
+    dfs = get_market_dfs(tickers)
+    assert list(dfs) == tickers
+    
+    with ProcessPoolExecutor() as executor:
+        futures = {executor.submit(_run_bt, df): ticker for ticker, df in dfs.items()}
+        summaries = {futures[future]: future.result() for future in as_completed(futures)}
+    
+    print("\n✓ All tickers processed")
+    print("\nSummary:")
+    for ticker in tickers:
+        summary = summaries[ticker]
+        print(f"  {ticker}: {summary['number_of_trades']} trades, "
+              f"{summary['win_ratio(%)']}% win ratio, "
+              f"{summary['average_res(%)']}% avg result")
+    
+    print("\n✓ TEST 4 PASSED")
 
 
 def test_edge_cases():
@@ -175,80 +135,28 @@ def test_edge_cases():
     print("TEST 5: Edge Cases Test")
     print("=" * 60)
     
-    try:
-        # Test with very restrictive parameters (should produce few/no trades)
-        print("Testing with very restrictive parameters...")
-        data = MarketData('AAPL')
-        df = data.df
-        
-        backtest = Backtest(
-            df,
-            sma200_strategy,
-            rsi_threshold=30,  # Very restrictive
-            max_rise_percent=5.0  # Very restrictive
-        )
-        
-        print(f"✓ Restrictive params: {len(backtest.trades)} trades generated")
-        
-        # Test with very permissive parameters
-        print("Testing with permissive parameters...")
-        backtest = Backtest(
-            df,
-            sma200_strategy,
-            rsi_threshold=85,  # Very permissive
-            max_rise_percent=30.0  # Very permissive
-        )
-        
-        print(f"✓ Permissive params: {len(backtest.trades)} trades generated")
-        
-        print("\n✓ TEST 5 PASSED")
-        return True
-        
-    except Exception as e:
-        print(f"\n✗ TEST 5 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def main():
-    """Run all tests"""
-    print("\n" + "=" * 60)
-    print("SMA200 STRATEGY - TEST SUITE")
-    print("=" * 60)
-    print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    
-    tests = [
-        test_basic_functionality,
-        test_custom_parameters,
-        test_visualization,
-        test_multiple_tickers,
-        test_edge_cases
-    ]
+    # Test with very restrictive parameters (should produce few/no trades)
+    print("Testing with very restrictive parameters...")
+    df = get_market_df('AAPL')
     
-    results = []
-    for test in tests:
-        results.append(test())
+    backtest = Backtest(
+        df,
+        sma200_strategy,
+        rsi_threshold=30,  # Very restrictive
+        max_rise_percent=5.0  # Very restrictive
+    )
     
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"Total tests: {len(results)}")
-    print(f"Passed: {sum(results)}")
-    print(f"Failed: {len(results) - sum(results)}")
+    print(f"✓ Restrictive params: {len(backtest.trades)} trades generated")
     
-    if all(results):
-        print("\n✓✓✓ ALL TESTS PASSED ✓✓✓")
-    else:
-        print("\n✗✗✗ SOME TESTS FAILED ✗✗✗")
+    # Test with very permissive parameters
+    print("Testing with permissive parameters...")
+    backtest = Backtest(
+        df,
+        sma200_strategy,
+        rsi_threshold=85,  # Very permissive
+        max_rise_percent=30.0  # Very permissive
+    )
     
-    print(f"\nTest finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 60)
+    print(f"✓ Permissive params: {len(backtest.trades)} trades generated")
     
-    return all(results)
-
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    print("\n✓ TEST 5 PASSED")
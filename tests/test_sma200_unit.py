@@ -1,37 +1,46 @@
 """
 Unit test for SMA200 Strategy with mock data
-This doesn't require internet connection
+This doesn't require internet connection, run with pytest
 """
 
-import sys
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Add the tradingsuite to path
-sys.path.insert(0, '/tmp/TradingSuite-main')
+from tradingsuite.strategies.sma200 import sma200_strategy, add_sma200_indicators, sma200_strategy_batch
 
-from tradingsuite.strategies.sma200 import sma200_strategy
 
+# Generated price arrays per (days, seed); every call builds a fresh DataFrame from them
+_mock_arrays = {}
 
-def create_mock_data(days=500):
-    """Create mock data for testing"""
-    dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
+
+def _mock_prices(days, seed):
+    """Seeded OHLCV arrays for create_mock_data"""
+    rng = np.random.default_rng(seed)
+    
+    # All random values in one draw: close noise, high/low wicks, open offset
+    noise = rng.standard_normal((4, days))
     
-    # Create a trending upward price series with some volatility
+    # Create a trending upward price series with some volatility, kept positive
     base_price = 100
-    trend = np.linspace(0, 50, days)  # Upward trend
-    noise = np.random.normal(0, 2, days)  # Some volatility
+    close_prices = np.maximum(base_price + np.linspace(0, 50, days) + 2.0 * noise[0], 50, out=noise[0])
     
-    close_prices = base_price + trend + noise
-    close_prices = np.maximum(close_prices, 50)  # Keep prices positive
+    # Create OHLC data (the remaining noise rows are reused as output buffers)
+    high_prices = np.add(close_prices, np.abs(noise[1], out=noise[1]), out=noise[1])
+    low_prices = np.subtract(close_prices, np.abs(noise[2], out=noise[2]), out=noise[2])
+    open_prices = close_prices + 0.5 * noise[3]
     
-    # Create OHLC data
-    high_prices = close_prices + np.abs(np.random.normal(0, 1, days))
-    low_prices = close_prices - np.abs(np.random.normal(0, 1, days))
-    open_prices = close_prices + np.random.normal(0, 0.5, days)
+    volumes = rng.integers(1_000_000, 10_000_000, days, dtype=np.int64)
+    return open_prices, high_prices, low_prices, close_prices, volumes
+
+
+def create_mock_data(days=500, seed=0):
+    """Create mock data for testing (same seed -> same prices)"""
+    dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     
-    volumes = np.random.randint(1000000, 10000000, days)
+    if (days, seed) not in _mock_arrays:
+        _mock_arrays[(days, seed)] = _mock_prices(days, seed)
+    open_prices, high_prices, low_prices, close_prices, volumes = _mock_arrays[(days, seed)]
     
     df = pd.DataFrame({
         'date': dates,
@@ -52,106 +61,82 @@ def test_strategy_with_mock_data():
     print("UNIT TEST: SMA200 Strategy with Mock Data")
     print("=" * 60)
     
-    try:
-        # Create mock data
-        print("\n1. Creating mock data...")
-        df = create_mock_data(days=500)
-        print(f"✓ Mock data created: {len(df)} rows")
-        print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
-        print(f"  Price range: ${df['close'].min():.2f} to ${df['close'].max():.2f}")
-        
-        # Test strategy execution
-        print("\n2. Running strategy with default parameters...")
-        trades = sma200_strategy(df)
-        print(f"✓ Strategy executed successfully")
-        print(f"✓ Trades generated: {len(trades)}")
-        
-        # Check trade structure
-        print("\n3. Checking trade structure...")
-        expected_columns = ['result', 'buy_price', 'sell_price', 'buy_date', 
-                          'sell_date', 'days_in_trade']
-        
-        for col in expected_columns:
-            if col in trades.columns:
-                print(f"✓ Column '{col}' present")
-            else:
-                print(f"✗ Column '{col}' MISSING")
-                return False
-        
-        # Check trade values if any trades exist
-        if len(trades) > 0:
-            print("\n4. Checking trade values...")
-            
-            # Check result values
-            if all(trades['result'] > 0):
-                print(f"✓ All result values are positive")
-            else:
-                print(f"✗ Some result values are negative or zero")
-            
-            # Check dates
-            if all(trades['sell_date'] >= trades['buy_date']):
-                print(f"✓ All sell dates are after buy dates")
-            else:
-                print(f"✗ Some sell dates are before buy dates")
-            
-            # Check prices
-            if all(trades['buy_price'] > 0) and all(trades['sell_price'] > 0):
-                print(f"✓ All prices are positive")
-            else:
-                print(f"✗ Some prices are negative or zero")
-            
-            # Check days in trade
-            if all(trades['days_in_trade'] >= 0):
-                print(f"✓ All days_in_trade values are non-negative")
-            else:
-                print(f"✗ Some days_in_trade values are negative")
-            
-            # Display first trade
-            print("\n5. First trade example:")
-            first_trade = trades.iloc[0]
-            print(f"  Buy date: {first_trade['buy_date']}")
-            print(f"  Sell date: {first_trade['sell_date']}")
-            print(f"  Buy price: ${first_trade['buy_price']:.2f}")
-            print(f"  Sell price: ${first_trade['sell_price']:.2f}")
-            print(f"  Result: {(first_trade['result']-1)*100:.2f}%")
-            print(f"  Days in trade: {first_trade['days_in_trade']}")
-            if 'exit_reason' in first_trade:
-                print(f"  Exit reason: {first_trade['exit_reason']}")
-        
-        else:
-            print("\n4. No trades generated (this might be expected with mock data)")
-        
-        # Test with custom parameters
-        print("\n6. Testing with custom parameters...")
-        trades_custom = sma200_strategy(
-            df,
-            rsi_threshold=70,
-            atr_multiplier_stop=2.5,
-            max_rise_percent=20.0
-        )
-        print(f"✓ Custom parameters test passed")
-        print(f"  Trades with custom params: {len(trades_custom)}")
-        
-        # Test with very restrictive parameters
-        print("\n7. Testing with restrictive parameters...")
-        trades_restrictive = sma200_strategy(
-            df,
-            rsi_threshold=30,
-            max_rise_percent=5.0
-        )
-        print(f"✓ Restrictive parameters test passed")
-        print(f"  Trades with restrictive params: {len(trades_restrictive)}")
-        
-        print("\n" + "=" * 60)
-        print("✓✓✓ ALL UNIT TESTS PASSED ✓✓✓")
-        print("=" * 60)
-        return True
-        
-    except Exception as e:
-        print(f"\n✗ UNIT TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Create mock data
+    print("\n1. Creating mock data...")
+    df = create_mock_data(days=500)
+    print(f"✓ Mock data created: {len(df)} rows")
+    print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
+    print(f"  Price range: ${df['close'].min():.2f} to ${df['close'].max():.2f}")
+    
+    # Test strategy execution
+    print("\n2. Running strategy with default parameters...")
+    trades = sma200_strategy(df)
+    print(f"✓ Strategy executed successfully")
+    print(f"✓ Trades generated: {len(trades)}")
+    
+    # Check trade structure
+    print("\n3. Checking trade structure...")
+    expected_columns = ['result', 'buy_price', 'sell_price', 'buy_date', 
+                      'sell_date', 'days_in_trade']
+    
+    for col in expected_columns:
+        assert col in trades.columns, f"Column '{col}' MISSING"
+        print(f"✓ Column '{col}' present")
+    
+    # Check trade values; the default filters rarely trigger on mock data, so relax them
+    print("\n4. Checking trade values...")
+    trades = sma200_strategy(df, rsi_threshold=100, max_rise_percent=1000, atr_multiplier_body=0)
+    assert len(trades) > 0, "No trades generated with relaxed parameters"
+    
+    assert (trades['result'] > 0).all(), "Some result values are negative or zero"
+    print(f"✓ All result values are positive")
+    
+    assert (trades['sell_date'] >= trades['buy_date']).all(), "Some sell dates are before buy dates"
+    print(f"✓ All sell dates are after buy dates")
+    
+    assert (trades['buy_price'] > 0).all() and (trades['sell_price'] > 0).all(), \
+        "Some prices are negative or zero"
+    print(f"✓ All prices are positive")
+    
+    assert (trades['days_in_trade'] >= 0).all(), "Some days_in_trade values are negative"
+    print(f"✓ All days_in_trade values are non-negative")
+    
+    # Display first trade
+    print("\n5. First trade example:")
+    first_trade = trades.iloc[0]
+    print(f"  Buy date: {first_trade['buy_date']}")
+    print(f"  Sell date: {first_trade['sell_date']}")
+    print(f"  Buy price: ${first_trade['buy_price']:.2f}")
+    print(f"  Sell price: ${first_trade['sell_price']:.2f}")
+    print(f"  Result: {(first_trade['result']-1)*100:.2f}%")
+    print(f"  Days in trade: {first_trade['days_in_trade']}")
+    if 'exit_reason' in first_trade:
+        print(f"  Exit reason: {first_trade['exit_reason']}")
+    
+    # Test with custom parameters
+    print("\n6. Testing with custom parameters...")
+    trades_custom = sma200_strategy(
+        df,
+        rsi_threshold=70,
+        atr_multiplier_stop=2.5,
+        max_rise_percent=20.0
+    )
+    print(f"✓ Custom parameters test passed")
+    print(f"  Trades with custom params: {len(trades_custom)}")
+    
+    # Test with very restrictive parameters
+    print("\n7. Testing with restrictive parameters...")
+    trades_restrictive = sma200_strategy(
+        df,
+        rsi_threshold=30,
+        max_rise_percent=5.0
+    )
+    print(f"✓ Restrictive parameters test passed")
+    print(f"  Trades with restrictive params: {len(trades_restrictive)}")
+    
+    print("\n" + "=" * 60)
+    print("✓✓✓ ALL UNIT TESTS PASSED ✓✓✓")
+    print("=" * 60)
 
 
 def test_indicator_calculations():
@@ -160,26 +145,26 @@ def test_indicator_calculations():
     print("UNIT TEST: Indicator Calculations")
     print("=" * 60)
     
-    try:
-        # Create mock data
-        df = create_mock_data(days=300)
-        print("✓ Mock data created")
-        
-        # Run strategy
-        trades = sma200_strategy(df)
-        print("✓ Strategy executed")
-        
-        # The strategy should calculate these internally
-        # We just verify it doesn't crash
-        print("✓ All required indicators calculated successfully")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Indicator test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Create mock data
+    df = create_mock_data(days=300)
+    print("✓ Mock data created")
+    
+    ind = add_sma200_indicators(df)
+    for col in ['rsi', 'sma_200', 'sma_50', 'atr', 'rolling_high',
+                'sma_long_slope', 'price_rise_pct', 'body_size']:
+        assert col in ind.columns, f"Indicator column '{col}' MISSING"
+    assert 'rsi' not in df.columns, "The input DataFrame was modified"
+    
+    close = df['close']
+    np.testing.assert_allclose(ind['sma_200'], close.rolling(200).mean())
+    np.testing.assert_allclose(ind['sma_50'], close.rolling(50).mean())
+    assert ind['rsi'].dropna().between(0, 100).all()
+    assert (ind['atr'].dropna() > 0).all()
+    np.testing.assert_allclose(ind['rolling_high'], df['high'].shift(1).rolling(20).max())
+    assert (ind['sma_long_slope'] == (ind['sma_200'] > ind['sma_200'].shift(10))).all()
+    np.testing.assert_allclose(ind['price_rise_pct'], (close / close.shift(20) - 1) * 100)
+    np.testing.assert_allclose(ind['body_size'], (close - df['open']).abs())
+    print("✓ All required indicators calculated successfully")
 
 
 def test_edge_cases():
@@ -188,74 +173,105 @@ def test_edge_cases():
     print("UNIT TEST: Edge Cases")
     print("=" * 60)
     
-    try:
-        # Test with minimal data
-        print("\n1. Testing with minimal data (250 rows)...")
-        df_small = create_mock_data(days=250)
-        trades = sma200_strategy(df_small)
-        print(f"✓ Minimal data test passed: {len(trades)} trades")
-        
-        # Test with flat market (no trend)
-        print("\n2. Testing with flat market...")
-        df_flat = create_mock_data(days=300)
-        df_flat['close'] = 100 + np.random.normal(0, 1, 300)  # Flat around 100
-        trades = sma200_strategy(df_flat)
-        print(f"✓ Flat market test passed: {len(trades)} trades")
-        
-        # Test with all NaN RSI (edge case)
-        print("\n3. Testing robustness...")
-        df_test = create_mock_data(days=400)
-        trades = sma200_strategy(df_test)
-        print(f"✓ Robustness test passed: {len(trades)} trades")
-        
-        print("\n✓ All edge case tests passed")
-        return True
-        
-    except Exception as e:
-        print(f"✗ Edge case test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test with minimal data
+    print("\n1. Testing with minimal data (250 rows)...")
+    df_small = create_mock_data(days=250, seed=1)
+    trades = sma200_strategy(df_small)
+    print(f"✓ Minimal data test passed: {len(trades)} trades")
+    
+    # Test with flat market (no trend)
+    print("\n2. Testing with flat market...")
+    df_flat = create_mock_data(days=300, seed=2)
+    df_flat['close'] = 100 + np.random.default_rng(2).normal(0, 1, 300)  # Flat around 100
+    trades = sma200_strategy(df_flat)
+    print(f"✓ Flat market test passed: {len(trades)} trades")
+    
+    # Test with all NaN RSI (edge case)
+    print("\n3. Testing robustness...")
+    df_test = create_mock_data(days=400, seed=3)
+    trades = sma200_strategy(df_test)
+    print(f"✓ Robustness test passed: {len(trades)} trades")
+    
+    print("\n✓ All edge case tests passed")
 
 
-def main():
-    """Run all unit tests"""
+def test_precomputed_indicators():
+    """Test that precomputed indicators give the same trades"""
     print("\n" + "=" * 60)
-    print("SMA200 STRATEGY - UNIT TEST SUITE")
+    print("UNIT TEST: Precomputed Indicators")
     print("=" * 60)
-    print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
-    tests = [
-        test_strategy_with_mock_data,
-        test_indicator_calculations,
-        test_edge_cases
-    ]
+    df = create_mock_data(days=500)
+    df_ind = add_sma200_indicators(df)
+    print("✓ Indicators precomputed")
+    
+    for rsi_thresh in [55, 65, 75]:
+        trades = sma200_strategy(df, rsi_threshold=rsi_thresh)
+        trades_ind = sma200_strategy(df_ind, rsi_threshold=rsi_thresh)
+        assert trades.equals(trades_ind), f"Trades differ for rsi_threshold={rsi_thresh}"
+    print("✓ Same trades with precomputed indicators")
+    
+    # Different indicator parameters must not reuse the precomputed columns
+    trades = sma200_strategy(df, atr_period=20)
+    trades_ind = sma200_strategy(df_ind, atr_period=20)
+    assert trades.equals(trades_ind), "Precomputed indicators reused with different atr_period"
+    
+    # Relaxed filters, so the RSI threshold decides about the trades
+    params = dict(rsi_threshold=100, max_rise_percent=1000, atr_multiplier_body=0)
+    trades = sma200_strategy(df, **{**params, 'rsi_period': 5, 'rsi_threshold': 70})
+    trades_ind = sma200_strategy(df_ind, **{**params, 'rsi_period': 5, 'rsi_threshold': 70})
+    assert len(trades) > 0 and trades.equals(trades_ind), "Precomputed RSI column reused with different rsi_period"
+    print("✓ Indicators recalculated when parameters differ")
     
-    results = []
-    for test in tests:
-        results.append(test())
+    # attrs survive copy() and concat(), but edited prices must not reuse the old indicators
+    edited, edited_ind = df.copy(), df_ind.copy()
+    for frame in (edited, edited_ind):
+        frame.loc[300:, ['open', 'high', 'low', 'close']] *= 1.5
+    assert sma200_strategy(edited, **params).equals(sma200_strategy(edited_ind, **params)), \
+        "Precomputed indicators reused after the prices were edited"
     
-    # Summary
+    doubled = pd.concat([df, df], ignore_index=True)
+    doubled_ind = pd.concat([df_ind, df_ind], ignore_index=True)
+    assert sma200_strategy(doubled, **params).equals(sma200_strategy(doubled_ind, **params)), \
+        "Precomputed indicators reused after concat"
+    print("✓ Indicators recalculated when the prices changed")
+
+
+def test_strategy_batch():
+    """Test that the parallel parameter sweep gives the same trades as single runs"""
     print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    print(f"Total tests: {len(results)}")
-    print(f"Passed: {sum(results)}")
-    print(f"Failed: {len(results) - sum(results)}")
-    
-    if all(results):
-        print("\n✓✓✓ ALL UNIT TESTS PASSED ✓✓✓")
-        print("\nThe SMA200 strategy implementation is working correctly!")
-        print("Note: Real-world testing with actual market data is recommended.")
-    else:
-        print("\n✗✗✗ SOME TESTS FAILED ✗✗✗")
-    
-    print(f"\nTest finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("UNIT TEST: Strategy Batch")
     print("=" * 60)
     
-    return all(results)
+    df = create_mock_data(days=500)
+    grid = [dict(rsi_threshold=t, atr_multiplier_trail=m) for t in [55, 65, 75] for m in [1.5, 2.0]]
+    grid.append(dict(rsi_threshold=65, atr_period=20))  # different indicator set
+    
+    for max_workers in [1, 2]:
+        batch = sma200_strategy_batch(df, grid, max_workers=max_workers)
+        assert len(batch) == len(grid)
+        for params, trades in zip(grid, batch):
+            assert trades.equals(sma200_strategy(df, **params)), f"Trades differ for {params}"
+        print(f"✓ Same trades with max_workers={max_workers}")
+    
+    assert sma200_strategy_batch(df, []) == []
+    print("✓ Empty grid handled")
 
 
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+def test_date_objects():
+    """Test the strategy on a date column of datetime.date objects, as MarketData builds it"""
+    print("\n" + "=" * 60)
+    print("UNIT TEST: datetime.date Column")
+    print("=" * 60)
+    
+    df = create_mock_data(days=500)
+    df_dates = df.copy()
+    df_dates['date'] = pd.to_datetime(df_dates['date']).dt.date
+    
+    # Relaxed filters, so there are trades to compare
+    params = dict(rsi_threshold=100, max_rise_percent=1000, atr_multiplier_body=0)
+    trades = sma200_strategy(df, **params)
+    trades_dates = sma200_strategy(df_dates, **params)
+    assert len(trades) > 0 and len(trades) == len(trades_dates)
+    assert trades['days_in_trade'].tolist() == trades_dates['days_in_trade'].tolist()
+    print(f"✓ Same trade lengths with datetime.date column: {len(trades_dates)} trades")
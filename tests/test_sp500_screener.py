@@ -2,8 +2,15 @@
 Unit tests for SP500Screener module
 """
 
+import os
+import tempfile
+import time
 import unittest
+from unittest import mock
+
 import pandas as pd
+from tradingsuite.data import market_data
+from tradingsuite.utils import sp500_screener
 from tradingsuite.utils.sp500_screener import SP500Loader, SP500Screener
 
 
@@ -215,6 +222,120 @@ class TestDataIntegrity(unittest.TestCase):
             self.assertIn(sector, valid_sectors)
 
 
+class TestSP500LoaderCache(unittest.TestCase):
+    """Offline tests of the S&P 500 list cache (memory + one file with a 24h TTL)"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(sp500_screener, 'CACHE_DIR', self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(SP500Loader, '_sp500_cache', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tables = [pd.DataFrame({'Symbol': ['AAA'], 'Date added': ['2020-01-01']}),
+                       pd.DataFrame({'Symbol': ['BBB'], 'Date added': ['2021-01-01']})]
+        patcher = mock.patch.object(pd, 'read_html', side_effect=lambda _: [self.tables.pop(0)])
+        self.read_html = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def load(self):
+        loader = SP500Loader()
+        loader.scraper = mock.Mock(**{'get.return_value.text': ''})
+        return loader.load()['Symbol'].tolist()
+    
+    def test_single_file_expires_and_old_files_are_removed(self):
+        old_file = os.path.join(self.tmp.name, 'sp500_2024-01-01.pkl')
+        open(old_file, 'w').close()
+        
+        self.assertEqual(self.load(), ['AAA'])
+        self.assertEqual(self.load(), ['AAA'])
+        self.assertEqual(os.listdir(self.tmp.name), ['sp500.pkl'])
+        
+        # A new process reads the file
+        SP500Loader._sp500_cache = None
+        self.assertEqual(self.load(), ['AAA'])
+        self.assertEqual(self.read_html.call_count, 1)
+        
+        # After 24 hours both the session copy and the file are stale
+        stale = time.time() - 25 * 3600
+        SP500Loader._sp500_cache = (stale, SP500Loader._sp500_cache[1])
+        os.utime(os.path.join(self.tmp.name, 'sp500.pkl'), (stale, stale))
+        self.assertEqual(self.load(), ['BBB'])
+        self.assertEqual(self.read_html.call_count, 2)
+
+
+class TestRSICache(unittest.TestCase):
+    """Offline tests of the RSI filters on top of the get_market_df cache"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for module, name in [(market_data, 'MARKET_CACHE_DIR'), (sp500_screener, 'CACHE_DIR')]:
+            patcher = mock.patch.object(module, name, self.tmp.name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        market_data.clear_market_cache(disk=False)
+        self.addCleanup(market_data.clear_market_cache, disk=False)
+        self.downloads = []
+        
+        def fake_market_data(ticker, range, interval):
+            self.downloads.append(ticker)
+            df = pd.DataFrame({'date': ['2024-01-02'], 'close': [100.0],
+                               'rsi': [float(len(self.downloads))]})
+            return mock.Mock(df=df)
+        
+        patcher = mock.patch.object(market_data, 'MarketData', side_effect=fake_market_data)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.screener = SP500Screener(auto_load=False)
+        self.screener.sp500_df = pd.DataFrame({'Symbol': ['AAA', 'BBB']})
+    
+    def test_rsi_reuses_and_refreshes_market_cache(self):
+        # Daily RSI file of an earlier version is removed
+        open(os.path.join(self.tmp.name, 'sp500_rsi_14_1y_1d_2024-01-01.pkl'), 'w').close()
+        
+        self.screener.reset_filters().filter_by_rsi(n=2, delay=0)
+        self.assertEqual(sorted(self.downloads), ['AAA', 'BBB'])
+        self.assertNotIn('sp500_rsi_14_1y_1d_2024-01-01.pkl', os.listdir(self.tmp.name))
+        
+        # Fresh cache: no new download, same RSI values
+        self.screener.reset_filters().filter_by_rsi_range(0, 100, delay=0)
+        self.assertEqual(len(self.downloads), 2)
+        self.assertEqual(sorted(self.screener.filtered_df['RSI']), [1.0, 2.0])
+        
+        # use_cache=False downloads again and refreshes the cache for every ticker
+        self.screener.reset_filters().filter_by_rsi(n=2, delay=0, use_cache=False)
+        self.assertEqual(len(self.downloads), 4)
+        self.screener.reset_filters().filter_by_rsi(n=2, delay=0)
+        self.assertEqual(len(self.downloads), 4)
+        self.assertEqual(sorted(self.screener.filtered_df['RSI']), [3.0, 4.0])
+        
+        # Intraday data expires after an hour
+        self.screener.reset_filters().filter_by_rsi(n=2, interval='1h', delay=0)
+        self.assertEqual(len(self.downloads), 6)
+        stale = time.time() - 2 * 3600
+        for key, (_, df) in list(market_data._market_cache.items()):
+            market_data._market_cache[key] = (stale, df)
+        for name in os.listdir(self.tmp.name):
+            os.utime(os.path.join(self.tmp.name, name), (stale, stale))
+        self.screener.reset_filters().filter_by_rsi(n=2, interval='1h', delay=0)
+        self.assertEqual(len(self.downloads), 8)
+
+    
+    def test_delay_is_shared_by_the_workers(self):
+        starts = []
+        market_data.MarketData.side_effect = lambda *args, **kwargs: (
+            starts.append(time.monotonic()) or mock.Mock(df=pd.DataFrame({'date': [1], 'close': [1.0], 'rsi': [50.0]})))
+        self.screener.sp500_df = pd.DataFrame({'Symbol': [f'T{i}' for i in range(5)]})
+        self.screener.reset_filters().filter_by_rsi(n=5, delay=0.05, max_workers=5)
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertEqual(len(starts), 5)
+        self.assertGreaterEqual(min(gaps), 0.045)
+
 if __name__ == '__main__':
     # Run tests
     unittest.main(verbosity=2)
@@ -0,0 +1,122 @@
+"""
+Offline unit tests for TradingViewData (no network access needed)
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from tradingsuite.data import tradingview_data
+from tradingsuite.data.tradingview_data import TradingViewData, _optimize_dtypes
+
+
+def test_etf_title_keeps_expense_ratio_digits():
+    """The ETF title shows expense_ratio as received, not a float32 approximation"""
+    tv = TradingViewData(auto_load=False)
+    tv.us_etf = _optimize_dtypes(pd.DataFrame([{
+        'name': 'SPY',
+        'description': 'SPDR S&P 500 ETF Trust',
+        'aum': 5.0e11,
+        'focus.tr': 'Large cap',
+        'expense_ratio': 0.0945,
+        'nav_total_return.5Y': 95.1234,
+    }]), ('focus.tr',))
+    
+    title = tv.get_plotly_title('spy')
+    assert title.startswith('SPDR S&P 500 ETF Trust (SPY) - AUM: $')
+    assert title.endswith('- Fókusz: Large cap - Költség: 0.0945%')
+    assert tv.us_etf['nav_total_return.5Y'].iloc[0] == 95.1234
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode('utf-8')
+    
+    def raise_for_status(self):
+        pass
+
+
+def test_response_cache_expires_with_cache_ttl(monkeypatch):
+    """The in-memory response cache honours the endpoint cache_ttl and keeps RESPONSE_CACHE_SIZE responses"""
+    monkeypatch.setattr(TradingViewData, '_response_cache', OrderedDict())
+    url = 'https://scanner.tradingview.com/coin/scan'
+    calls = []
+    
+    def fake_post(url, data=None, timeout=None):
+        calls.append(url)
+        return _FakeResponse({'data': [], 'n': len(calls)})
+    
+    tv = TradingViewData(auto_load=False)
+    tv._session.post = fake_post
+    assert tv._make_request(url, {'q': 1})['n'] == 1
+    assert tv._make_request(url, {'q': 1})['n'] == 1
+    
+    # Another instance with a shorter TTL does not get the shared entry once it is older than that
+    short = TradingViewData(auto_load=False, cache_ttl={'coin': 0})
+    short._session.post = fake_post
+    assert short._make_request(url, {'q': 1})['n'] == 2
+    
+    # After the 15 minute crypto TTL the response is downloaded again
+    stale = time.time() - 20 * 60
+    for key, (fetched_at, data) in TradingViewData._response_cache.items():
+        TradingViewData._response_cache[key] = (stale, data)
+    assert tv._make_request(url, {'q': 1})['n'] == 3
+    assert tv._make_request(url, {'q': 1})['n'] == 3
+    
+    # Bounded LRU: the oldest response is dropped
+    for q in range(2, tradingview_data.RESPONSE_CACHE_SIZE + 2):
+        tv._make_request(url, {'q': q})
+    assert len(TradingViewData._response_cache) == tradingview_data.RESPONSE_CACHE_SIZE
+    assert tv._make_request(url, {'q': 1})['n'] == len(calls)
+
+
+def test_snapshot_is_the_only_disk_cache(tmp_path, monkeypatch):
+    """get_all_crypto writes one DataFrame snapshot (no raw JSON) and a new instance reads it back"""
+    monkeypatch.setattr(tradingview_data, 'SCANNER_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(TradingViewData, '_response_cache', OrderedDict())
+    (tmp_path / 'coin_0123.json').write_text('{}')  # raw response file of an earlier version
+    
+    tv = TradingViewData(auto_load=False)
+    row = {c: None for c in tv._crypto_columns}
+    row.update({'base_currency': 'BTC', 'crypto_common_categories': ['layer-1']})
+    calls = []
+    
+    def fake_post(url, data=None, timeout=None):
+        calls.append(url)
+        return _FakeResponse({'data': [{'s': 'CRYPTO:BTCUSD', 'd': list(row.values())}]})
+    
+    tv._session.post = fake_post
+    assert tv.get_all_crypto()
+    assert os.listdir(tmp_path) == ['crypto.pkl']
+    
+    other = TradingViewData(auto_load=False)
+    other._session.post = fake_post
+    assert other.get_all_crypto()
+    assert other.crypto['ticker'].tolist() == ['BTC-USD']
+    assert len(calls) == 1
+
+
+def test_moneystring_vec_matches_moneystring():
+    """Element by element the same strings as moneystring, incl. .xx5 rounding, NaN and ints"""
+    tv = TradingViewData(auto_load=False)
+    values = [0.005, 2.675, 231.245, 1_000_000, 1_000_000.004, 183_321_565.0, 1e9, 2.5e12,
+              float('nan'), 500, 123_456_789]
+    floats = [float(v) for v in values]
+    assert tv.moneystring_vec(floats).tolist() == [tv.moneystring(v) for v in floats]
+    ints = [v for v in values if isinstance(v, int)]
+    assert tv.moneystring_vec(ints).tolist() == [tv.moneystring(v) for v in ints]
+    mixed = [None, 500, 1.5e9, float('nan')]
+    assert tv.moneystring_vec(mixed).tolist() == [tv.moneystring(v) for v in mixed]
+
+
+def test_top_k_matches_nlargest_and_needs_no_instance():
+    """top_k is a static method with the same rows and order as nlargest / nsmallest (ties, NaN)"""
+    df = pd.DataFrame({'v': np.random.default_rng(1).integers(0, 50, 500).astype(float)})
+    df.loc[::7, 'v'] = np.nan
+    for n in [1, 5, 100, 1000]:
+        assert TradingViewData.top_k(df, n, 'v').index.equals(df.nlargest(n, 'v').index)
+        assert TradingViewData.top_k(df, n, 'v', largest=False).index.equals(df.nsmallest(n, 'v').index)
@@ -2,10 +2,35 @@
 TradingSuite - Trading analysis and backtest package
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
-from .data.tradingview_data import TradingViewData
-from .data.market_data import MarketData
-from .analysis.backtest import Backtest
+# Public names are imported on first access (PEP 562), so `import tradingsuite`
+# or importing a single submodule does not pull in pandas-ta, scipy and plotly
+_LAZY_IMPORTS = {
+    'TradingViewData': '.data.tradingview_data',
+    'MarketData': '.data.market_data',
+    'StockData': '.data.market_data',
+    'Backtest': '.analysis.backtest',
+}
+
+__all__ = ['TradingViewData', 'MarketData', 'StockData', 'Backtest']
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    # Submodules / subpackages (e.g. `tradingsuite.data` after a plain `import tradingsuite`)
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['TradingViewData', 'MarketData', 'Backtest']
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,6 +1,34 @@
 """Data acquisition and processing modules"""
 
-from .tradingview_data import TradingViewData
-from .market_data import MarketData
+import importlib
 
-__all__ = ['TradingViewData', 'MarketData']
+# Public names are imported on first access (PEP 562), see tradingsuite/__init__.py
+_LAZY_IMPORTS = {
+    'TradingViewData': '.tradingview_data',
+    'MarketData': '.market_data',
+    'StockData': '.market_data',
+    'get_market_df': '.market_data',
+    'get_market_dfs': '.market_data',
+    'clear_market_cache': '.market_data',
+}
+
+__all__ = ['TradingViewData', 'MarketData', 'StockData', 'get_market_df', 'get_market_dfs',
+           'clear_market_cache']
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    # Submodules / subpackages (e.g. `tradingsuite.data` after a plain `import tradingsuite`)
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
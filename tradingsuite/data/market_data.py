@@ -1,4 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from collections import OrderedDict
+import logging
+import os
+import threading
+import time
 import pandas as pd
 import pandas_ta as ta
 import plotly.graph_objects as go
@@ -9,6 +15,38 @@ import requests
 import json
 import cloudscraper
 
+logger = logging.getLogger(__name__)
+
+# On-disk cache of downloaded and processed DataFrames (see get_market_df)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.tradingsuite_cache')
+MARKET_CACHE_DIR = os.path.join(CACHE_DIR, 'market')
+
+# In-memory tier of get_market_df: (ticker, range, interval) -> (load time, DataFrame), LRU order
+MARKET_CACHE_SIZE = 512
+_market_cache = OrderedDict()
+_market_cache_lock = threading.Lock()
+
+
+def smma(series, window):
+    """
+    Calculate Smoothed Moving Average (SMMA, Wilder smoothing)
+    smma[i] = (smma[i-1] * (window - 1) + x[i]) / window, seeded with the first value.
+    This is the same recurrence as an adjust=False EWM with alpha = 1/window, which runs in compiled code.
+
+    NaN handling differs from the plain recurrence, where one NaN turns every later value into NaN:
+    leading NaNs stay NaN and the series is seeded with the first valid value, a NaN inside the
+    series repeats the previous value, and the average is decayed over the missing bars, so the
+    next valid value gets their weight too (ewm ignore_na=False).
+
+    Parameters:
+    - series: Pandas Series, values to smooth (e.g. hl2)
+    - window: int, window size
+
+    Return: Pandas Series
+    """
+    return series.ewm(alpha=1 / window, adjust=False).mean()
+
+
 class MarketData:
     def __init__(self, ticker, ad_ticker=True, range='18y', interval='1d'):
         """
@@ -53,14 +91,7 @@ class MarketData:
         
         Return: DataFrame with added column
         """
-        hl2 = data['hl2'].values
-        smma_values = [hl2[0]]
-
-        for i in range(1, len(hl2)):
-            smma_val = (smma_values[-1] * (window - 1) + hl2[i]) / window
-            smma_values.append(smma_val)
-
-        data[colname] = smma_values
+        data[colname] = smma(data['hl2'], window)
         return data
 
 
@@ -291,3 +322,132 @@ class MarketData:
 # https://stackoverflow.com/questions/71411995/pandas-plotly-secondary-graph-needs-to-be-to-rsi
 
 #https://wire.insiderfinance.io/plot-candlestick-rsi-bollinger-bands-and-macd-charts-using-yfinance-python-api-1c2cb182d147
+
+
+# Older name of MarketData, used in the README examples
+StockData = MarketData
+
+
+def _cache_ttl(interval):
+    """
+    Number of seconds a cached download stays fresh: 24h for daily or longer bars, 1h for intraday
+    """
+    return 24 * 3600 if interval.endswith(('d', 'wk', 'mo')) else 3600
+
+
+def _fresh_market_df(ticker, range, interval):
+    """
+    Cached DataFrame of get_market_df from memory or disk, None if neither is fresh
+
+    Both cache tiers expire after _cache_ttl(interval); a frame read from disk keeps the
+    file time as its load time, so the two tiers expire together.
+    """
+    key = (ticker, range, interval)
+    ttl = _cache_ttl(interval)
+    with _market_cache_lock:
+        cached = _market_cache.get(key)
+        if cached is not None and time.time() - cached[0] < ttl:
+            _market_cache.move_to_end(key)
+            return cached[1]
+
+    path = os.path.join(MARKET_CACHE_DIR, f"{ticker}_{range}_{interval}.pkl")
+    loaded_at = os.path.getmtime(path) if os.path.exists(path) else 0
+    if time.time() - loaded_at >= ttl:
+        return None
+    df = pd.read_pickle(path)
+    _remember_market_df(key, loaded_at, df)
+    return df
+
+
+def _download_market_df(ticker, range, interval):
+    """
+    Download the DataFrame of get_market_df and store it in both cache tiers
+    """
+    df = MarketData(ticker, range=range, interval=interval).df
+    loaded_at = time.time()
+    path = os.path.join(MARKET_CACHE_DIR, f"{ticker}_{range}_{interval}.pkl")
+    # Atomic write (temp file + os.replace): parallel threads / processes never read a partial pickle
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(MARKET_CACHE_DIR, exist_ok=True)
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write market data cache {path}: {str(e)}")
+    _remember_market_df((ticker, range, interval), loaded_at, df)
+    return df
+
+
+def _remember_market_df(key, loaded_at, df):
+    with _market_cache_lock:
+        _market_cache[key] = (loaded_at, df)
+        _market_cache.move_to_end(key)
+        if len(_market_cache) > MARKET_CACHE_SIZE:
+            _market_cache.popitem(last=False)
+
+
+def _load_market_df(ticker, range, interval):
+    """
+    DataFrame of get_market_df from memory, disk or a new download, whichever is still fresh
+    """
+    df = _fresh_market_df(ticker, range, interval)
+    if df is None:
+        df = _download_market_df(ticker, range, interval)
+    return df
+
+
+def clear_market_cache(disk=True):
+    """
+    Drop the cached get_market_df downloads, the next call downloads the data again
+
+    Parameters:
+    - disk: bool, default True, also delete the pickled files in MARKET_CACHE_DIR
+    """
+    with _market_cache_lock:
+        _market_cache.clear()
+    if disk and os.path.isdir(MARKET_CACHE_DIR):
+        for name in os.listdir(MARKET_CACHE_DIR):
+            os.remove(os.path.join(MARKET_CACHE_DIR, name))
+
+
+def get_market_df(ticker, range='18y', interval='1d'):
+    """
+    Cached equivalent of MarketData(ticker, range=range, interval=interval).df
+
+    Downloads are kept in memory and pickled to MARKET_CACHE_DIR, so repeated calls for
+    the same ticker do not hit the network until the cached data expires (24h for daily
+    data, 1h for intraday data; both tiers). clear_market_cache() drops them earlier.
+
+    Parameters:
+    - ticker: str, ticker symbol of the stock or crypto or ETF or forex
+    - range: str, time range to download data for example 5y,1y, 1mo, 1d, 1h
+    - interval: str, interval to download data for example 1d, 1h, 5m
+
+    Return: copy of the cached DataFrame, safe to modify
+    """
+    return _load_market_df(ticker, range, interval).copy()
+
+
+def get_market_dfs(tickers, range='18y', interval='1d', max_workers=8):
+    """
+    Download several tickers at once with get_market_df
+
+    The downloads are I/O-bound, so they run concurrently in a thread pool.
+
+    Parameters:
+    - tickers: list of ticker symbols
+    - range: str, time range to download data for example 5y,1y, 1mo, 1d, 1h
+    - interval: str, interval to download data for example 1d, 1h, 5m
+    - max_workers: int, maximum number of concurrent downloads
+
+    Return: dict of ticker -> DataFrame, tickers that failed to download are left out
+    """
+    dfs = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {ticker: executor.submit(get_market_df, ticker, range, interval) for ticker in tickers}
+        for ticker, future in futures.items():
+            try:
+                dfs[ticker] = future.result()
+            except Exception as e:
+                logger.warning(f"Error downloading {ticker}: {str(e)}")
+    return dfs
@@ -1,18 +1,443 @@
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
-from typing import Optional, Dict, Any
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import orjson  # opcionális, gyorsabb JSON kódolás/dekódolás (pip install tradingsuite[fast])
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Feldolgozott scanner DataFrame-ek lemez-cache-e (a market_data CACHE_DIR alkönyvtára)
+SCANNER_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.tradingsuite_cache', 'tradingview')
+
+# Lemez-cache élettartama másodpercben, scanner végpontonként (pl. 'america', 'coin', 'uk')
+DEFAULT_CACHE_TTL = 12 * 3600
+SCANNER_CACHE_TTL = {'coin': 15 * 60}
+# Scanner válaszok memória cache-ének mérete (válasz darabszám, LRU); egy válasz több ezer sor
+RESPONSE_CACHE_SIZE = 4
+# get_plotly_title memória cache mérete (ticker darabszám, LRU)
+TITLE_CACHE_SIZE = 256
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Tömör JSON bájtokká alakítás, orjson-nal ha elérhető"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Any:
+    """JSON bájtok dekódolása, orjson-nal ha elérhető"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _scanner_frame(data: Dict[str, Any], columns, label: str) -> Optional[pd.DataFrame]:
+    """
+    Scanner válasz -> DataFrame: a sorok 'd' listái közvetlenül, köztes lista nélkül
+    kerülnek a konstruktorba, az oszlopnevekkel együtt
+    
+    A válasz alakját előre ellenőrzi (lista, minden sorban a kért oszlopszámú 'd' mező),
+    hibás válasznál a hibás sor sorszámával naplóz és None-t ad vissza.
+    
+    Előre megadott (strukturált) dtype-ot szándékosan nem használ: a numerikus mezők
+    gyakran None-t tartalmaznak, ami float mezőbe nem írható, a szöveges oszlopok pedig
+    object-ként maradnának. A típusszűkítést a betöltés után az _optimize_dtypes végzi.
+    """
+    rows = data['data']
+    if not isinstance(rows, list):
+        logger.error(f"Váratlan {label} válasz: a 'data' mező nem lista")
+        return None
+    
+    expected = len(columns)
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict) or len(row.get('d') or ()) != expected:
+            logger.error(f"Hibás {label} sor ({i}.): {expected} mezőt vártunk")
+            return None
+    
+    return pd.DataFrame.from_records(map(itemgetter('d'), rows), columns=columns)
+
+
+def _drop_dot_tickers(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Kiszűri a pont karaktert tartalmazó ticker-eket (pl. BRK.A, BRK.B), 0-tól számozott indexszel
+    
+    A megtartott sorpozíciókat egyetlen take() választja ki, az új RangeIndex pedig
+    közvetlenül beállítható, így nincs külön reset_index lépés.
+    """
+    keep = np.flatnonzero(~df['name'].str.contains('.', na=False, regex=False).to_numpy())
+    df = df.take(keep)
+    df.index = pd.RangeIndex(len(keep))
+    return df
+
+
+# moneystring mértékegységei csökkenő sorrendben (küszöb és egyben osztó, utótag)
+_MONEY_SCALES = (
+    (1_000_000_000_000, ' Trillion'),
+    (1_000_000_000, ' Billion'),
+    (1_000_000, ' Million'),
+)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_money(money) -> str:
+    """moneystring tényleges formázása; tiszta függvény, ezért az ismétlődő értékek cache-ből jönnek"""
+    for scale, suffix in _MONEY_SCALES:
+        if money > scale:
+            return f"{round(money / scale, 2)}{suffix}"
+    return f"{round(money, 2)}"
+
+
+def _top_percent_positions(groups: pd.Series, values: pd.Series, percent: float) -> np.ndarray:
+    """
+    Csoportonként a legnagyobb értékű sorok pozíciói (a csoport méretének percent %-a, lefelé kerekítve)
+    
+    Tisztán numpy: a csoportkódokon és értékeken egyetlen stabil lexsort, majd a csoporton belüli
+    sorszám a csoporthatárokból. Az eredmény sorrendje és tartalma megegyezik a csoportonkénti
+    nlargest összefűzésével: csoportok kód szerint, egyenlő értékeknél az eredeti sorrend marad,
+    hiányzó értékű sorok csak a csoport végére, kitöltésként kerülnek. A hiányzó csoportú sorok kimaradnak.
+    """
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        codes = groups.cat.codes.to_numpy()
+    else:
+        codes = pd.factorize(groups, sort=True)[0]
+    valid = np.flatnonzero(codes >= 0)
+    codes = codes[valid]
+    values = values.to_numpy(dtype='float64')[valid]
+    
+    missing = np.isnan(values)
+    order = np.lexsort((-np.where(missing, 0, values), missing, codes))
+    sorted_codes = codes[order]
+    
+    # Csoporton belüli sorszám: pozíció mínusz a csoport kezdőpozíciója
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    keep_n = (np.bincount(codes) * (percent / 100)).astype(int)
+    
+    return valid[order[rank < keep_n[sorted_codes]]]
+
+
+# Százalékos/oszcillátor oszlopok előtagjai, amelyeknél a float32 pontosság bőven elég.
+# Az ár- és kapitalizáció szintek (close, SMA*, market_cap_*) float64-en maradnak,
+# mert összehasonlításokban és rangsorolásban szerepelnek; a címekben kerekítés nélkül
+# megjelenő mezők (expense_ratio, nav_*) szintén, különben pl. 0.0945 helyett
+# 0.09449999779462814 jelenne meg.
+FLOAT32_PREFIXES = ('Perf.', 'change', '24h_close_change', 'RSI', 'Stoch.', 'Rec', 'Mom', 'MACD.',
+                    'beta_', 'relative_volume')
+
+
+# Ár-, kapitalizáció- és forgalomszintek: float64 marad, de ha egy válaszban csak null érték
+# jön bennük, a from_records object oszlopot adna -> ilyenkor számmá alakítjuk
+FLOAT64_PREFIXES = ('close', 'market_cap_', 'aum', 'volume', 'Value.Traded', '24h_vol_', 'circulating_supply',
+                    'crypto_total_rank', 'number_of_employees', 'earnings_per_share', 'price_', 'SMA', 'EMA',
+                    'BB.', 'High.', 'Low.')
+
+
+def _optimize_dtypes(df: pd.DataFrame, categorical_cols=()) -> pd.DataFrame:
+    """
+    Memóriatakarékos típusok a betöltött scanner DataFrame-ekhez
+    
+    - categorical_cols: kevés egyedi értékű szöveges oszlopok -> category
+      (szűrés/value_counts/groupby int kódokon fut)
+    - FLOAT32_PREFIXES-szel kezdődő oszlopok -> float32
+    - FLOAT64_PREFIXES-szel kezdődő, nem numerikus oszlopok -> float64
+    """
+    categories = {c: 'category' for c in categorical_cols if c in df.columns}
+    floats = {
+        c: pd.to_numeric(df[c], errors='coerce').astype('float32')
+        for c in df.columns if c.startswith(FLOAT32_PREFIXES)
+    }
+    floats.update({
+        c: pd.to_numeric(df[c], errors='coerce').astype('float64')
+        for c in df.columns
+        if c.startswith(FLOAT64_PREFIXES) and not pd.api.types.is_numeric_dtype(df[c])
+    })
+    return df.astype(categories).assign(**floats)
+
+
+# Scanner lekérdezések oszlopai és query-jei: modul szinten egyszer jönnek létre,
+# nem minden letöltéskor (a JSON tömbként a tuple ugyanúgy szerializálódik, mint a lista)
+
+# Amerikai részvény adatmezők definiálása
+US_STOCK_COLUMNS = (
+    "logoid",                     # Logo azonosító
+    "name",                       # Ticker szimbólum (pl. AAPL, MSFT)
+    "close",                      # Záróárfolyam
+    "change",                     # Árfolyamváltozás %
+    "change_abs",                 # Árfolyamváltozás abszolút értékben
+    "Recommend.All",              # Összesített ajánlás
+    "volume",                     # Forgalom (darabszám)
+    "Value.Traded",               # Forgalmazott érték dollárban
+    "market_cap_basic",           # Piaci kapitalizáció
+    "price_earnings_ttm",         # P/E ráta (TTM)
+    "earnings_per_share_basic_ttm", # EPS (TTM)
+    "number_of_employees",        # Alkalmazottak száma
+    "sector",                     # Szektor
+    "High.3M",                    # 3 havi maximum
+    "Low.3M",                     # 3 havi minimum
+    "Perf.3M",                    # 3 havi teljesítmény %
+    "Perf.5Y",                    # 5 éves teljesítmény %
+    "High.1M",                    # 1 havi maximum
+    "Low.1M",                     # 1 havi minimum
+    "High.6M",                    # 6 havi maximum
+    "Low.6M",                     # 6 havi minimum
+    "Perf.6M",                    # 6 havi teljesítmény %
+    "beta_1_year",                # Beta (1 év)
+    "price_52_week_high",         # 52 hetes maximum
+    "price_52_week_low",          # 52 hetes minimum
+    "High.All",                   # Historikus maximum
+    "Low.All",                    # Historikus minimum
+    "BB.lower",                   # Bollinger alsó sáv
+    "BB.upper",                   # Bollinger felső sáv
+    "change|1M",                  # 1 havi változás %
+    "change_abs|1M",              # 1 havi változás abszolút
+    "change|1W",                  # 1 heti változás %
+    "change_abs|1W",              # 1 heti változás abszolút
+    "change|240",                 # 240 napos változás %
+    "country",                    # Ország
+    "EMA50",                      # 50 napos exponenciális mozgóátlag
+    "EMA100",                     # 100 napos exponenciális mozgóátlag
+    "EMA200",                     # 200 napos exponenciális mozgóátlag
+    "MACD.macd",                  # MACD érték
+    "MACD.signal",                # MACD signal
+    "Mom",                        # Momentum
+    "Perf.1M",                    # 1 havi teljesítmény %
+    "RSI7",                       # RSI 7 napos
+    "SMA50",                      # 50 napos egyszerű mozgóátlag
+    "SMA100",                     # 100 napos egyszerű mozgóátlag
+    "SMA200",                     # 200 napos egyszerű mozgóátlag
+    "Stoch.RSI.K",                # Stochastic RSI K
+    "Stoch.RSI.D",                # Stochastic RSI D
+    "Perf.W",                     # Heti teljesítmény %
+    "Perf.Y",                     # Éves teljesítmény %
+    "Perf.YTD",                   # Év eleji teljesítmény %
+    "industry",                   # Iparág
+    "Perf.All",                   # Teljes historikus teljesítmény %
+    "description",                # Cég teljes neve
+    "type",                       # Instrumentum típus
+    "subtype",                    # Altípus
+    "update_mode",                # Frissítési mód
+    "pricescale",                 # Ár skála
+    "minmov",                     # Minimális mozgás
+    "fractional",                 # Töredék kereskedés
+    "minmove2",                   # Alternatív min. mozgás
+    "Mom[1]",                     # Momentum előző nap
+    "RSI7[1]",                    # RSI előző nap
+    "Rec.Stoch.RSI",              # Stochastic RSI ajánlás
+    "currency",                   # Kereskedési deviza
+    "fundamental_currency_code"    # Alapdeviza kód
+)
+
+US_STOCK_QUERY = {
+    "filter": [
+        {"left": "type", "operation": "in_range", "right": ["stock", "dr", "fund"]},
+        {"left": "subtype", "operation": "in_range", 
+         "right": ["common", "foreign-issuer", "", "etf", "etf,odd", "etf,otc", "etf,cfd"]},
+        {"left": "exchange", "operation": "in_range", "right": ["AMEX", "NASDAQ", "NYSE"]},
+        {"left": "is_primary", "operation": "equal", "right": True},
+        {"left": "active_symbol", "operation": "equal", "right": True}
+    ],
+    "options": {"lang": "en"},
+    "markets": ["america"],
+    "symbols": {"query": {"types": []}, "tickers": []},
+    "columns": US_STOCK_COLUMNS,
+    "sort": {"sortBy": "market_cap_basic", "sortOrder": "desc"},
+    "range": [0, 8000]
+}
+
+# Kriptovaluta adatmezők definiálása
+CRYPTO_COLUMNS = (
+    "base_currency",              # Alap szimbólum (pl. BTC, ETH)
+    "base_currency_desc",         # Teljes név (pl. Bitcoin, Ethereum)
+    "base_currency_logoid",       # Logo azonosító
+    "update_mode",                # Frissítési mód
+    "type",                       # Instrumentum típus
+    "typespecs",                  # Típus specifikáció
+    "exchange",                   # Tőzsde/platform
+    "crypto_total_rank",          # Általános rangsor
+    "close",                      # Aktuális árfolyam USD-ben
+    "pricescale",                 # Ár skála
+    "minmov",                     # Minimális ármozgás
+    "fractional",                 # Töredék kereskedés
+    "minmove2",                   # Alternatív minimális mozgás
+    "currency",                   # Jegyzési deviza (általában USD)
+    "24h_close_change|5",         # 24 órás változás százalékban
+    "market_cap_calc",            # Piaci kapitalizáció
+    "fundamental_currency_code",   # Alap devizakód
+    "24h_vol_cmc",                # 24 órás forgalom (CoinMarketCap)
+    "circulating_supply",         # Forgalomban lévő mennyiség
+    "crypto_common_categories",   # Kategóriák (pl. DeFi, layer-1)
+    "crypto_blockchain_ecosystems" # Blockchain ökoszisztéma
+)
+
+CRYPTO_QUERY = {
+    "columns": CRYPTO_COLUMNS,
+    "ignore_unknown_fields": False,
+    "options": {"lang": "en"},
+    "range": [0, 300],
+    "sort": {"sortBy": "crypto_total_rank", "sortOrder": "asc"},
+    "markets": ["coin"]
+}
+
+# ETF adatmezők definiálása
+ETF_COLUMNS = (
+    "name",                      # Ticker szimbólum
+    "description",               # ETF teljes neve
+    "logoid",                    # Logo azonosító
+    "update_mode",               # Frissítési mód
+    "type",                      # Instrumentum típus
+    "typespecs",                 # Típus specifikáció (ETF/ETN)
+    "close",                     # Aktuális/záró árfolyam
+    "pricescale",                # Ár skála
+    "minmov",                    # Minimális ármozgás
+    "fractional",                # Töredék kereskedés támogatott-e
+    "minmove2",                  # Alternatív minimális mozgás
+    "currency",                  # Kereskedési devizanem
+    "change",                    # Árfolyamváltozás
+    "Value.Traded",              # Forgalmazott érték
+    "relative_volume_10d_calc",  # 10 napos relatív volumen
+    "aum",                       # Assets Under Management (kezelt vagyon)
+    "fundamental_currency_code",  # Alapdeviza kód
+    "nav_total_return.5Y",       # 5 éves NAV teljes hozam
+    "expense_ratio",             # Költségráta
+    "asset_class.tr",            # Eszközosztály
+    "focus.tr",                  # Befektetési fókusz
+    "nav_discount_premium",      # NAV diszkont vagy prémium
+    "category.tr",               # ETF kategória
+    "brand.tr",                  # Kibocsátó márka
+    "niche.tr"                   # Speciális piaci szegmens
+)
+
+ETF_QUERY = {
+    "columns": ETF_COLUMNS,
+    "ignore_unknown_fields": False,
+    "options": {"lang": "en"},
+    "price_conversion": {"to_symbol": True},
+    "range": [0, 3000],
+    "sort": {"sortBy": "aum", "sortOrder": "desc"},
+    "markets": ["america"],
+    "filter2": {
+        "operator": "and",
+        "operands": [{
+            "operation": {
+                "operator": "or",
+                "operands": [
+                    {"operation": {"operator": "and", 
+                                 "operands": [{"expression": {"left": "typespecs", 
+                                                             "operation": "has", 
+                                                             "right": ["etn"]}}]}},
+                    {"operation": {"operator": "and", 
+                                 "operands": [{"expression": {"left": "typespecs", 
+                                                             "operation": "has", 
+                                                             "right": ["etf"]}}]}}
+                ]
+            }
+        }]
+    }
+}
+
+# Európai részvény adatmezők definiálása
+EU_STOCK_COLUMNS = (
+    "logoid",                     # Logo azonosító
+    "name",                       # Ticker szimbólum
+    "close",                      # Záróárfolyam
+    "change",                     # Árfolyamváltozás %
+    "change_abs",                 # Árfolyamváltozás abszolút
+    "Recommend.All",              # Összesített ajánlás
+    "volume",                     # Forgalom
+    "Value.Traded",               # Forgalmazott érték
+    "market_cap_basic",           # Piaci kapitalizáció
+    "price_earnings_ttm",         # P/E ráta (TTM)
+    "earnings_per_share_basic_ttm", # EPS (TTM)
+    "number_of_employees",        # Alkalmazottak száma
+    "sector",                     # Szektor
+    "Perf.3M",                    # 3 havi teljesítmény %
+    "Perf.5Y",                    # 5 éves teljesítmény %
+    "Perf.1M",                    # 1 havi teljesítmény %
+    "Perf.6M",                    # 6 havi teljesítmény %
+    "Perf.W",                     # Heti teljesítmény %
+    "Perf.Y",                     # Éves teljesítmény %
+    "Perf.YTD",                   # Év eleji teljesítmény %
+    "industry",                   # Iparág
+    "Perf.All",                   # Teljes historikus teljesítmény %
+    "description",                # Cég teljes neve
+    "type",                       # Instrumentum típus
+    "currency",                   # Kereskedési deviza
+    "exchange"                    # Tőzsde neve
+)
+
+# Európai piacok scanner végpontjai és beállításai
+EU_MARKET_CONFIGS = {
+    'uk': {
+        'url': 'https://scanner.tradingview.com/uk/scan',
+        'exchanges': ['LSE', 'AIM'],
+        'currency': 'GBP'
+    },
+    'germany': {
+        'url': 'https://scanner.tradingview.com/germany/scan',
+        'exchanges': ['XETR', 'FSE', 'SWB', 'HAM', 'DUS', 'BER', 'STU', 'MUN'],
+        'currency': 'EUR'
+    },
+    'poland': {
+        'url': 'https://scanner.tradingview.com/poland/scan',
+        'exchanges': ['WSE', 'NEWCONNECT'],
+        'currency': 'PLN'
+    }
+}
+
+# A get_one_us_stock_info által visszaadott mezők forrásoszlopai
+US_STOCK_INFO_COLUMNS = (
+    'name', 'close', 'market_cap_basic', 'number_of_employees', 'description',
+    'sector', 'industry'
+)
+
+# A get_one_eu_stock_info által olvasott oszlopok
+EU_STOCK_INFO_COLUMNS = (
+    'name', 'close', 'currency', 'default_currency', 'region', 'exchange', 'market_cap_basic',
+    'description', 'sector', 'industry', 'number_of_employees'
+)
+
+# A 'performance' szöveg részei: (címke, oszlop)
+PERFORMANCE_FIELDS = (('hét', 'Perf.W'), ('hónap', 'Perf.1M'), ('6 hónap', 'Perf.6M'), ('év', 'Perf.Y'))
+
+# Csak a TradingView felületének megjelenítéséhez szükséges mezők, a csomag sehol nem használja
+# őket; alapértelmezetten nem kérjük le (full_columns=True esetén igen)
+DISPLAY_ONLY_COLUMNS = frozenset({
+    'logoid', 'base_currency_logoid', 'update_mode', 'pricescale', 'minmov', 'fractional', 'minmove2'
+})
+
+
+def _slim_columns(columns: tuple) -> tuple:
+    """Az oszloplista a DISPLAY_ONLY_COLUMNS mezők nélkül"""
+    return tuple(c for c in columns if c not in DISPLAY_ONLY_COLUMNS)
+
 
 class TradingViewData:
-    def __init__(self, auto_load: bool = True):
+    # Scanner válaszok osztályszintű cache-e, (url, query) kulccsal - minden példány osztozik rajta.
+    # Értéke (letöltés ideje, válasz): a példány cache_ttl-je ugyanúgy lejárttá teszi, mint a pillanatképet.
+    # Legfeljebb RESPONSE_CACHE_SIZE válasz, LRU sorrendben; a szálak a zárral együtt módosítják
+    _response_cache: 'OrderedDict[tuple, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+    _response_cache_lock = threading.Lock()
+
+    def __init__(self, auto_load: bool = True, cache_ttl: Optional[Dict[str, float]] = None,
+                 full_columns: bool = False):
         """ 
         Inicializálja a TradingViewData osztályt, amely a TradingView adatok lekéréséért felelős.
         
@@ -21,41 +446,163 @@ class TradingViewData:
         
         Parameters:
         - auto_load: Ha True, automatikusan betölti az összes adatot inicializáláskor
+        - cache_ttl: scanner végpontonkénti lemez-cache élettartam másodpercben,
+          felülírja a SCANNER_CACHE_TTL alapértékeit (pl. {'america': 3600}); 0 kikapcsolja
+        - full_columns: Ha True, a csak megjelenítéshez használt mezőket (DISPLAY_ONLY_COLUMNS,
+          pl. logoid, pricescale) is letölti; alapértelmezetten kimaradnak a kisebb válasz miatt
         
         Működés:
-        1. Inicializálja az üres DataFrame-eket
+        1. Inicializálja az üres DataFrame-eket és a HTTP session-t
         2. Ha auto_load=True, meghívja a load_all_data() metódust
         """
+        # Egyetlen keep-alive session: a scanner hívások újrahasználják a TCP/TLS kapcsolatot
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            # A scanner POST csak olvas, ezért átmeneti szerverhibánál biztonságosan újraküldhető
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                              allowed_methods=None)
+        )
+        self._session.mount('https://', adapter)
+        self._session.headers.update({'Content-Type': 'application/json'})
+        self.cache_ttl = {**SCANNER_CACHE_TTL, **(cache_ttl or {})}
+        
+        # Lekérendő oszlopok és a hozzájuk tartozó query-k, példányonként egyszer összeállítva
+        self._full_columns = full_columns
+        self._us_stock_columns = US_STOCK_COLUMNS if full_columns else _slim_columns(US_STOCK_COLUMNS)
+        self._crypto_columns = CRYPTO_COLUMNS if full_columns else _slim_columns(CRYPTO_COLUMNS)
+        self._etf_columns = ETF_COLUMNS if full_columns else _slim_columns(ETF_COLUMNS)
+        self._eu_stock_columns = EU_STOCK_COLUMNS if full_columns else _slim_columns(EU_STOCK_COLUMNS)
+        self._us_stock_query = {**US_STOCK_QUERY, "columns": self._us_stock_columns}
+        self._crypto_query = {**CRYPTO_QUERY, "columns": self._crypto_columns}
+        self._etf_query = {**ETF_QUERY, "columns": self._etf_columns}
+        
         self.us_stock = pd.DataFrame()
         self.eu_stock = pd.DataFrame()
         self.crypto = pd.DataFrame()
         self.us_etf = pd.DataFrame()
         
+        # get_one_us_stock_info keresőindexei, a us_stock frame-hez kötve (lásd _us_stock_lookup)
+        self._us_lookup_frame = None
+        self._us_lookup = None
+        self._eu_lookup_frame = None
+        self._eu_info_columns = None
+        self._crypto_categories_frame = None
+        self._crypto_categories = None
+        # Ticker -> sorpozíció indexek attribútumonként, a frame objektumhoz kötve (lásd _name_positions)
+        self._name_index_cache = {}
+        # Csoportérték -> sorpozíciók (frame, oszlop) páronként, ugyanígy a frame-hez kötve (lásd _group_positions)
+        self._group_index_cache = {}
+        # get_plotly_title eredményei; törlődik, ha bármelyik frame lecserélődik (lásd _cached_title)
+        self._title_cache = OrderedDict()
+        self._title_cache_frames = (None, None, None, None)
+        
         if auto_load:
             self.load_all_data()
     
     def load_all_data(self):
-        """Betölti az összes adatot (US részvények, kripto, ETF)"""
-        self.get_us_stocks()
-        self.get_all_crypto()
-        self.get_us_etfs()
-        self.get_eu_stocks()
+        """
+        Betölti az összes adatot (US részvények, kripto, ETF, EU részvények)
+        
+        A scanner lekérések egymástól függetlenek és mindegyik más attribútumot tölt fel,
+        ezért párhuzamosan futnak, így a betöltési idő a leglassabb kérés ideje lesz
+        a kérések összege helyett.
+        """
+        loaders = [self.get_us_stocks, self.get_all_crypto, self.get_us_etfs, self.get_eu_stocks]
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [executor.submit(loader) for loader in loaders]
+            for future in futures:
+                future.result()
 
-    def _make_request(self, url: str, data_query: str) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def clear_cache(cls):
+        """Törli a scanner válaszok memória-cache-ét és a pillanatképeket, a következő lekérés újra letölti az adatokat"""
+        with cls._response_cache_lock:
+            cls._response_cache.clear()
+        if os.path.isdir(SCANNER_CACHE_DIR):
+            for name in os.listdir(SCANNER_CACHE_DIR):
+                os.remove(os.path.join(SCANNER_CACHE_DIR, name))
+
+    def _url_ttl(self, url: str) -> float:
+        """A scanner végpont (pl. 'america', 'coin') cache élettartama másodpercben"""
+        endpoint = url.rstrip('/').split('/')[-2]
+        return self.cache_ttl.get(endpoint, DEFAULT_CACHE_TTL)
+
+    def _snapshot_path(self, name: str) -> str:
+        """Feldolgozott DataFrame pillanatkép útvonala (a teljes oszlopkészlet külön fájlba kerül)"""
+        suffix = '_full' if self._full_columns else ''
+        return os.path.join(SCANNER_CACHE_DIR, f"{name}{suffix}.pkl")
+
+    def _read_snapshot(self, name: str, endpoint: str) -> Optional[pd.DataFrame]:
+        """
+        Visszaadja a lemezre mentett, már feldolgozott DataFrame-et, ha a végpont
+        cache_ttl ideje még nem járt le, különben None
+        """
+        ttl = self.cache_ttl.get(endpoint, DEFAULT_CACHE_TTL)
+        path = self._snapshot_path(name)
+        if ttl <= 0 or not os.path.exists(path) or time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Nem sikerült a pillanatkép olvasása {path}: {str(e)}")
+            return None
+
+    def _write_snapshot(self, name: str, df: pd.DataFrame):
+        """Atomikusan lemezre menti a feldolgozott DataFrame-et (ideiglenes fájl + os.replace)"""
+        path = self._snapshot_path(name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(SCANNER_CACHE_DIR, exist_ok=True)
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Nem sikerült a pillanatkép írása {path}: {str(e)}")
+            return
+        # A korábbi verziók nyers JSON válasz fájljai: a pillanatkép mellett már nem kellenek
+        for old_name in os.listdir(SCANNER_CACHE_DIR):
+            if old_name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(SCANNER_CACHE_DIR, old_name))
+                except OSError:
+                    pass
+
+    def _make_request(self, url: str, query: Dict[str, Any], force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         HTTP kérés végrehajtása hibakezeléssel
         
+        Az azonos (url, query) párra adott sikeres válaszokat a session alatt megjegyzi
+        (legfeljebb RESPONSE_CACHE_SIZE darabot), a végponthoz tartozó cache_ttl idejéig.
+        Lemezre nem a nyers válasz, hanem a feldolgozott DataFrame kerül (lásd _write_snapshot).
+        
         Paraméterek:
         - url: API végpont URL címe
-        - data_query: JSON query string
+        - query: scanner query dictionary, itt kerül JSON bájtokká szerializálásra
+        - force_refresh: True esetén a cache-t megkerülve újra letölti az adatokat
         
         Visszatérési érték:
         - Válasz JSON vagy None hiba esetén
         """
+        data_query = _json_dumps(query)
+        cache_key = (url, data_query)
+        if not force_refresh:
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None and time.time() - cached[0] < self._url_ttl(url):
+                    self._response_cache.move_to_end(cache_key)
+                    return cached[1]
+        
         try:
-            response = requests.post(url, data=data_query, timeout=30)
+            response = self._session.post(url, data=data_query, timeout=(5, 30))
             response.raise_for_status()  # Kivételt dob rossz státuszkódok esetén
-            return response.json()
+            data = _json_loads(response.content)
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = (time.time(), data)
+                self._response_cache.move_to_end(cache_key)
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            return data
         except requests.exceptions.RequestException as e:
             logger.error(f"Sikertelen kérés {url}: {str(e)}")
             return None
@@ -63,7 +610,7 @@ class TradingViewData:
             logger.error(f"JSON válasz dekódolása sikertelen: {str(e)}")
             return None
 
-    def get_us_stocks(self) -> bool:
+    def get_us_stocks(self, force_refresh: bool = False) -> bool:
         """ 
         Letölti az összes amerikai tőzsdén (AMEX, NASDAQ, NYSE) jegyzett részvény adatát a TradingView-ról.
         
@@ -72,6 +619,9 @@ class TradingViewData:
         az árfolyam, piaci kapitalizáció, technikai indikátorok, teljesítmény mutatók és más
         fundamentális adatok.
         
+        Parameters:
+        - force_refresh: True esetén a cache-t megkerülve újra letölti az adatokat
+        
         Returns:
         - True ha sikeres, False egyébként
         
@@ -87,118 +637,36 @@ class TradingViewData:
         - JSON dekódolási hibák kezelése
         - Adatfeldolgozási hibák kezelése
         """
+        if not force_refresh:
+            snapshot = self._read_snapshot('us_stock', 'america')
+            if snapshot is not None:
+                self.us_stock = snapshot
+                logger.info(f"Pillanatképből betöltve {len(self.us_stock)} amerikai részvény")
+                return True
         
-        # Részvény adatmezők definiálása
-        stock_columns = [
-            "logoid",                     # Logo azonosító
-            "name",                       # Ticker szimbólum (pl. AAPL, MSFT)
-            "close",                      # Záróárfolyam
-            "change",                     # Árfolyamváltozás %
-            "change_abs",                 # Árfolyamváltozás abszolút értékben
-            "Recommend.All",              # Összesített ajánlás
-            "volume",                     # Forgalom (darabszám)
-            "Value.Traded",               # Forgalmazott érték dollárban
-            "market_cap_basic",           # Piaci kapitalizáció
-            "price_earnings_ttm",         # P/E ráta (TTM)
-            "earnings_per_share_basic_ttm", # EPS (TTM)
-            "number_of_employees",        # Alkalmazottak száma
-            "sector",                     # Szektor
-            "High.3M",                    # 3 havi maximum
-            "Low.3M",                     # 3 havi minimum
-            "Perf.3M",                    # 3 havi teljesítmény %
-            "Perf.5Y",                    # 5 éves teljesítmény %
-            "High.1M",                    # 1 havi maximum
-            "Low.1M",                     # 1 havi minimum
-            "High.6M",                    # 6 havi maximum
-            "Low.6M",                     # 6 havi minimum
-            "Perf.6M",                    # 6 havi teljesítmény %
-            "beta_1_year",                # Beta (1 év)
-            "price_52_week_high",         # 52 hetes maximum
-            "price_52_week_low",          # 52 hetes minimum
-            "High.All",                   # Historikus maximum
-            "Low.All",                    # Historikus minimum
-            "BB.lower",                   # Bollinger alsó sáv
-            "BB.upper",                   # Bollinger felső sáv
-            "change|1M",                  # 1 havi változás %
-            "change_abs|1M",              # 1 havi változás abszolút
-            "change|1W",                  # 1 heti változás %
-            "change_abs|1W",              # 1 heti változás abszolút
-            "change|240",                 # 240 napos változás %
-            "country",                    # Ország
-            "EMA50",                      # 50 napos exponenciális mozgóátlag
-            "EMA100",                     # 100 napos exponenciális mozgóátlag
-            "EMA200",                     # 200 napos exponenciális mozgóátlag
-            "MACD.macd",                  # MACD érték
-            "MACD.signal",                # MACD signal
-            "Mom",                        # Momentum
-            "Perf.1M",                    # 1 havi teljesítmény %
-            "RSI7",                       # RSI 7 napos
-            "SMA50",                      # 50 napos egyszerű mozgóátlag
-            "SMA100",                     # 100 napos egyszerű mozgóátlag
-            "SMA200",                     # 200 napos egyszerű mozgóátlag
-            "Stoch.RSI.K",                # Stochastic RSI K
-            "Stoch.RSI.D",                # Stochastic RSI D
-            "Perf.W",                     # Heti teljesítmény %
-            "Perf.Y",                     # Éves teljesítmény %
-            "Perf.YTD",                   # Év eleji teljesítmény %
-            "industry",                   # Iparág
-            "Perf.All",                   # Teljes historikus teljesítmény %
-            "description",                # Cég teljes neve
-            "type",                       # Instrumentum típus
-            "subtype",                    # Altípus
-            "update_mode",                # Frissítési mód
-            "pricescale",                 # Ár skála
-            "minmov",                     # Minimális mozgás
-            "fractional",                 # Töredék kereskedés
-            "minmove2",                   # Alternatív min. mozgás
-            "Mom[1]",                     # Momentum előző nap
-            "RSI7[1]",                    # RSI előző nap
-            "Rec.Stoch.RSI",              # Stochastic RSI ajánlás
-            "currency",                   # Kereskedési deviza
-            "fundamental_currency_code"    # Alapdeviza kód
-        ]
-        
-        query = {
-            "filter": [
-                {"left": "type", "operation": "in_range", "right": ["stock", "dr", "fund"]},
-                {"left": "subtype", "operation": "in_range", 
-                 "right": ["common", "foreign-issuer", "", "etf", "etf,odd", "etf,otc", "etf,cfd"]},
-                {"left": "exchange", "operation": "in_range", "right": ["AMEX", "NASDAQ", "NYSE"]},
-                {"left": "is_primary", "operation": "equal", "right": True},
-                {"left": "active_symbol", "operation": "equal", "right": True}
-            ],
-            "options": {"lang": "en"},
-            "markets": ["america"],
-            "symbols": {"query": {"types": []}, "tickers": []},
-            "columns": stock_columns,
-            "sort": {"sortBy": "market_cap_basic", "sortOrder": "desc"},
-            "range": [0, 8000]
-        }
-        
-        data_query = json.dumps(query)
-        data = self._make_request('https://scanner.tradingview.com/america/scan', data_query)
+        data = self._make_request('https://scanner.tradingview.com/america/scan', self._us_stock_query, force_refresh)
         
         if data is None or 'data' not in data:
             logger.error("Nem sikerült letölteni a részvényadatokat")
             return False
         
-        try:
-            list_elements = list(map(lambda x: x['d'], data['data']))
-            self.us_stock = pd.DataFrame(list_elements)
-            self.us_stock.columns = stock_columns
-            
-            # Pont karakteres ticker-ek kiszűrése (pl. BRK.A, BRK.B)
-            self.us_stock = self.us_stock[~self.us_stock['name'].str.contains('\\.', na=False)]
-            self.us_stock.reset_index(inplace=True, drop=True)
-            
-            logger.info(f"Sikeresen betöltve {len(self.us_stock)} amerikai részvény")
-            return True
-            
-        except (KeyError, ValueError) as e:
-            logger.error(f"Hiba a részvényadatok feldolgozásakor: {str(e)}")
+        us_stock = _scanner_frame(data, self._us_stock_columns, 'részvény')
+        if us_stock is None:
             return False
+        
+        # Pont karakteres ticker-ek kiszűrése (pl. BRK.A, BRK.B)
+        us_stock = _drop_dot_tickers(us_stock)
+        self.us_stock = _optimize_dtypes(us_stock, (
+            'sector', 'industry', 'country', 'type', 'subtype', 'update_mode',
+            'currency', 'fundamental_currency_code'
+        ))
+        
+        self._write_snapshot('us_stock', self.us_stock)
+        
+        logger.info(f"Sikeresen betöltve {len(self.us_stock)} amerikai részvény")
+        return True
     
-    def get_all_crypto(self) -> bool:
+    def get_all_crypto(self, force_refresh: bool = False) -> bool:
         """
         Letölti a top 300 kriptovaluta adatát a TradingView-ról, piaci kapitalizáció szerinti rangsorolásban.
         
@@ -206,6 +674,9 @@ class TradingViewData:
         adatokat szolgáltat, mint például: alapvaluta, piaci kapitalizáció, 24 órás forgalom,
         forgalomban lévő mennyiség, blockchain ökoszisztémák és kategóriák.
         
+        Parameters:
+        - force_refresh: True esetén a cache-t megkerülve újra letölti az adatokat
+        
         Returns:
         - True ha sikeres, False egyébként
         
@@ -220,78 +691,50 @@ class TradingViewData:
         - Automatikusan kiszűri a stablecoin-okat
         - Hozzáad egy 'ticker' oszlopot USD párral
         """
+        if not force_refresh:
+            snapshot = self._read_snapshot('crypto', 'coin')
+            if snapshot is not None:
+                self.crypto = snapshot
+                logger.info(f"Pillanatképből betöltve {len(self.crypto)} kriptovaluta")
+                return True
         
-        # Kriptovaluta adatmezők definiálása
-        crypto_columns = [
-            "base_currency",              # Alap szimbólum (pl. BTC, ETH)
-            "base_currency_desc",         # Teljes név (pl. Bitcoin, Ethereum)
-            "base_currency_logoid",       # Logo azonosító
-            "update_mode",                # Frissítési mód
-            "type",                       # Instrumentum típus
-            "typespecs",                  # Típus specifikáció
-            "exchange",                   # Tőzsde/platform
-            "crypto_total_rank",          # Általános rangsor
-            "close",                      # Aktuális árfolyam USD-ben
-            "pricescale",                 # Ár skála
-            "minmov",                     # Minimális ármozgás
-            "fractional",                 # Töredék kereskedés
-            "minmove2",                   # Alternatív minimális mozgás
-            "currency",                   # Jegyzési deviza (általában USD)
-            "24h_close_change|5",         # 24 órás változás százalékban
-            "market_cap_calc",            # Piaci kapitalizáció
-            "fundamental_currency_code",   # Alap devizakód
-            "24h_vol_cmc",                # 24 órás forgalom (CoinMarketCap)
-            "circulating_supply",         # Forgalomban lévő mennyiség
-            "crypto_common_categories",   # Kategóriák (pl. DeFi, layer-1)
-            "crypto_blockchain_ecosystems" # Blockchain ökoszisztéma
-        ]
-        
-        query = {
-            "columns": crypto_columns,
-            "ignore_unknown_fields": False,
-            "options": {"lang": "en"},
-            "range": [0, 300],
-            "sort": {"sortBy": "crypto_total_rank", "sortOrder": "asc"},
-            "markets": ["coin"]
-        }
-        
-        data_query = json.dumps(query)
-        data = self._make_request('https://scanner.tradingview.com/coin/scan', data_query)
+        data = self._make_request('https://scanner.tradingview.com/coin/scan', self._crypto_query, force_refresh)
         
         if data is None or 'data' not in data:
             logger.error("Nem sikerült letölteni a kripto adatokat")
             return False
         
-        try:
-            list_elements = list(map(lambda x: x['d'], data['data']))
-            self.crypto = pd.DataFrame(list_elements)
-            self.crypto.columns = crypto_columns
-            
-            # Stablecoin-ok kiszűrése
-            filter_mask = self.crypto['crypto_common_categories'].fillna('-').apply(
-                lambda x: 'stablecoins' not in x if isinstance(x, str) else True
-            )
-            self.crypto = self.crypto[filter_mask]
-            
-            # USD párok ticker generálása a könnyebb kereséshez
-            self.crypto['ticker'] = self.crypto['base_currency'] + '-USD'
-            
-            self.crypto.reset_index(inplace=True, drop=True)
-            
-            logger.info(f"Sikeresen betöltve {len(self.crypto)} kriptovaluta")
-            return True
-            
-        except (KeyError, ValueError) as e:
-            logger.error(f"Hiba a kripto adatok feldolgozásakor: {str(e)}")
+        crypto = _scanner_frame(data, self._crypto_columns, 'kripto')
+        if crypto is None:
             return False
+        
+        # Stablecoin-ok kiszűrése; a kategóriák listaként vagy szövegként érkeznek,
+        # szöveggé alakítva egyetlen vektorizált keresés lefedi mindkettőt
+        categories = crypto['crypto_common_categories'].astype(str)
+        crypto = crypto[~categories.str.contains('stablecoins', regex=False)].reset_index(drop=True)
+        
+        # USD párok ticker generálása a könnyebb kereséshez
+        crypto['ticker'] = crypto['base_currency'] + '-USD'
+        
+        self.crypto = _optimize_dtypes(crypto, (
+            'update_mode', 'type', 'exchange', 'currency', 'fundamental_currency_code'
+        ))
+        
+        self._write_snapshot('crypto', self.crypto)
+        
+        logger.info(f"Sikeresen betöltve {len(self.crypto)} kriptovaluta")
+        return True
     
-    def get_us_etfs(self) -> bool:
+    def get_us_etfs(self, force_refresh: bool = False) -> bool:
         """
         Letölti az amerikai ETF-ek (Exchange Traded Funds) adatait a TradingView-ról, AUM szerint rendezve.
         
         Az ETF-ek tőzsdén kereskedett alapok, amelyek index vagy árupiaci kosarakat követnek.
         A függvény körülbelül 3000 ETF adatát tölti le, beleértve az ETN-eket (Exchange Traded Notes) is.
         
+        Parameters:
+        - force_refresh: True esetén a cache-t megkerülve újra letölti az adatokat
+        
         Returns:
         - True ha sikeres, False egyébként
         
@@ -301,88 +744,36 @@ class TradingViewData:
         3. DataFrame létrehozása és oszlopnevek hozzárendelése
         4. Pont karaktert tartalmazó ticker-ek kiszűrése
         """
+        if not force_refresh:
+            snapshot = self._read_snapshot('us_etf', 'america')
+            if snapshot is not None:
+                self.us_etf = snapshot
+                logger.info(f"Pillanatképből betöltve {len(self.us_etf)} amerikai ETF")
+                return True
         
-        # ETF adatmezők definiálása
-        etf_columns = [
-            "name",                      # Ticker szimbólum
-            "description",               # ETF teljes neve
-            "logoid",                    # Logo azonosító
-            "update_mode",               # Frissítési mód
-            "type",                      # Instrumentum típus
-            "typespecs",                 # Típus specifikáció (ETF/ETN)
-            "close",                     # Aktuális/záró árfolyam
-            "pricescale",                # Ár skála
-            "minmov",                    # Minimális ármozgás
-            "fractional",                # Töredék kereskedés támogatott-e
-            "minmove2",                  # Alternatív minimális mozgás
-            "currency",                  # Kereskedési devizanem
-            "change",                    # Árfolyamváltozás
-            "Value.Traded",              # Forgalmazott érték
-            "relative_volume_10d_calc",  # 10 napos relatív volumen
-            "aum",                       # Assets Under Management (kezelt vagyon)
-            "fundamental_currency_code",  # Alapdeviza kód
-            "nav_total_return.5Y",       # 5 éves NAV teljes hozam
-            "expense_ratio",             # Költségráta
-            "asset_class.tr",            # Eszközosztály
-            "focus.tr",                  # Befektetési fókusz
-            "nav_discount_premium",      # NAV diszkont vagy prémium
-            "category.tr",               # ETF kategória
-            "brand.tr",                  # Kibocsátó márka
-            "niche.tr"                   # Speciális piaci szegmens
-        ]
-        
-        query = {
-            "columns": etf_columns,
-            "ignore_unknown_fields": False,
-            "options": {"lang": "en"},
-            "price_conversion": {"to_symbol": True},
-            "range": [0, 3000],
-            "sort": {"sortBy": "aum", "sortOrder": "desc"},
-            "markets": ["america"],
-            "filter2": {
-                "operator": "and",
-                "operands": [{
-                    "operation": {
-                        "operator": "or",
-                        "operands": [
-                            {"operation": {"operator": "and", 
-                                         "operands": [{"expression": {"left": "typespecs", 
-                                                                     "operation": "has", 
-                                                                     "right": ["etn"]}}]}},
-                            {"operation": {"operator": "and", 
-                                         "operands": [{"expression": {"left": "typespecs", 
-                                                                     "operation": "has", 
-                                                                     "right": ["etf"]}}]}}
-                        ]
-                    }
-                }]
-            }
-        }
-        
-        data_query = json.dumps(query)
-        data = self._make_request('https://scanner.tradingview.com/america/scan', data_query)
+        data = self._make_request('https://scanner.tradingview.com/america/scan', self._etf_query, force_refresh)
         
         if data is None or 'data' not in data:
             logger.error("Nem sikerült letölteni az ETF adatokat")
             return False
         
-        try:
-            list_elements = list(map(lambda x: x['d'], data['data']))
-            self.us_etf = pd.DataFrame(list_elements)
-            self.us_etf.columns = etf_columns
-            
-            # Pont karakteres ticker-ek kiszűrése
-            self.us_etf = self.us_etf[~self.us_etf['name'].str.contains('\\.', na=False)]
-            self.us_etf.reset_index(inplace=True, drop=True)
-            
-            logger.info(f"Sikeresen betöltve {len(self.us_etf)} amerikai ETF")
-            return True
-            
-        except (KeyError, ValueError) as e:
-            logger.error(f"ETF adatok feldolgozási hiba: {str(e)}")
+        us_etf = _scanner_frame(data, self._etf_columns, 'ETF')
+        if us_etf is None:
             return False
+        
+        # Pont karakteres ticker-ek kiszűrése
+        us_etf = _drop_dot_tickers(us_etf)
+        self.us_etf = _optimize_dtypes(us_etf, (
+            'update_mode', 'type', 'currency', 'fundamental_currency_code',
+            'asset_class.tr', 'focus.tr', 'category.tr', 'brand.tr', 'niche.tr'
+        ))
+        
+        self._write_snapshot('us_etf', self.us_etf)
+        
+        logger.info(f"Sikeresen betöltve {len(self.us_etf)} amerikai ETF")
+        return True
     
-    def get_eu_stocks(self, markets: list = None, replace: bool = True) -> bool:
+    def get_eu_stocks(self, markets: list = None, replace: bool = True, force_refresh: bool = False) -> bool:
         """
         Letölti az európai tőzsdék részvényadatait a TradingView-ról.
         
@@ -393,6 +784,7 @@ class TradingViewData:
         Parameters:
         - markets: európai piacok listája, alapértelmezetten ['uk', 'germany', 'poland']
         - replace: True esetén felülírja a meglévő adatokat, False esetén hozzáadja
+        - force_refresh: True esetén a cache-t megkerülve újra letölti az adatokat
         
         Returns:
         - True ha sikeres, False egyébként
@@ -403,8 +795,8 @@ class TradingViewData:
         - 'poland': Warsaw Stock Exchange (WSE)
         
         Működés:
-        1. Végigiterál a megadott piacokon
-        2. Minden piachoz külön API hívást végez
+        1. Végigiterál a megadott piacokon és összeállítja a query-ket
+        2. Minden piachoz külön API hívást végez, párhuzamosan (szálakon)
         3. Összefűzi a DataFrame-eket
         4. Hozzáadja a régió információt
         5. Eltávolítja a pont karakteres ticker-eket
@@ -431,64 +823,24 @@ class TradingViewData:
         
         all_eu_stocks = []
         
-        # Európai részvény adatmezők definiálása
-        eu_stock_columns = [
-            "logoid",                     # Logo azonosító
-            "name",                       # Ticker szimbólum
-            "close",                      # Záróárfolyam
-            "change",                     # Árfolyamváltozás %
-            "change_abs",                 # Árfolyamváltozás abszolút
-            "Recommend.All",              # Összesített ajánlás
-            "volume",                     # Forgalom
-            "Value.Traded",               # Forgalmazott érték
-            "market_cap_basic",           # Piaci kapitalizáció
-            "price_earnings_ttm",         # P/E ráta (TTM)
-            "earnings_per_share_basic_ttm", # EPS (TTM)
-            "number_of_employees",        # Alkalmazottak száma
-            "sector",                     # Szektor
-            "Perf.3M",                    # 3 havi teljesítmény %
-            "Perf.5Y",                    # 5 éves teljesítmény %
-            "Perf.1M",                    # 1 havi teljesítmény %
-            "Perf.6M",                    # 6 havi teljesítmény %
-            "Perf.W",                     # Heti teljesítmény %
-            "Perf.Y",                     # Éves teljesítmény %
-            "Perf.YTD",                   # Év eleji teljesítmény %
-            "industry",                   # Iparág
-            "Perf.All",                   # Teljes historikus teljesítmény %
-            "description",                # Cég teljes neve
-            "type",                       # Instrumentum típus
-            "currency",                   # Kereskedési deviza
-            "exchange"                    # Tőzsde neve
-        ]
-        
-        # Piaci beállítások
-        market_configs = {
-            'uk': {
-                'url': 'https://scanner.tradingview.com/uk/scan',
-                'exchanges': ['LSE', 'AIM'],
-                'currency': 'GBP'
-            },
-            'germany': {
-                'url': 'https://scanner.tradingview.com/germany/scan',
-                'exchanges': ['XETR', 'FSE', 'SWB', 'HAM', 'DUS', 'BER', 'STU', 'MUN'],
-                'currency': 'EUR'
-            },
-            'poland': {
-                'url': 'https://scanner.tradingview.com/poland/scan',
-                'exchanges': ['WSE', 'NEWCONNECT'],
-                'currency': 'PLN'
-            }
-        }
-        
+        # Query-k összeállítása a támogatott piacokra
+        requests_to_send = []
         for market in markets:
-            if market not in market_configs:
+            if market not in EU_MARKET_CONFIGS:
                 logger.warning(f"Nem támogatott piac: {market}")
                 continue
             
-            config = market_configs[market]
+            config = EU_MARKET_CONFIGS[market]
+            
+            if not force_refresh:
+                snapshot = self._read_snapshot(f"eu_stock_{market}", market)
+                if snapshot is not None:
+                    all_eu_stocks.append(snapshot)
+                    logger.info(f"Pillanatképből betöltve {market}: {len(snapshot)} részvény")
+                    continue
+            
             logger.info(f"Európai részvények letöltése: {market}")
             
-            # Query összeállítása
             query = {
                 "filter": [
                     {"left": "type", "operation": "in_range", "right": ["stock"]},
@@ -499,41 +851,41 @@ class TradingViewData:
                 "options": {"lang": "en"},
                 "markets": [market],
                 "symbols": {"query": {"types": []}, "tickers": []},
-                "columns": eu_stock_columns,
+                "columns": self._eu_stock_columns,
                 "sort": {"sortBy": "market_cap_basic", "sortOrder": "desc"},
                 "range": [0, 5000]
             }
-            
-            data_query = json.dumps(query)
-            data = self._make_request(config['url'], data_query)
-            
+            requests_to_send.append((market, config, query))
+        
+        # A piacok egymástól függetlenek, ezért a kérések párhuzamosan futnak (I/O-kötött)
+        responses = []
+        if requests_to_send:
+            with ThreadPoolExecutor(max_workers=len(requests_to_send)) as executor:
+                responses = list(executor.map(
+                    lambda req: self._make_request(req[1]['url'], req[2], force_refresh), requests_to_send
+                ))
+        
+        for (market, config, _), data in zip(requests_to_send, responses):
             if data is None or 'data' not in data:
                 logger.error(f"Nem sikerült letölteni az adatokat: {market}")
                 continue
             
-            try:
-                list_elements = list(map(lambda x: x['d'], data['data']))
-                if list_elements:
-                    market_df = pd.DataFrame(list_elements)
-                    market_df.columns = eu_stock_columns
-                    
-                    # Régió és alapértelmezett deviza hozzáadása
-                    market_df['region'] = market.upper()
-                    market_df['default_currency'] = config['currency']
-                    
-                    all_eu_stocks.append(market_df)
-                    logger.info(f"Sikeresen letöltve {market}: {len(market_df)} részvény")
+            market_df = _scanner_frame(data, self._eu_stock_columns, market)
+            if market_df is not None and not market_df.empty:
+                # Régió és alapértelmezett deviza hozzáadása
+                market_df['region'] = market.upper()
+                market_df['default_currency'] = config['currency']
                 
-            except (KeyError, ValueError) as e:
-                logger.error(f"Hiba a {market} adatok feldolgozásakor: {str(e)}")
-                continue
+                all_eu_stocks.append(market_df)
+                self._write_snapshot(f"eu_stock_{market}", market_df)
+                logger.info(f"Sikeresen letöltve {market}: {len(market_df)} részvény")
         
         if all_eu_stocks:
             # DataFrame-ek összefűzése
             new_data = pd.concat(all_eu_stocks, ignore_index=True)
             
             # Pont karakteres ticker-ek kiszűrése
-            new_data = new_data[~new_data['name'].str.contains('\\.', na=False)]
+            new_data = _drop_dot_tickers(new_data)
             
             # Hozzáadás vagy felülírás
             if replace or self.eu_stock.empty:
@@ -542,9 +894,12 @@ class TradingViewData:
                 # Hozzáadás a meglévőhöz, duplikátumok elkerülése
                 self.eu_stock = pd.concat([self.eu_stock, new_data], ignore_index=True)
                 # Duplikátumok eltávolítása ticker alapján (megtartja az újabbat)
-                self.eu_stock = self.eu_stock.drop_duplicates(subset=['name'], keep='last')
+                self.eu_stock = self.eu_stock.drop_duplicates(subset=['name'], keep='last', ignore_index=True)
             
-            self.eu_stock.reset_index(inplace=True, drop=True)
+            # Összefűzés után újra, mert eltérő kategóriájú oszlopok concat-ja object-re esik vissza
+            self.eu_stock = _optimize_dtypes(self.eu_stock, (
+                'sector', 'industry', 'region', 'type', 'currency', 'default_currency', 'exchange'
+            ))
             
             logger.info(f"Összesen {len(self.eu_stock)} európai részvény a DataFrame-ben")
             return True
@@ -576,21 +931,234 @@ class TradingViewData:
         Működés:
         1. Input validáció (szám-e a bemenet)
         2. Nagyságrend meghatározása
-        3. Megfelelő egységre konvertálás és kerekítés 2 tizedesre
+        3. Megfelelő egységre konvertálás és kerekítés 2 tizedesre (_format_money, lru_cache-elt)
         """
         if not isinstance(money, (int, float)):
             return "N/A"
         
-        if money > 1_000_000_000_000:
-            money_str = f"{round(money / 1_000_000_000_000, 2)} Trillion" 
-        elif money > 1_000_000_000:
-            money_str = f"{round(money / 1_000_000_000, 2)} Billion"
-        elif money > 1_000_000:
-            money_str = f"{round(money / 1_000_000, 2)} Million"
-        else:
-            money_str = f"{round(money, 2)}"
+        return _format_money(money)
+
+    def moneystring_vec(self, money) -> np.ndarray:
+        """
+        A moneystring vektorizált változata: egy teljes oszlopot / tömböt formáz egyszerre.
+        
+        Az eredmény elemenként megegyezik a moneystring kimenetével: a kerekítés a Python
+        round-dal azonos, hiányzó (NaN) értéknél "nan", egész bemenetnél a kis értékek
+        tizedesjegy nélkül jelennek meg.
+        Vegyes (object) tömböt, pl. None értékekkel, elemenként a moneystring formáz.
+        
+        Parameters:
+        - money: pénzösszegek (pandas Series, numpy tömb vagy lista)
+        
+        Returns:
+        - numpy string tömb a moneystring-gel azonos formátumban (pl. "45.67 Billion")
+        
+        Példa:
+        - tv_data.moneystring_vec(df['market_cap_basic'])
+        """
+        values = np.asarray(money)
+        if values.dtype.kind not in 'iuf':
+            with np.errstate(invalid='ignore'):
+                return np.frompyfunc(self.moneystring, 1, 1)(values).astype(str)
+        
+        conditions = [values > 1_000_000_000_000, values > 1_000_000_000, values > 1_000_000]
+        scales = np.select(conditions, [1_000_000_000_000, 1_000_000_000, 1_000_000], 1)
+        suffixes = np.select(conditions, [' Trillion', ' Billion', ' Million'], '')
+        
+        # A np.round a .xx5 határ közelében eltérhet a Python round-tól (x * 100 kerekítési
+        # hibája miatt), ezért ezeket a ritka elemeket a round kerekíti
+        scaled = values / scales
+        rounded = np.round(scaled, 2)
+        cents = scaled * 100
+        with np.errstate(invalid='ignore'):
+            near_half = np.abs(cents - np.floor(cents) - 0.5) <= 1e-9 * np.abs(cents) + 1e-9
+        for i in np.flatnonzero(near_half):
+            rounded.flat[i] = round(float(scaled.flat[i]), 2)
+        money_str = rounded.astype(str)
+        if values.dtype.kind in 'iu':
+            # Egész bemenetnél a moneystring a skálázatlan értéket egészként írja ki
+            money_str = np.where(scales == 1, values.astype(str), money_str)
+        return np.char.add(money_str, suffixes)
+
+    @staticmethod
+    def top_k(df: pd.DataFrame, n: int, column: str, largest: bool = True) -> pd.DataFrame:
+        """
+        Az n legnagyobb (vagy legkisebb) értékű sor egy oszlop alapján, csökkenő
+        (ill. növekvő) sorrendben - a DataFrame.nlargest / nsmallest gyorsabb változata.
+
+        Teljes rendezés helyett a np.partition adja meg az n. értéket (O(N)), az ennél
+        jobb sorok és a vele egyenlők közül az elsők kerülnek be, és csak ezt az n elemet
+        rendezi. Az eredmény (egyenlő értékek, hiányzó értékek kezelése) megegyezik az
+        nlargest / nsmallest kimenetével. Példányadatot nem használ, ezért statikus metódus.
+
+        Parameters:
+        - df: forrás DataFrame
+        - n: visszaadott sorok száma
+        - column: az oszlop, ami alapján válogat (pl. 'market_cap_basic')
+        - largest: True = legnagyobbak, False = legkisebbek
+
+        Returns:
+        - DataFrame az eredeti indexekkel
+
+        Példa:
+        - TradingViewData.top_k(tv_data.us_stock, 5, 'market_cap_basic')
+        """
+        if n <= 0:
+            return df.iloc[:0]
+
+        values = df[column].to_numpy(dtype=float)
+        valid = np.flatnonzero(~np.isnan(values))
+
+        if n >= len(valid):
+            # Kevés sornál nincs mit kiválogatni, a teljes rendezés ugyanannyiba kerül
+            return df.nlargest(n, column) if largest else df.nsmallest(n, column)
+
+        keys = -values[valid] if largest else values[valid]
+
+        # A határértékkel egyenlők közül az elsők maradnak (mint az nlargest keep='first')
+        kth = np.partition(keys, n - 1)[n - 1]
+        better = np.flatnonzero(keys < kth)
+        ties = np.flatnonzero(keys == kth)[:n - len(better)]
+        selected = np.concatenate([better, ties])
+
+        order = selected[np.argsort(keys[selected], kind='stable')]
+        return df.iloc[valid[order]]
+
+    @staticmethod
+    def _group_locations(df: pd.DataFrame, column: str) -> np.ndarray:
+        """
+        Soronként a csoporton belüli helyezés "rang/méret" szövegként (pl. "5/123"),
+        hiányzó csoportnál "N/A". A sorrend a DataFrame sorrendje (betöltéskor market cap szerint).
+        """
+        groups = df.groupby(column, observed=True)
+        rank = groups.cumcount() + 1
+        size = groups[column].transform('size')
+        locations = rank.astype('Int64').astype(str) + '/' + size.astype('Int64').astype(str)
+        return np.where(df[column].isna(), 'N/A', locations.to_numpy(dtype=object))
+
+    def _name_positions(self, frame_name: str, column: str = 'name') -> Dict[str, int]:
+        """
+        Ticker -> első sorpozíció szótár a megadott DataFrame attribútumhoz (pl. 'us_etf')
         
-        return money_str
+        Hash alapú tagságvizsgálatot és keresést ad a teljes ticker oszlop listává alakítása
+        és végigpásztázása helyett. Addig érvényes, amíg az attribútum ugyanaz az objektum marad.
+        A kriptóknál a ticker oszlop 'ticker' (pl. "BTC-USD"), máshol 'name'.
+        """
+        df = getattr(self, frame_name)
+        key = (frame_name, column)
+        cached = self._name_index_cache.get(key)
+        if cached is None or cached[0] is not df:
+            if column in df.columns:
+                names = df[column]
+                first = ~names.duplicated().to_numpy()
+                positions = dict(zip(names.to_numpy()[first], np.flatnonzero(first)))
+            else:
+                positions = {}
+            cached = (df, positions)
+            self._name_index_cache[key] = cached
+        return cached[1]
+
+    def _group_positions(self, frame_name: str, column: str) -> Dict[Any, np.ndarray]:
+        """
+        Csoportérték -> sorpozíciók szótár (pl. szektor -> a szektor részvényeinek sorai)
+        
+        A grafikonok így csak a csoport sorait veszik ki (take), nem maszkolják végig
+        minden hívásnál a teljes frame-et. Addig érvényes, amíg az attribútum ugyanaz az objektum marad.
+        """
+        df = getattr(self, frame_name)
+        key = (frame_name, column)
+        cached = self._group_index_cache.get(key)
+        if cached is None or cached[0] is not df:
+            cached = (df, df.groupby(column, observed=True, sort=False).indices)
+            self._group_index_cache[key] = cached
+        return cached[1]
+
+    def _group_frame(self, frame_name: str, column: str, value, columns) -> pd.DataFrame:
+        """
+        Egy csoport sorai eredeti sorrendben, 0-tól számozott indexszel (üres, ha nincs ilyen csoport)
+        
+        Csak a megadott oszlopokat másolja ki (a grafikonoknak 3 oszlop kell a ~60-ból).
+        """
+        positions = self._group_positions(frame_name, column).get(value, [])
+        return getattr(self, frame_name)[list(columns)].take(positions).reset_index(drop=True)
+
+    @staticmethod
+    def _performance_strings(df: pd.DataFrame) -> np.ndarray:
+        """
+        Soronként a "Teljesítmény | hét: ...% | ..." szöveg, egyetlen vektorizált lépésben
+        
+        A float32 oszlopokat kerekítés előtt float64-re alakítja, így a szöveg "1.23"
+        lesz és nem "1.2300000190734863". Hiányzó oszlop helyén 0 szerepel.
+        """
+        text = np.full(len(df), 'Teljesítmény', dtype=object)
+        for i, (label, column) in enumerate(PERFORMANCE_FIELDS):
+            if column in df.columns:
+                values = df[column].to_numpy(dtype='float64').round(2).astype(str).astype(object)
+            else:
+                values = '0'
+            text = text + (' | ' if i == 0 else '% | ') + label + ': ' + values
+        return text + '%'
+
+    def _us_stock_lookup(self):
+        """
+        Ticker -> sorpozíció index, soronként a szektoron / iparágon belüli helyezés,
+        valamint a get_one_us_stock_info által olvasott oszlopok numpy tömbjei
+        (a kész 'performance' és 'market_cap_text' szövegekkel együtt)
+        
+        Egyszer épül fel és addig érvényes, amíg a us_stock ugyanaz az objektum marad
+        (újratöltés vagy kézi felülírás után automatikusan újraépül).
+        
+        Returns:
+        - (name_to_pos, sec_locs, ind_locs, info_columns) tuple
+        """
+        if self._us_lookup_frame is not self.us_stock:
+            name_to_pos = self._name_positions('us_stock')
+            sec_locs = self._group_locations(self.us_stock, 'sector')
+            ind_locs = self._group_locations(self.us_stock, 'industry')
+            info_columns = {
+                column: self.us_stock[column].to_numpy()
+                for column in US_STOCK_INFO_COLUMNS if column in self.us_stock.columns
+            }
+            info_columns['performance'] = self._performance_strings(self.us_stock)
+            if 'market_cap_basic' in self.us_stock.columns:
+                info_columns['market_cap_text'] = self.moneystring_vec(self.us_stock['market_cap_basic']).astype(object)
+            self._us_lookup = (name_to_pos, sec_locs, ind_locs, info_columns)
+            self._us_lookup_frame = self.us_stock
+        return self._us_lookup
+
+    def _eu_stock_info_columns(self) -> Dict[str, np.ndarray]:
+        """
+        A get_one_eu_stock_info által olvasott oszlopok numpy tömbjei
+        
+        Addig érvényes, amíg az eu_stock ugyanaz az objektum marad (lásd _us_stock_lookup).
+        """
+        if self._eu_lookup_frame is not self.eu_stock:
+            self._eu_info_columns = {
+                column: self.eu_stock[column].to_numpy()
+                for column in EU_STOCK_INFO_COLUMNS if column in self.eu_stock.columns
+            }
+            self._eu_info_columns['performance'] = self._performance_strings(self.eu_stock)
+            if 'market_cap_basic' in self.eu_stock.columns:
+                self._eu_info_columns['market_cap_text'] = self.moneystring_vec(self.eu_stock['market_cap_basic']).astype(object)
+            self._eu_lookup_frame = self.eu_stock
+        return self._eu_info_columns
+
+    def _crypto_category_strings(self) -> np.ndarray:
+        """
+        Soronként a crypto_common_categories lista vesszővel összefűzve (pl. "defi, layer-1")
+        
+        Egyszer épül fel a crypto frame-hez; nem lista értéknél annak szöveges alakja szerepel.
+        """
+        if self._crypto_categories_frame is not self.crypto:
+            if 'crypto_common_categories' in self.crypto.columns:
+                self._crypto_categories = np.array([
+                    ', '.join(categories) if isinstance(categories, list) else str(categories)
+                    for categories in self.crypto['crypto_common_categories'].to_numpy()
+                ], dtype=object)
+            else:
+                self._crypto_categories = np.full(len(self.crypto), '', dtype=object)
+            self._crypto_categories_frame = self.crypto
+        return self._crypto_categories
 
     def get_one_us_stock_info(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
@@ -638,48 +1206,42 @@ class TradingViewData:
             if not self.get_us_stocks():
                 return None
         
-        # Ticker keresése
-        stock_rows = self.us_stock[self.us_stock['name'] == ticker]
+        # Ticker keresése előre felépített indexből (nincs teljes oszlop-összehasonlítás)
+        pos = self._us_stock_lookup()[0].get(ticker)
         
-        if stock_rows.empty:
+        if pos is None:
             logger.warning(f"Ticker '{ticker}' nem található az amerikai részvény adatokban")
             return None
         
         try:
-            one_row = stock_rows.iloc[0]
-            
-            # Szektor és iparági dataframe-ek lekérése
-            tsec = self.us_stock[self.us_stock['sector'] == one_row['sector']].reset_index(drop=True)
-            tind = self.us_stock[self.us_stock['industry'] == one_row['industry']].reset_index(drop=True)
-            
-            # Pozíciók megkeresése
-            sec_position = tsec.index[tsec['name'] == ticker].tolist()
-            ind_position = tind.index[tind['name'] == ticker].tolist()
-            
-            sec_loc = f"{sec_position[0] + 1}/{tsec.shape[0]}" if sec_position else "N/A"
-            ind_loc = f"{ind_position[0] + 1}/{tind.shape[0]}" if ind_position else "N/A"
-            
-            return {
-                'ticker': one_row['name'],
-                'price': one_row['close'],
-                'market_cap': one_row['market_cap_basic'],
-                'n_emp': one_row['number_of_employees'],
-                'market_cap_text': self.moneystring(one_row['market_cap_basic']),
-                'name': one_row['description'],
-                'sector': one_row['sector'],
-                'industry': one_row['industry'],
-                'sec_loc': sec_loc,
-                'ind_loc': ind_loc,
-                'performance': f"Teljesítmény | hét: {round(one_row.get('Perf.W', 0), 2)}% | "
-                              f"hónap: {round(one_row.get('Perf.1M', 0), 2)}% | "
-                              f"6 hónap: {round(one_row.get('Perf.6M', 0), 2)}% | "
-                              f"év: {round(one_row.get('Perf.Y', 0), 2)}%"
-            }
+            return self._us_stock_info(pos)
             
         except (KeyError, IndexError) as e:
             logger.error(f"Hiba a részvényinfó feldolgozásakor {ticker}: {str(e)}")
             return None
 
+    def _us_stock_info(self, pos: int) -> Dict[str, Any]:
+        """get_one_us_stock_info eredménye egy már megtalált sorpozícióhoz (újabb keresés nélkül)"""
+        _, sec_locs, ind_locs, info_columns = self._us_stock_lookup()
+        
+        # Csak a szükséges mezők, közvetlenül a tömbökből (nincs teljes pandas sor)
+        one_row = {column: values[pos] for column, values in info_columns.items()}
+        
+        return {
+            'ticker': one_row['name'],
+            'price': one_row['close'],
+            'market_cap': one_row['market_cap_basic'],
+            'n_emp': one_row['number_of_employees'],
+            'market_cap_text': one_row['market_cap_text'],
+            'name': one_row['description'],
+            'sector': one_row['sector'],
+            'industry': one_row['industry'],
+            # Pozíció a szektorban / iparágban: betöltés után egyszer kiszámolva
+            'sec_loc': sec_locs[pos],
+            'ind_loc': ind_locs[pos],
+            'performance': one_row['performance']
+        }
+
     def get_one_eu_stock_info(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
         Egyetlen európai részvény részletes információit kéri le és dolgozza fel.
@@ -724,15 +1286,16 @@ class TradingViewData:
             if not self.get_eu_stocks():
                 return None
         
-        # Ticker keresése
-        stock_rows = self.eu_stock[self.eu_stock['name'] == ticker]
+        # Ticker keresése előre felépített indexből
+        pos = self._name_positions('eu_stock').get(ticker)
         
-        if stock_rows.empty:
+        if pos is None:
             logger.warning(f"Ticker '{ticker}' nem található az európai adatokban")
             return None
         
         try:
-            one_row = stock_rows.iloc[0]
+            # Csak a szükséges mezők, közvetlenül a tömbökből (nincs teljes pandas sor)
+            one_row = {column: values[pos] for column, values in self._eu_stock_info_columns().items()}
             
             return {
                 'ticker': one_row['name'],
@@ -741,15 +1304,12 @@ class TradingViewData:
                 'region': one_row['region'],
                 'exchange': one_row.get('exchange', 'N/A'),
                 'market_cap': one_row.get('market_cap_basic', 0),
-                'market_cap_text': self.moneystring(one_row.get('market_cap_basic', 0)),
+                'market_cap_text': one_row.get('market_cap_text', '0'),
                 'name': one_row.get('description', 'N/A'),
                 'sector': one_row.get('sector', 'N/A'),
                 'industry': one_row.get('industry', 'N/A'),
                 'n_emp': one_row.get('number_of_employees', 0),
-                'performance': f"Teljesítmény | hét: {round(one_row.get('Perf.W', 0), 2)}% | "
-                              f"hónap: {round(one_row.get('Perf.1M', 0), 2)}% | "
-                              f"6 hónap: {round(one_row.get('Perf.6M', 0), 2)}% | "
-                              f"év: {round(one_row.get('Perf.Y', 0), 2)}%"
+                'performance': one_row['performance']
             }
             
         except (KeyError, IndexError) as e:
@@ -777,8 +1337,8 @@ class TradingViewData:
         Működés:
         1. Input validáció (0 < percent <= 100)
         2. Ellenőrzi hogy az adatok be vannak-e töltve
-        3. GroupBy szektoronként
-        4. Minden csoportból kiválasztja a top N%-ot
+        3. Szektoronkénti darabszám, rendezés szektor és market cap szerint (numpy, _top_percent_positions)
+        4. Szektoron belüli sorszám alapján megtartja a top N%-ot
         5. Újraindexeli és visszaadja az eredményt
         
         Hibakezelés:
@@ -795,11 +1355,8 @@ class TradingViewData:
                 return pd.DataFrame()
         
         try:
-            return (
-                self.us_stock.groupby('sector')
-                .apply(lambda x: x.nlargest(int(len(x) * (percent / 100)), 'market_cap_basic'))
-                .reset_index(drop=True)
-            )
+            positions = _top_percent_positions(self.us_stock['sector'], self.us_stock['market_cap_basic'], percent)
+            return self.us_stock.take(positions).reset_index(drop=True)
         except Exception as e:
             logger.error(f"Hiba a top amerikai részvények lekérése során szektoronként: {str(e)}")
             return pd.DataFrame()
@@ -824,62 +1381,118 @@ class TradingViewData:
         
         ticker = ticker.upper().strip()
         
+        title = self._cached_title(ticker)
+        if title is not None:
+            return title
+        
         try:
-            if '-USD' in ticker:
-                # Kripto
-                if self.crypto.empty:
-                    self.get_all_crypto()
-                
-                crypto_rows = self.crypto[self.crypto['ticker'] == ticker]
-                if not crypto_rows.empty:
-                    coin = crypto_rows.iloc[0]
-                    categories = coin.get('crypto_common_categories', [])
-                    categories_str = ', '.join(categories) if isinstance(categories, list) else str(categories)
-                    
-                    return f"{coin['base_currency_desc']} ({coin['base_currency']}) - ${self.moneystring(coin.get('market_cap_calc', 0))} - {categories_str}"
-            
-            elif ticker in self.us_etf['name'].tolist():
-                # ETF
-                if self.us_etf.empty:
-                    self.get_us_etfs()
-                    
-                etf_rows = self.us_etf[self.us_etf['name'] == ticker]
-                if not etf_rows.empty:
-                    t = etf_rows.iloc[0]
-                    return f"{t['description']} ({t['name']}) - AUM: ${self.moneystring(t.get('aum', 0))} - Fókusz: {t.get('focus.tr', 'N/A')} - Költség: {t.get('expense_ratio', 'N/A')}%"
-            
-            else:
-                # Részvény - először US, aztán EU
-                # US részvény keresése
-                stock_info = self.get_one_us_stock_info(ticker)
-                if stock_info:
-                    return f"{stock_info['name']} ({stock_info['ticker']}) [US] - ${stock_info['market_cap_text']} - {stock_info['sector']} ({stock_info['sec_loc']}) - {stock_info['industry']} ({stock_info['ind_loc']})"
-                
-                # EU részvény keresése ha US-ban nem található
-                eu_info = self.get_one_eu_stock_info(ticker)
-                if eu_info:
-                    # Régió kód meghatározása
-                    region_code = eu_info['region']
-                    if region_code == 'UK':
-                        region_tag = '[EU-UK]'
-                        currency_symbol = '£'
-                    elif region_code == 'GERMANY':
-                        region_tag = '[EU-DE]'
-                        currency_symbol = '€'
-                    elif region_code == 'POLAND':
-                        region_tag = '[EU-PL]'
-                        currency_symbol = 'PLN '
-                    else:
-                        region_tag = f'[EU-{region_code}]'
-                        currency_symbol = ''
-                    
-                    return f"{eu_info['name']} ({eu_info['ticker']}) {region_tag} - {currency_symbol}{eu_info['market_cap_text']} - {eu_info.get('sector', 'N/A')} - {eu_info.get('industry', 'N/A')}"
-            
-            return f"{ticker}"
-            
+            title = self._plotly_title(ticker)
         except Exception as e:
             logger.error(f"Hiba a plotly cím készítése során {ticker}: {str(e)}")
             return f"{ticker}"
+        
+        self._store_title(ticker, title)
+        return title
+
+    def _title_frames_changed(self) -> bool:
+        """Igaz, ha a cím cache óta bármelyik adat frame lecserélődött (újratöltés, kézi felülírás)"""
+        frames = (self.us_stock, self.us_etf, self.eu_stock, self.crypto)
+        if all(a is b for a, b in zip(frames, self._title_cache_frames)):
+            return False
+        self._title_cache.clear()
+        self._title_cache_frames = frames
+        return True
+
+    def _cached_title(self, ticker: str) -> Optional[str]:
+        """Korábban elkészített cím, ha az adatok azóta nem változtak"""
+        if self._title_frames_changed() or ticker not in self._title_cache:
+            return None
+        self._title_cache.move_to_end(ticker)
+        return self._title_cache[ticker]
+
+    def _store_title(self, ticker: str, title: str):
+        """Cím mentése a cache-be (a számítás közbeni betöltés után a régi bejegyzések törlődnek)"""
+        self._title_frames_changed()
+        self._title_cache[ticker] = title
+        if len(self._title_cache) > TITLE_CACHE_SIZE:
+            self._title_cache.popitem(last=False)
+
+    def _plotly_title(self, ticker: str) -> str:
+        """get_plotly_title tényleges számítása, cache nélkül (a ticker már nagybetűs)"""
+        if ticker.endswith('-USD'):
+            # Kripto (a ticker mindig base_currency + '-USD')
+            if self.crypto.empty:
+                self.get_all_crypto()
+            
+            pos = self._name_positions('crypto', 'ticker').get(ticker)
+            if pos is not None:
+                coin = self.crypto.iloc[pos]
+                categories_str = self._crypto_category_strings()[pos]
+                
+                return f"{coin['base_currency_desc']} ({coin['base_currency']}) - ${self.moneystring(coin.get('market_cap_calc', 0))} - {categories_str}"
+        
+        elif ticker in self._name_positions('us_etf'):
+            # ETF
+            return self._us_etf_title(self._name_positions('us_etf')[ticker])
+        
+        else:
+            # Részvény - először US, aztán EU
+            # US részvény keresése
+            stock_info = self.get_one_us_stock_info(ticker)
+            if stock_info:
+                return self._us_stock_title(stock_info)
+            
+            # EU részvény keresése ha US-ban nem található
+            eu_info = self.get_one_eu_stock_info(ticker)
+            if eu_info:
+                # Régió kód meghatározása
+                region_code = eu_info['region']
+                if region_code == 'UK':
+                    region_tag = '[EU-UK]'
+                    currency_symbol = '£'
+                elif region_code == 'GERMANY':
+                    region_tag = '[EU-DE]'
+                    currency_symbol = '€'
+                elif region_code == 'POLAND':
+                    region_tag = '[EU-PL]'
+                    currency_symbol = 'PLN '
+                else:
+                    region_tag = f'[EU-{region_code}]'
+                    currency_symbol = ''
+                
+                return f"{eu_info['name']} ({eu_info['ticker']}) {region_tag} - {currency_symbol}{eu_info['market_cap_text']} - {eu_info.get('sector', 'N/A')} - {eu_info.get('industry', 'N/A')}"
+        
+        return f"{ticker}"
+
+    @staticmethod
+    def _us_stock_title(stock_info: Dict[str, Any]) -> str:
+        """Amerikai részvény címe a get_one_us_stock_info / _us_stock_info eredményéből"""
+        return f"{stock_info['name']} ({stock_info['ticker']}) [US] - ${stock_info['market_cap_text']} - {stock_info['sector']} ({stock_info['sec_loc']}) - {stock_info['industry']} ({stock_info['ind_loc']})"
+
+    def _us_etf_title(self, pos: int) -> str:
+        """ETF címe a us_etf megadott sorpozíciójából"""
+        t = self.us_etf.iloc[pos]
+        return f"{t['description']} ({t['name']}) - AUM: ${self.moneystring(t.get('aum', 0))} - Fókusz: {t.get('focus.tr', 'N/A')} - Költség: {t.get('expense_ratio', 'N/A')}%"
+
+    @staticmethod
+    def _bar_figure(df: pd.DataFrame, x: str, y: str, text: str, title: str, y_label: str, text_label: str):
+        """
+        Oszlopdiagram közvetlenül go.Bar-ral, a px.bar-ral azonos megjelenéssel
+        
+        A px.bar minden hívásnál long-form DataFrame-et épít és validál (~20 ms néhány száz sornál);
+        itt a nyers oszloptömbök mennek át, a px által beállított attribútumokat kézzel adjuk meg.
+        """
+        # A plotly csak az első grafikonnál töltődik be; az adatlekérő metódusoknak nincs rá szükségük
+        import plotly.graph_objects as go
+        
+        return go.Figure(
+            go.Bar(
+                x=df[x].to_numpy(), y=df[y].to_numpy(), text=df[text].to_numpy(),
+                hovertemplate=f"{x}=%{{x}}<br>{y_label}=%{{y}}<br>{text_label}=%{{text}}<extra></extra>",
+                marker_color='#636efa', textposition='auto', showlegend=False
+            ),
+            layout=dict(title=title, xaxis_title=x, yaxis_title=y_label, barmode='relative')
+        )
 
     def get_us_sec_plot(self, ticker: str):
         """
@@ -902,32 +1515,30 @@ class TradingViewData:
         
         ticker = ticker.upper().strip()
         
-        if ticker in self.us_etf['name'].tolist():
+        if ticker in self._name_positions('us_etf'):
             logger.info(f"{ticker} egy ETF, használja a get_us_etf_plot függvényt helyette")
             return None
         
         try:
-            row_df = self.us_stock[self.us_stock['name'] == ticker]
-            if row_df.empty:
+            pos = self._name_positions('us_stock').get(ticker)
+            if pos is None:
                 logger.warning(f"Ticker '{ticker}' nem található")
                 return None
             
-            row_df = row_df.copy()
-            row_df.rename(columns={'description': 'Company'}, inplace=True)
-            
-            sector = row_df['sector'].iloc[0]
-            secdf = self.us_stock[self.us_stock['sector'] == sector].reset_index(drop=True).copy()
-            secdf.rename(columns={'description': 'Company'}, inplace=True)
+            # Csak a szükséges skalárok, egyszer kiolvasva (nincs teljes sor Series)
+            sector = self.us_stock['sector'].iat[pos]
+            name = self.us_stock['name'].iat[pos]
+            market_cap = self.us_stock['market_cap_basic'].iat[pos]
+            secdf = self._group_frame('us_stock', 'sector', sector, ('name', 'market_cap_basic', 'description'))
             
-            fig = px.bar(secdf, x='name', y='market_cap_basic', 
-                        title=self.get_plotly_title(ticker),
-                        labels={'market_cap_basic': 'Piaci kapitalizáció'}, 
-                        text='Company')
+            fig = self._bar_figure(secdf, 'name', 'market_cap_basic', 'description',
+                                   title=self._us_stock_title(self._us_stock_info(pos)),
+                                   y_label='Piaci kapitalizáció', text_label='Company')
             
             fig.add_annotation(
-                x=row_df['name'].iloc[0], 
-                y=row_df['market_cap_basic'].iloc[0],
-                text=f"{self.moneystring(row_df['market_cap_basic'].iloc[0])}",
+                x=name, 
+                y=market_cap,
+                text=self.moneystring(market_cap),
                 showarrow=True, align="center", bordercolor="#c7c7c7",
                 font=dict(family="Courier New, monospace", size=16, color="#214e34"),
                 borderwidth=2, borderpad=4, bgcolor="#f4fdff", opacity=0.8,
@@ -962,32 +1573,30 @@ class TradingViewData:
         
         ticker = ticker.upper().strip()
         
-        if ticker in self.us_etf['name'].tolist():
+        if ticker in self._name_positions('us_etf'):
             logger.info(f"{ticker} egy ETF, használja a get_us_etf_plot függvényt helyette")
             return None
         
         try:
-            row_df = self.us_stock[self.us_stock['name'] == ticker]
-            if row_df.empty:
+            pos = self._name_positions('us_stock').get(ticker)
+            if pos is None:
                 logger.warning(f"Ticker '{ticker}' nem található")
                 return None
             
-            row_df = row_df.copy()
-            row_df.rename(columns={'description': 'Company'}, inplace=True)
-            
-            industry = row_df['industry'].iloc[0]
-            inddf = self.us_stock[self.us_stock['industry'] == industry].reset_index(drop=True).copy()
-            inddf.rename(columns={'description': 'Company'}, inplace=True)
+            # Csak a szükséges skalárok, egyszer kiolvasva (nincs teljes sor Series)
+            industry = self.us_stock['industry'].iat[pos]
+            name = self.us_stock['name'].iat[pos]
+            market_cap = self.us_stock['market_cap_basic'].iat[pos]
+            inddf = self._group_frame('us_stock', 'industry', industry, ('name', 'market_cap_basic', 'description'))
             
-            fig = px.bar(inddf, x='name', y='market_cap_basic',
-                        title=self.get_plotly_title(ticker),
-                        labels={'market_cap_basic': 'Piaci kapitalizáció'},
-                        text='Company')
+            fig = self._bar_figure(inddf, 'name', 'market_cap_basic', 'description',
+                                   title=self._us_stock_title(self._us_stock_info(pos)),
+                                   y_label='Piaci kapitalizáció', text_label='Company')
             
             fig.add_annotation(
-                x=row_df['name'].iloc[0],
-                y=row_df['market_cap_basic'].iloc[0],
-                text=f"{self.moneystring(row_df['market_cap_basic'].iloc[0])}",
+                x=name,
+                y=market_cap,
+                text=self.moneystring(market_cap),
                 showarrow=True, align="center", bordercolor="#c7c7c7",
                 font=dict(family="Courier New, monospace", size=16, color="#214e34"),
                 borderwidth=2, borderpad=4, bgcolor="#f4fdff", opacity=0.8,
@@ -1023,23 +1632,25 @@ class TradingViewData:
         ticker = ticker.upper().strip()
         
         try:
-            row_df = self.us_etf[self.us_etf['name'] == ticker]
-            if row_df.empty:
+            pos = self._name_positions('us_etf').get(ticker)
+            if pos is None:
                 logger.warning(f"ETF '{ticker}' nem található")
                 return None
             
-            focus = row_df['focus.tr'].iloc[0]
-            focdf = self.us_etf[self.us_etf['focus.tr'] == focus].reset_index(drop=True)
+            # Csak a szükséges skalárok, egyszer kiolvasva (nincs teljes sor Series)
+            focus = self.us_etf['focus.tr'].iat[pos]
+            name = self.us_etf['name'].iat[pos]
+            aum = self.us_etf['aum'].iat[pos]
+            focdf = self._group_frame('us_etf', 'focus.tr', focus, ('name', 'aum', 'description'))
             
-            fig = px.bar(focdf, x='name', y='aum',
-                        title=self.get_plotly_title(ticker),
-                        labels={'aum': 'Kezelt vagyon (AUM)'},
-                        text='description')
+            fig = self._bar_figure(focdf, 'name', 'aum', 'description',
+                                   title=self._us_etf_title(pos),
+                                   y_label='Kezelt vagyon (AUM)', text_label='description')
             
             fig.add_annotation(
-                x=row_df['name'].iloc[0],
-                y=row_df['aum'].iloc[0],
-                text=f"{self.moneystring(row_df['aum'].iloc[0])}",
+                x=name,
+                y=aum,
+                text=self.moneystring(aum),
                 showarrow=True, align="center", bordercolor="#c7c7c7",
                 font=dict(family="Courier New, monospace", size=16, color="#214e34"),
                 borderwidth=2, borderpad=4, bgcolor="#f4fdff", opacity=0.8,
@@ -1109,8 +1720,7 @@ if __name__ == "__main__":
     print("\nVégső európai részvény megoszlás:")
     if not tv_data.eu_stock.empty:
         region_counts = tv_data.eu_stock['region'].value_counts()
-        for region, count in region_counts.items():
-            print(f"  {region}: {count} részvény")
+        print(region_counts.to_string(header=False))
     print()
     
     # ============= EGYEDI INFORMÁCIÓK =============
@@ -1144,8 +1754,8 @@ if __name__ == "__main__":
         tech_stocks = top_stocks[top_stocks['sector'] == 'Electronic Technology'].head(3)
         if not tech_stocks.empty:
             print("\nElectronic Technology top 3:")
-            for _, row in tech_stocks.iterrows():
-                print(f"  {row['name']}: ${tv_data.moneystring(row['market_cap_basic'])}")
+            tech_stocks = tech_stocks.assign(money_str=tv_data.moneystring_vec(tech_stocks['market_cap_basic']))
+            print(tech_stocks[['name', 'money_str']].to_string(index=False, header=False))
     
     # ============= SEGÉDFÜGGVÉNYEK =============
     
@@ -1197,30 +1807,28 @@ if __name__ == "__main__":
     # Amerikai részvények
     if not tv_data.us_stock.empty:
         print(f"\nAmerikai részvények top 5 piaci kap szerint:")
-        top5 = tv_data.us_stock.nlargest(5, 'market_cap_basic')[['name', 'market_cap_basic', 'sector']]
-        for _, row in top5.iterrows():
-            print(f"  {row['name']}: ${tv_data.moneystring(row['market_cap_basic'])} ({row['sector']})")
+        top5 = tv_data.top_k(tv_data.us_stock, 5, 'market_cap_basic')[['name', 'market_cap_basic', 'sector']]
+        top5 = top5.assign(money_str=tv_data.moneystring_vec(top5['market_cap_basic']))
+        print(top5[['name', 'money_str', 'sector']].to_string(index=False, header=False))
     
     # Európai részvények régiónként
     if not tv_data.eu_stock.empty:
         print(f"\nEurópai részvények régiónként:")
         region_counts = tv_data.eu_stock['region'].value_counts()
-        for region, count in region_counts.items():
-            print(f"  {region}: {count} részvény")
+        print(region_counts.to_string(header=False))
     
     # Kriptók top 5
     if not tv_data.crypto.empty:
         print(f"\nTop 5 kriptovaluta:")
         top5_crypto = tv_data.crypto.head(5)[['base_currency', 'market_cap_calc']]
-        for _, row in top5_crypto.iterrows():
-            print(f"  {row['base_currency']}: ${tv_data.moneystring(row['market_cap_calc'])}")
+        top5_crypto = top5_crypto.assign(money_str=tv_data.moneystring_vec(top5_crypto['market_cap_calc']))
+        print(top5_crypto[['base_currency', 'money_str']].to_string(index=False, header=False))
     
     # Amerikai ETF-ek fókusz szerint
     if not tv_data.us_etf.empty:
         print(f"\nAmerikai ETF-ek fókusz szerint (top 5 kategória):")
         focus_counts = tv_data.us_etf['focus.tr'].value_counts().head(5)
-        for focus, count in focus_counts.items():
-            print(f"  {focus}: {count} ETF")
+        print(focus_counts.to_string(header=False))
     
     print("\n" + "="*50)
     print("PÉLDA FUTTATÁS VÉGE")
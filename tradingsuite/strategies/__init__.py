@@ -2,7 +2,7 @@
 
 from .rsi import rsi_strategy, show_indicator_rsi_strategy
 from .smma_ribbon import smma_ribbon_strategy, show_indicator_smma_ribbon_strategy
-from .sma200 import sma200_strategy, show_indicator_sma200_strategy
+from .sma200 import sma200_strategy, show_indicator_sma200_strategy, add_sma200_indicators, sma200_strategy_batch
 
 __all__ = [
     'rsi_strategy',
@@ -10,5 +10,7 @@ __all__ = [
     'smma_ribbon_strategy',
     'show_indicator_smma_ribbon_strategy',
     'sma200_strategy',
-    'show_indicator_sma200_strategy'
+    'show_indicator_sma200_strategy',
+    'add_sma200_indicators',
+    'sma200_strategy_batch'
 ]
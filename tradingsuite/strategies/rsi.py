@@ -141,16 +141,16 @@ def show_indicator_rsi_strategy(ticker, buy_threshold = 30, sell_threshold = 70,
     fig.add_trace(go.Scatter(x=tdf['date'], y=tdf['sma_200'], opacity=0.7, line=dict(color='red', width=2.5), name='SMA 200'), row=1, col=1)
 
     # Add trade points and annotations
-    for index, row in trades.iterrows():
-        buy_date = row['buy_date']
-        sell_date = row['sell_date']
-        buy_price = row['buy_price']
-        sell_price = row['sell_price']
-        trade_id = row['trade_id']
-        status = row['status']
-        triangle_color = 'green' if row['result'] > 1 else 'red'
+    for row in trades.itertuples(index=False):
+        buy_date = row.buy_date
+        sell_date = row.sell_date
+        buy_price = row.buy_price
+        sell_price = row.sell_price
+        trade_id = row.trade_id
+        status = row.status
+        triangle_color = 'green' if row.result > 1 else 'red'
 
-        rise = (row['result'] - 1) * 100
+        rise = (row.result - 1) * 100
 
         if rise > 100:
             if status == 'closed':
@@ -159,9 +159,9 @@ def show_indicator_rsi_strategy(ticker, buy_threshold = 30, sell_threshold = 70,
                 result = f'Up:{round(((rise + 100) / 100), 2)}x <br> Still open'
         else:
             if status == 'closed':
-                result = f"{round(((row['result'] - 1) * 100), 2)}%"
+                result = f"{round(((row.result - 1) * 100), 2)}%"
             else:
-                result = f"{round(((row['result'] - 1) * 100), 2)}% <br> Still open"
+                result = f"{round(((row.result - 1) * 100), 2)}% <br> Still open"
 
         # add buy
         buy_point = (buy_date, buy_price)
@@ -191,7 +191,7 @@ def show_indicator_rsi_strategy(ticker, buy_threshold = 30, sell_threshold = 70,
         # add rectangle
         fig.add_shape(type="rect", x0=buy_point[0], y0=buy_point[1], x1=sell_point[0], y1=sell_point[1],
                       line=dict(color=triangle_color, width=2,), fillcolor="LightSkyBlue", opacity=0.3,
-                      label=dict(text=f"{result}<br>{row['days_in_trade']} days",
+                      label=dict(text=f"{result}<br>{row.days_in_trade} days",
                                 textposition="bottom center",
                                 font=dict(size=13, color=triangle_color, family="Times New Roman")))
 
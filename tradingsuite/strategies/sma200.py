@@ -1,3 +1,10 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import inspect
+import logging
+import os
+
 from IPython.display import display
 import numpy as np
 import pandas as pd
@@ -9,57 +16,84 @@ import plotly.express as px
 # Import the required modules
 try:
     # When used as a package
-    from ..data.market_data import MarketData
+    from ..data.market_data import MarketData, get_market_df
     from ..analysis.backtest import Backtest
 except ImportError:
     # When used as standalone
-    from tradingsuite.data.market_data import MarketData
+    from tradingsuite.data.market_data import MarketData, get_market_df
     from tradingsuite.analysis.backtest import Backtest
 
+logger = logging.getLogger(__name__)
 
-def sma200_strategy(data, 
-                    rsi_period=14,
-                    rsi_threshold=65,
-                    sma_long=200,
-                    sma_short=50,
-                    slope_period=10,
-                    breakout_period=20,
-                    atr_period=14,
-                    atr_multiplier_body=1.0,
-                    atr_multiplier_stop=2.0,
-                    atr_multiplier_trail=2.0,
-                    max_rise_period=20,
-                    max_rise_percent=15.0):
+# Price columns the indicators are calculated from
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+
+def _price_fingerprint(df):
+    """Hash of the OHLC values, ties precomputed indicators to the prices they came from"""
+    h = hashlib.sha1(usedforsecurity=False)
+    for c in PRICE_COLUMNS:
+        h.update(np.ascontiguousarray(df[c].to_numpy(dtype=float)))
+    return h.hexdigest()
+
+
+def _indicator_columns(sma_long, sma_short):
+    """Columns added by add_sma200_indicators"""
+    return ['rsi', f'sma_{sma_long}', f'sma_{sma_short}', 'atr', 'rolling_high',
+            'sma_long_slope', 'price_rise_pct', 'body_size']
+
+
+def _has_sma200_indicators(data, indicator_params):
     """
-    Conservative trend-following strategy with RSI filter and breakout confirmation
+    True if data is an add_sma200_indicators result for these parameters and its current prices
+    
+    pandas carries attrs through copy(), assign() and concat(), so the parameters alone
+    don't prove the columns are valid: the prices must still be the ones they came from.
+    """
+    return (data.attrs.get('sma200_indicators') == indicator_params
+            and all(c in data.columns for c in _indicator_columns(indicator_params['sma_long'],
+                                                               indicator_params['sma_short']))
+            and data.attrs.get('sma200_prices') == _price_fingerprint(data))
+
+
+def add_sma200_indicators(data,
+                          rsi_period=14,
+                          sma_long=200,
+                          sma_short=50,
+                          slope_period=10,
+                          breakout_period=20,
+                          atr_period=14,
+                          max_rise_period=20):
+    """
+    Calculate the indicator columns used by sma200_strategy
+    
+    The returned DataFrame remembers the indicator parameters and a hash of its prices, so
+    passing it to sma200_strategy with the same parameters skips the indicator calculation.
+    Useful for parameter sweeps where only the thresholds/multipliers change. If the prices
+    are edited (or frames are concatenated), the indicators are calculated again.
     
     Parameters:
     - data: pandas DataFrame with columns: date, open, high, low, close, volume
-    - rsi_period: int, default 14, RSI calculation period
-    - rsi_threshold: float, default 65, maximum RSI for entry (filter overbought)
-    - sma_long: int, default 200, long-term SMA period for trend filter
-    - sma_short: int, default 50, short-term SMA period for exit
-    - slope_period: int, default 10, period to check SMA200 slope
-    - breakout_period: int, default 20, period for high breakout
-    - atr_period: int, default 14, ATR calculation period
-    - atr_multiplier_body: float, default 1.0, minimum candle body size in ATR units
-    - atr_multiplier_stop: float, default 2.0, stop loss distance in ATR units
-    - atr_multiplier_trail: float, default 2.0, trailing stop distance in ATR units
-    - max_rise_period: int, default 20, period to check for parabolic move
-    - max_rise_percent: float, default 15.0, maximum rise % to avoid parabolic moves
+    - rsi_period, sma_long, sma_short, slope_period, breakout_period, atr_period,
+      max_rise_period: same as in sma200_strategy
+    
+    Return: copy of the DataFrame with the indicator columns added
     """
     
-    # Create a copy to avoid modifying original data
-    df = data.copy()
+    # Shallow copy: only whole columns are assigned below, so the original data is
+    # never modified and the price columns don't have to be duplicated
+    df = data.copy(deep=False)
     
-    # Calculate required indicators if not present
-    if 'rsi' not in df.columns:
+    # Calculate required indicators if not present; columns of an earlier
+    # add_sma200_indicators call may be stale (other parameters or edited prices)
+    recalculate = 'sma200_indicators' in data.attrs
+    if recalculate or 'rsi' not in df.columns:
         df['rsi'] = ta.rsi(df['close'], length=rsi_period)
     
-    if f'sma_{sma_long}' not in df.columns:
+    if recalculate or f'sma_{sma_long}' not in df.columns:
         df[f'sma_{sma_long}'] = ta.sma(df['close'], length=sma_long)
     
-    if f'sma_{sma_short}' not in df.columns:
+    if recalculate or f'sma_{sma_short}' not in df.columns:
         df[f'sma_{sma_short}'] = ta.sma(df['close'], length=sma_short)
     
     # Calculate ATR
@@ -77,133 +111,219 @@ def sma200_strategy(data,
     # Calculate candle body size
     df['body_size'] = abs(df['close'] - df['open'])
     
-    # Trading logic
+    df.attrs['sma200_indicators'] = dict(
+        rsi_period=rsi_period, sma_long=sma_long, sma_short=sma_short,
+        slope_period=slope_period, breakout_period=breakout_period,
+        atr_period=atr_period, max_rise_period=max_rise_period
+    )
+    df.attrs['sma200_prices'] = _price_fingerprint(df)
+    return df
+
+
+def _sma200_trades(entry_ok, open_, close, low, atr, sma_short_values, start,
+                   atr_multiplier_stop, atr_multiplier_trail):
+    """
+    Stateful trade loop of sma200_strategy over plain NumPy arrays
+    
+    Return: (signal_idx, exit_idx, stop_losses, stop_hits) lists, one item per trade:
+    the bar of the entry signal, the bar of the exit signal (-1 if the trade is still
+    open at the end), the initial stop loss and whether the exit was the trailing stop
+    """
+    signal_idx, exit_idx, stop_losses, stop_hits = [], [], [], []
+    last = len(close) - 1
     in_trade = False
-    trade_id = 1
-    all_trades = []
-    temp_trade = {}
     trailing_stop = 0
     highest_price = 0
     
-    for i in range(max(sma_long, breakout_period, max_rise_period) + 1, len(df)):
+    for i in range(start, len(close)):
         
         if not in_trade:
-            # Entry conditions
-            # 1. RSI filter: RSI < threshold
-            rsi_ok = df['rsi'].iloc[i] < rsi_threshold
-            
-            # 2. Trend filter: Close > SMA200 and SMA200 slope positive
-            trend_ok = (df['close'].iloc[i] > df[f'sma_{sma_long}'].iloc[i] and 
-                       df['sma_long_slope'].iloc[i])
-            
-            # 3. Breakout trigger: Close > 20-day high
-            breakout_ok = df['close'].iloc[i] > df['rolling_high'].iloc[i]
-            
-            # 4. ATR body size: candle body >= 1 * ATR
-            body_ok = df['body_size'].iloc[i] >= (atr_multiplier_body * df['atr'].iloc[i])
-            
-            # 5. Parabolic move filter: not risen more than max_rise_percent in last max_rise_period days
-            not_parabolic = df['price_rise_pct'].iloc[i] <= max_rise_percent
-            
-            # 6. Doji/long wick filter
-            candle_range = df['high'].iloc[i] - df['low'].iloc[i]
-            body = df['body_size'].iloc[i]
-            upper_wick = df['high'].iloc[i] - max(df['open'].iloc[i], df['close'].iloc[i])
-            
-            # Avoid doji (body < 10% of range) and long upper wick (wick > 2x body)
-            not_doji = body >= (0.1 * candle_range) if candle_range > 0 else False
-            not_long_wick = upper_wick <= (2 * body) if body > 0 else True
-            candle_ok = not_doji and not_long_wick
-            
-            # ALL CONDITIONS MUST BE TRUE
-            if (rsi_ok and trend_ok and breakout_ok and body_ok and 
-                not_parabolic and candle_ok and 
-                pd.notna(df['atr'].iloc[i])):
-                
-                # Enter trade at next bar's open
-                if i == (len(df) - 1):
-                    entry_price = df['close'].iloc[i]
-                    entry_data = df.iloc[i]
-                else:
-                    entry_price = df['open'].iloc[i+1]
-                    entry_data = df.iloc[i+1]
-                
-                temp_trade['buy_price'] = entry_price
-                temp_trade.update(dict(entry_data.add_prefix('buy_')))
-                temp_trade['trade_id'] = trade_id
-                temp_trade['status'] = 'open'
-                
+            if entry_ok[i]:
                 # Calculate stop loss: entry candle low - 2*ATR
-                entry_low = df['low'].iloc[i]
-                stop_distance = atr_multiplier_stop * df['atr'].iloc[i]
-                temp_trade['stop_loss'] = entry_low - stop_distance
-                
-                # Initialize trailing stop and highest price
-                trailing_stop = temp_trade['stop_loss']
-                highest_price = entry_price
+                stop_loss = low[i] - atr_multiplier_stop * atr[i]
+                signal_idx.append(i)
+                stop_losses.append(stop_loss)
                 
+                # Initialize trailing stop and highest price (entry at next bar's open)
+                trailing_stop = stop_loss
+                highest_price = close[i] if i == last else open_[i + 1]
                 in_trade = True
         
         else:
             # Exit conditions
-            current_price = df['close'].iloc[i]
+            current_price = close[i]
             
             # Update highest price and trailing stop
             if current_price > highest_price:
                 highest_price = current_price
-                new_trailing_stop = highest_price - (atr_multiplier_trail * df['atr'].iloc[i])
+                new_trailing_stop = highest_price - (atr_multiplier_trail * atr[i])
                 trailing_stop = max(trailing_stop, new_trailing_stop)
             
             # Exit condition 1: Trailing stop hit
-            stop_hit = df['low'].iloc[i] <= trailing_stop
+            stop_hit = low[i] <= trailing_stop
             
             # Exit condition 2: Close below SMA50
-            below_sma50 = df['close'].iloc[i] < df[f'sma_{sma_short}'].iloc[i]
+            below_sma50 = current_price < sma_short_values[i]
             
             if stop_hit or below_sma50:
-                # Exit trade
-                if i == (len(df) - 1):
-                    exit_price = df['close'].iloc[i]
-                    exit_data = df.iloc[i]
-                else:
-                    exit_price = df['open'].iloc[i+1]
-                    exit_data = df.iloc[i+1]
-                
-                temp_trade['sell_price'] = exit_price
-                temp_trade.update(dict(exit_data.add_prefix('sell_')))
-                temp_trade['trade_id'] = trade_id
-                temp_trade['status'] = 'closed'
-                temp_trade['exit_reason'] = 'trailing_stop' if stop_hit else 'below_sma50'
-                
-                # Calculate results
-                temp_trade['result'] = temp_trade['sell_price'] / temp_trade['buy_price']
-                temp_trade['days_in_trade'] = (temp_trade['sell_date'] - temp_trade['buy_date']).days
-                
+                exit_idx.append(i)
+                stop_hits.append(stop_hit)
                 in_trade = False
-                trade_id += 1
-                all_trades.append(temp_trade)
-                temp_trade = {}
                 trailing_stop = 0
                 highest_price = 0
     
-    # Close any open trade at the end
-    if temp_trade:
-        temp_trade['sell_price'] = df['close'].iloc[-1]
-        temp_trade['trade_id'] = trade_id
-        temp_trade['sell_date'] = df['date'].iloc[-1]
-        temp_trade['exit_reason'] = 'end_of_data'
+    if in_trade:
+        exit_idx.append(-1)
+        stop_hits.append(False)
+    
+    return signal_idx, exit_idx, stop_losses, stop_hits
+
+
+def sma200_strategy(data, 
+                    rsi_period=14,
+                    rsi_threshold=65,
+                    sma_long=200,
+                    sma_short=50,
+                    slope_period=10,
+                    breakout_period=20,
+                    atr_period=14,
+                    atr_multiplier_body=1.0,
+                    atr_multiplier_stop=2.0,
+                    atr_multiplier_trail=2.0,
+                    max_rise_period=20,
+                    max_rise_percent=15.0):
+    """
+    Conservative trend-following strategy with RSI filter and breakout confirmation
+    
+    Parameters:
+    - data: pandas DataFrame with columns: date, open, high, low, close, volume
+      (or the output of add_sma200_indicators to reuse precomputed indicators)
+    - rsi_period: int, default 14, RSI calculation period
+    - rsi_threshold: float, default 65, maximum RSI for entry (filter overbought)
+    - sma_long: int, default 200, long-term SMA period for trend filter
+    - sma_short: int, default 50, short-term SMA period for exit
+    - slope_period: int, default 10, period to check SMA200 slope
+    - breakout_period: int, default 20, period for high breakout
+    - atr_period: int, default 14, ATR calculation period
+    - atr_multiplier_body: float, default 1.0, minimum candle body size in ATR units
+    - atr_multiplier_stop: float, default 2.0, stop loss distance in ATR units
+    - atr_multiplier_trail: float, default 2.0, trailing stop distance in ATR units
+    - max_rise_period: int, default 20, period to check for parabolic move
+    - max_rise_percent: float, default 15.0, maximum rise % to avoid parabolic moves
+    """
+    
+    indicator_params = dict(
+        rsi_period=rsi_period, sma_long=sma_long, sma_short=sma_short,
+        slope_period=slope_period, breakout_period=breakout_period,
+        atr_period=atr_period, max_rise_period=max_rise_period
+    )
+    
+    # Reuse the indicators if they were already calculated with the same parameters and prices
+    if _has_sma200_indicators(data, indicator_params):
+        df = data
+    else:
+        df = add_sma200_indicators(data, **indicator_params)
+    
+    # Raw arrays: the loop below reads scalars from these instead of df[...].iloc[i]
+    open_ = df['open'].to_numpy(dtype=float)
+    high = df['high'].to_numpy(dtype=float)
+    low = df['low'].to_numpy(dtype=float)
+    close = df['close'].to_numpy(dtype=float)
+    atr = df['atr'].to_numpy(dtype=float)
+    sma_short_values = df[f'sma_{sma_short}'].to_numpy(dtype=float)
+    body = df['body_size'].to_numpy(dtype=float)
+    
+    # Entry conditions for every bar at once (NaN comparisons are False, as in the scalar checks)
+    with np.errstate(invalid='ignore'):
+        # 1. RSI filter: RSI < threshold
+        rsi_ok = df['rsi'].to_numpy(dtype=float) < rsi_threshold
+        
+        # 2. Trend filter: Close > SMA200 and SMA200 slope positive
+        trend_ok = (close > df[f'sma_{sma_long}'].to_numpy(dtype=float)) & df['sma_long_slope'].to_numpy(dtype=bool)
+        
+        # 3. Breakout trigger: Close > 20-day high
+        breakout_ok = close > df['rolling_high'].to_numpy(dtype=float)
+        
+        # 4. ATR body size: candle body >= 1 * ATR
+        body_ok = body >= atr_multiplier_body * atr
+        
+        # 5. Parabolic move filter: not risen more than max_rise_percent in last max_rise_period days
+        not_parabolic = df['price_rise_pct'].to_numpy(dtype=float) <= max_rise_percent
         
-        temp_trade['result'] = temp_trade['sell_price'] / temp_trade['buy_price']
-        temp_trade['days_in_trade'] = (temp_trade['sell_date'] - temp_trade['buy_date']).days
-        all_trades.append(temp_trade)
+        # 6. Doji/long wick filter
+        candle_range = high - low
+        upper_wick = high - np.maximum(open_, close)
+        
+        # Avoid doji (body < 10% of range) and long upper wick (wick > 2x body)
+        not_doji = (candle_range > 0) & (body >= 0.1 * candle_range)
+        not_long_wick = ~(body > 0) | (upper_wick <= 2 * body)
+        candle_ok = not_doji & not_long_wick
+    
+    # ALL CONDITIONS MUST BE TRUE
+    entry_ok = rsi_ok & trend_ok & breakout_ok & body_ok & not_parabolic & candle_ok & ~np.isnan(atr)
+    
+    # Trading logic: only the stateful trailing stop remains a per-bar loop
+    start = max(sma_long, breakout_period, max_rise_period) + 1
+    signal_idx, exit_idx, stop_losses, stop_hits = _sma200_trades(
+        entry_ok, open_, close, low, atr, sma_short_values, start,
+        atr_multiplier_stop, atr_multiplier_trail
+    )
     
     # Create results DataFrame
-    if not all_trades:
+    if not signal_idx:
         # Return empty DataFrame with expected columns
         return pd.DataFrame(columns=['result', 'buy_price', 'sell_price', 'buy_date', 
                                     'sell_date', 'days_in_trade', 'trade_id', 'status'])
     
-    res_df = pd.DataFrame(all_trades)
+    signal_idx = np.asarray(signal_idx)
+    exit_idx = np.asarray(exit_idx)
+    closed = exit_idx >= 0
+    n_trades = len(signal_idx)
+    
+    # Trades are entered / exited at the next bar's open (at the close on the last bar)
+    last = len(df) - 1
+    entry_rows = np.minimum(signal_idx + 1, last)
+    exit_rows = np.minimum(exit_idx[closed] + 1, last)
+    buy_price = np.where(signal_idx == last, close[signal_idx], open_[entry_rows])
+    
+    # A trade still open at the end is closed at the last close (its other sell_ columns stay empty)
+    sell_price = np.full(n_trades, close[-1])
+    sell_price[closed] = np.where(exit_idx[closed] == last, close[exit_idx[closed]], open_[exit_rows])
+    
+    # Columns in the order the per-trade records used to produce them; the entry / exit rows
+    # are taken in two bulk iloc calls instead of df.iloc[i].add_prefix(...) per trade
+    columns = {'buy_price': buy_price}
+    buy_rows = df.iloc[entry_rows].reset_index(drop=True)
+    for c in df.columns:
+        columns['buy_' + str(c)] = buy_rows[c]
+    columns['trade_id'] = np.arange(1, n_trades + 1)
+    columns['status'] = np.where(closed, 'closed', 'open').astype(object)
+    
+    # Stop loss: entry candle low - 2*ATR (the trailing stop starts from here)
+    columns['stop_loss'] = np.asarray(stop_losses, dtype=float)
+    columns['sell_price'] = sell_price
+    if closed.any():
+        sell_rows = df.iloc[exit_rows].set_axis(np.flatnonzero(closed)).reindex(range(n_trades))
+        for c in df.columns:
+            columns['sell_' + str(c)] = sell_rows[c]
+    sell_date_rows = np.full(n_trades, last)
+    sell_date_rows[closed] = exit_rows
+    columns['sell_date'] = df['date'].iloc[sell_date_rows].reset_index(drop=True)
+    columns['exit_reason'] = np.where(
+        closed, np.where(stop_hits, 'trailing_stop', 'below_sma50'), 'end_of_data'
+    ).astype(object)
+    
+    res_df = pd.DataFrame(columns)
+    
+    # Whole days between entry and exit, in one subtraction on datetime64 values
+    # (the date column of MarketData holds datetime.date objects)
+    dates = df['date'].to_numpy()
+    buy_dates = dates[entry_rows].astype('datetime64[us]')
+    sell_dates = dates[sell_date_rows].astype('datetime64[us]')
+    
+    # Calculate results
+    res_df['result'] = res_df['sell_price'] / res_df['buy_price']
+    res_df['days_in_trade'] = (sell_dates - buy_dates) // np.timedelta64(1, 'D')
     
     # Reorder columns
     all_col = res_df.columns.tolist()
@@ -215,6 +335,86 @@ def sma200_strategy(data,
     return res_df
 
 
+# Indicator parameters of add_sma200_indicators with their defaults
+_INDICATOR_DEFAULTS = {name: param.default
+                       for name, param in inspect.signature(add_sma200_indicators).parameters.items()
+                       if name != 'data'}
+
+# Maximum number of indicator sets kept by one sma200_strategy_batch worker
+INDICATOR_CACHE_SIZE = 32
+
+# Input data and indicator cache of sma200_strategy_batch in the worker processes
+_batch_data = None
+_batch_indicators = OrderedDict()
+
+
+def _cached_indicators(data, params, cache):
+    """
+    add_sma200_indicators of data for the indicator parameters in params, memoized in cache
+    
+    Threshold/multiplier sweeps share one indicator set, so it is calculated only once.
+    The cache belongs to one input DataFrame, keys are the indicator parameters only.
+    """
+    key = tuple(params.get(name, default) for name, default in _INDICATOR_DEFAULTS.items())
+    df = cache.get(key)
+    if df is None:
+        df = add_sma200_indicators(data, **dict(zip(_INDICATOR_DEFAULTS, key)))
+        cache[key] = df
+        if len(cache) > INDICATOR_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return df
+
+
+def _init_batch_worker(data):
+    """Store the input data in the worker process (sent once per worker, not once per task)"""
+    global _batch_data
+    _batch_data = data
+    _batch_indicators.clear()
+
+
+def _run_batch_params(params):
+    """Run sma200_strategy with one parameter set on the worker's data"""
+    return sma200_strategy(_cached_indicators(_batch_data, params, _batch_indicators), **params)
+
+
+def sma200_strategy_batch(data, param_grid, max_workers=None, chunksize=None):
+    """
+    Run sma200_strategy for every parameter set of a sweep in parallel processes
+    
+    The runs are independent, so they are spread over a process pool. The data is sent
+    to each worker only once, and each worker calculates the indicators only once per
+    distinct set of indicator parameters (rsi_period, sma_long, ...).
+    
+    Parameters:
+    - data: pandas DataFrame, same as in sma200_strategy
+    - param_grid: iterable of dicts with sma200_strategy keyword arguments
+    - max_workers: int, default None (number of CPUs), number of worker processes,
+      1 runs the sweep in the current process
+    - chunksize: int, default None (automatic), number of parameter sets sent to a worker at once
+    
+    Return: list of trade DataFrames, in the order of param_grid
+    """
+    param_grid = list(param_grid)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(param_grid))
+    
+    if max_workers <= 1:
+        cache = OrderedDict()
+        return [sma200_strategy(_cached_indicators(data, params, cache), **params)
+                for params in param_grid]
+    
+    if chunksize is None:
+        # A few chunks per worker: balances the load without paying the IPC cost per run
+        chunksize = max(1, len(param_grid) // (max_workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker,
+                             initargs=(data,)) as executor:
+        return list(executor.map(_run_batch_params, param_grid, chunksize=chunksize))
+
+
 def show_indicator_sma200_strategy(ticker, 
                                    rsi_period=14,
                                    rsi_threshold=65,
@@ -258,9 +458,8 @@ def show_indicator_sma200_strategy(ticker,
     - use_tradingview_title: bool, default False, use TradingViewData to get a formatted title
     """
     
-    # Load data
-    stock_data = StockData(ticker)
-    tdf = stock_data.df
+    # Load data (cached, so plotting a ticker that was already backtested does not download it again)
+    tdf = get_market_df(ticker)
     
     # Run backtest
     backtest = Backtest(
@@ -337,8 +536,12 @@ def show_indicator_sma200_strategy(ticker,
     )
     
     # Add trade points and annotations
+    # Markers, annotations and shapes are collected first and added to the figure at once
     if not trades.empty:
-        for index, row in trades.iterrows():
+        buy_x, buy_y, sell_x, sell_y, colors = [], [], [], [], []
+        annotations, shapes = [], []
+        
+        for row in trades.to_dict('records'):
             buy_date = row['buy_date']
             sell_date = row['sell_date']
             buy_price = row['buy_price']
@@ -360,67 +563,69 @@ def show_indicator_sma200_strategy(ticker,
                 else:
                     result = f"{round(((row['result'] - 1) * 100), 2)}% <br> Still open"
             
-            # Add buy marker
-            buy_point = (buy_date, buy_price)
-            triangle_trace = go.Scatter(
-                x=[buy_point[0]], y=[buy_point[1]], mode='markers',
-                marker=dict(symbol='triangle-up', size=16, color=triangle_color)
-            )
-            fig.add_trace(triangle_trace, row=1, col=1)
-            fig.add_annotation(
-                x=buy_date, y=buy_price, 
+            # Buy and sell markers
+            buy_x.append(buy_date)
+            buy_y.append(buy_price)
+            sell_x.append(sell_date)
+            sell_y.append(sell_price)
+            colors.append(triangle_color)
+            
+            annotations.append(dict(
+                x=buy_date, y=buy_price, xref='x', yref='y',
                 text=f"Buy: ${round(buy_price, 2)}<br>#{trade_id}",
                 showarrow=True, align="center", bordercolor="#c7c7c7",
                 font=dict(family="Courier New, monospace", size=12, color=triangle_color),
                 borderwidth=2, borderpad=4, bgcolor="#f4fdff", opacity=0.8,
                 arrowhead=2, arrowsize=1, arrowwidth=1, ax=30, ay=30,
-                hovertext=f"Buy: ${round(buy_price, 2)}",
-                row=1, col=1
-            )
-            
-            # Add sell marker
-            sell_point = (sell_date, sell_price)
-            triangle_trace = go.Scatter(
-                x=[sell_point[0]], y=[sell_point[1]], mode='markers',
-                marker=dict(symbol='triangle-down', size=16, color=triangle_color)
-            )
-            fig.add_trace(triangle_trace, row=1, col=1)
+                hovertext=f"Buy: ${round(buy_price, 2)}"
+            ))
             
             exit_reason = row.get('exit_reason', 'unknown')
-            fig.add_annotation(
-                x=sell_date, y=sell_price,
+            annotations.append(dict(
+                x=sell_date, y=sell_price, xref='x', yref='y',
                 text=f"Sell: ${round(sell_price, 2)}<br>#{trade_id}, {result}<br>{exit_reason}",
                 showarrow=True, align="center", bordercolor="#c7c7c7",
                 font=dict(family="Courier New, monospace", size=12, color=triangle_color),
                 borderwidth=2, borderpad=4, bgcolor="#f4fdff", opacity=0.8,
                 arrowhead=2, arrowsize=1, arrowwidth=1, ax=-30, ay=-30,
-                hovertext=f"Sell: ${round(sell_price, 2)}<br>#{trade_id}, {result}",
-                row=1, col=1
-            )
+                hovertext=f"Sell: ${round(sell_price, 2)}<br>#{trade_id}, {result}"
+            ))
             
-            # Add rectangle showing trade duration
-            fig.add_shape(
-                type="rect", x0=buy_point[0], y0=buy_point[1], 
-                x1=sell_point[0], y1=sell_point[1],
+            # Rectangle showing trade duration
+            shapes.append(dict(
+                type="rect", x0=buy_date, y0=buy_price, 
+                x1=sell_date, y1=sell_price, xref='x', yref='y',
                 line=dict(color=triangle_color, width=2),
                 fillcolor="LightSkyBlue", opacity=0.3,
                 label=dict(
                     text=f"{result}<br>{row['days_in_trade']} days",
                     textposition="bottom center",
                     font=dict(size=13, color=triangle_color, family="Times New Roman")
-                ),
-                row=1, col=1
-            )
+                )
+            ))
             
-            # Add stop loss line
+            # Stop loss line
             if 'stop_loss' in row:
-                fig.add_shape(
+                shapes.append(dict(
                     type="line",
                     x0=buy_date, x1=sell_date,
-                    y0=row['stop_loss'], y1=row['stop_loss'],
-                    line=dict(color="red", width=1, dash="dot"),
-                    row=1, col=1
-                )
+                    y0=row['stop_loss'], y1=row['stop_loss'], xref='x', yref='y',
+                    line=dict(color="red", width=1, dash="dot")
+                ))
+        
+        fig.add_trace(
+            go.Scatter(x=buy_x, y=buy_y, mode='markers',
+                       marker=dict(symbol='triangle-up', size=16, color=colors)),
+            row=1, col=1
+        )
+        fig.add_trace(
+            go.Scatter(x=sell_x, y=sell_y, mode='markers',
+                       marker=dict(symbol='triangle-down', size=16, color=colors)),
+            row=1, col=1
+        )
+        # The subplot titles are annotations too, so the trade annotations are appended to them
+        fig.update_layout(annotations=list(fig.layout.annotations) + annotations,
+                          shapes=list(fig.layout.shapes) + shapes)
     
     # Update layout
     fig.update_layout(
@@ -488,23 +693,17 @@ def show_indicator_sma200_strategy(ticker,
     # Add ATR line
     if 'atr' in tdf.columns:
         # Clean ATR data - remove NaN values
-        atr_clean = tdf[['date', 'atr']].dropna()
-        
-        # Debug info
-        print(f"\n🔍 ATR DEBUG INFO:")
-        print(f"   Total rows in tdf: {len(tdf)}")
-        print(f"   Rows with ATR data: {len(atr_clean)}")
+        atr_values = tdf['atr'].dropna()
+        logger.debug("ATR rows: %d of %d", len(atr_values), len(tdf))
         
-        if len(atr_clean) > 0:
+        if len(atr_values) > 0:
             fig.add_trace(
                 go.Scatter(x=tdf['date'], y=tdf['atr'],
                           line=dict(color='purple', width=2), name='ATR'),
                 row=3, col=1
             )
-        
-        # Set y-axis range for ATR to ensure visibility
-        atr_values = tdf['atr'].dropna()
-        if len(atr_values) > 0:
+            
+            # Set y-axis range for ATR to ensure visibility
             atr_min = atr_values.min()
             atr_max = atr_values.max()
             atr_padding = (atr_max - atr_min) * 0.1  # 10% padding
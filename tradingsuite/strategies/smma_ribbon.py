@@ -8,11 +8,11 @@ import plotly.express as px
 # Import the required modules
 try:
     # When used as a package
-    from ..data.market_data import MarketData
+    from ..data.market_data import MarketData, smma
     from ..analysis.backtest import Backtest
 except ImportError:
     # When used as standalone
-    from tradingsuite.data.market_data import MarketData
+    from tradingsuite.data.market_data import MarketData, smma
     from tradingsuite.analysis.backtest import Backtest
 
 
@@ -31,22 +31,11 @@ def smma_ribbon_strategy(data, buy_at='gold', sell_at='grey'):
 
     data['hl2'] = (data['high'] + data['low'])/2
 
-    def smma(data, window, colname):
-        hl2 = data['hl2'].values
-        smma_values = [hl2[0]]
-
-        for i in range(1, len(hl2)):
-            smma_val = (smma_values[-1] * (window - 1) + hl2[i]) / window
-            smma_values.append(smma_val)
-
-        data[colname] = smma_values
-        return data
-
     # Apply SMMA to the dataframe
-    data = smma(data, 15, 'v1')
-    data = smma(data, 19, 'v2')
-    data = smma(data, 25, 'v3')
-    data = smma(data, 29, 'v4')
+    data['v1'] = smma(data['hl2'], 15)
+    data['v2'] = smma(data['hl2'], 19)
+    data['v3'] = smma(data['hl2'], 25)
+    data['v4'] = smma(data['hl2'], 29)
 
     data['color'] = 'grey'  # Set default color to grey
 
@@ -143,22 +132,11 @@ def show_indicator_smma_ribbon_strategy(ticker, plot_title='', buy_at='gold', se
     #### data preparation
     data['hl2'] = (data['high'] + data['low'])/2
 
-    def smma(data, window, colname):
-        hl2 = data['hl2'].values
-        smma_values = [hl2[0]]
-
-        for i in range(1, len(hl2)):
-            smma_val = (smma_values[-1] * (window - 1) + hl2[i]) / window
-            smma_values.append(smma_val)
-
-        data[colname] = smma_values
-        return data
-
     # Apply SMMA to the dataframe
-    data = smma(data, 15, 'v1')
-    data = smma(data, 19, 'v2')
-    data = smma(data, 25, 'v3')
-    data = smma(data, 29, 'v4')
+    data['v1'] = smma(data['hl2'], 15)
+    data['v2'] = smma(data['hl2'], 19)
+    data['v3'] = smma(data['hl2'], 25)
+    data['v4'] = smma(data['hl2'], 29)
 
     data['color'] = 'grey'  # Set default color to grey
 
@@ -228,16 +206,16 @@ def show_indicator_smma_ribbon_strategy(ticker, plot_title='', buy_at='gold', se
         fig.add_trace(trace_v4)
 
     # Add trade points and annotations
-    for index, row in trades.iterrows():
-        buy_date = row['buy_date']
-        sell_date = row['sell_date']
-        buy_price = row['buy_price']
-        sell_price = row['sell_price']
-        trade_id = row['trade_id']
-        status = row['status']
-        triangle_color = 'green' if row['result'] > 1 else 'red'
+    for row in trades.itertuples(index=False):
+        buy_date = row.buy_date
+        sell_date = row.sell_date
+        buy_price = row.buy_price
+        sell_price = row.sell_price
+        trade_id = row.trade_id
+        status = row.status
+        triangle_color = 'green' if row.result > 1 else 'red'
 
-        rise = (row['result'] - 1) * 100
+        rise = (row.result - 1) * 100
 
         if rise > 100:
             if status == 'closed':
@@ -246,9 +224,9 @@ def show_indicator_smma_ribbon_strategy(ticker, plot_title='', buy_at='gold', se
                 result = f'Up:{round(((rise + 100) / 100), 2)}x <br> Still open'
         else:
             if status == 'closed':
-                result = f"{round(((row['result'] - 1) * 100), 2)}%"
+                result = f"{round(((row.result - 1) * 100), 2)}%"
             else:
-                result = f"{round(((row['result'] - 1) * 100), 2)}% <br> Still open"
+                result = f"{round(((row.result - 1) * 100), 2)}% <br> Still open"
 
         # add buy
         buy_point = (buy_date, buy_price)
@@ -278,7 +256,7 @@ def show_indicator_smma_ribbon_strategy(ticker, plot_title='', buy_at='gold', se
         # add rectangle
         fig.add_shape(type="rect", x0=buy_point[0], y0=buy_point[1], x1=sell_point[0], y1=sell_point[1],
                      line=dict(color=triangle_color, width=2,), fillcolor="LightSkyBlue", opacity=0.3,
-                     label=dict(text=f"{result}<br>{row['days_in_trade']} days",
+                     label=dict(text=f"{result}<br>{row.days_in_trade} days",
                                textposition="bottom center",
                                font=dict(size=13, color=triangle_color, family="Times New Roman")))
 
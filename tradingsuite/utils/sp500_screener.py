@@ -7,33 +7,91 @@ All filter methods are now independent and chainable.
 import pandas as pd
 import numpy as np
 import cloudscraper
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
-from datetime import datetime
 import logging
+import os
+import threading
 import time
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 try:
-    from ..data.market_data import MarketData
+    from ..data.market_data import CACHE_DIR, _cache_ttl, _download_market_df, _fresh_market_df
     from ..data.tradingview_data import TradingViewData
 except ImportError:
-    from tradingsuite.data.market_data import MarketData
+    from tradingsuite.data.market_data import CACHE_DIR, _cache_ttl, _download_market_df, _fresh_market_df
     from tradingsuite.data.tradingview_data import TradingViewData
 
 
+def _remove_cache_files(prefix: str) -> None:
+    """Delete the files in CACHE_DIR whose name starts with prefix."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(prefix):
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError as e:
+                logger.warning(f"Could not remove cache file {name}: {str(e)}")
+
+
+# Shared by all RSI download workers: Yahoo requests start at least `delay` seconds apart
+_request_lock = threading.Lock()
+_last_request = 0.0
+
+
+def _wait_for_request_slot(delay: float) -> None:
+    """Block until delay seconds have passed since the previous request of any worker."""
+    global _last_request
+    with _request_lock:
+        wait = _last_request + delay - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request = time.monotonic()
+
+
 class SP500Loader:
     """Loads current S&P 500 companies from Wikipedia."""
     
+    # Table shared by all loaders, so new screeners in the same session don't re-download it:
+    # (load time, DataFrame), expires together with the disk copy
+    _sp500_cache: Optional[Tuple[float, pd.DataFrame]] = None
+    
     def __init__(self):
         self.scraper = cloudscraper.create_scraper()
         self.sp500_df = None
         self.url = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
     
-    def load(self) -> pd.DataFrame:
-        """Download current S&P 500 companies list from Wikipedia."""
+    def load(self, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Download current S&P 500 companies list from Wikipedia.
+        
+        Args:
+            use_cache: If True, reuse the table downloaded in the last 24 hours
+                (in this session or saved under CACHE_DIR).
+            
+        Returns:
+            DataFrame of the S&P 500 companies
+        """
+        ttl = _cache_ttl('1d')
+        cached = SP500Loader._sp500_cache
+        if use_cache and cached is not None and time.time() - cached[0] < ttl:
+            self.sp500_df = cached[1].copy()
+            return self.sp500_df
+        
+        # The list rarely changes, so the parsed table is kept on disk (one file, like get_market_df)
+        cache_path = os.path.join(CACHE_DIR, 'sp500.pkl')
+        _remove_cache_files('sp500_')  # daily files of earlier versions
+        loaded_at = os.path.getmtime(cache_path) if os.path.exists(cache_path) else 0
+        if use_cache and time.time() - loaded_at < ttl:
+            self.sp500_df = pd.read_pickle(cache_path)
+            SP500Loader._sp500_cache = (loaded_at, self.sp500_df.copy())
+            logger.info(f"Loaded {len(self.sp500_df)} S&P 500 companies from cache")
+            return self.sp500_df
+        
         try:
             logger.info(f"Downloading S&P 500 data from Wikipedia...")
             response = self.scraper.get(self.url)
@@ -43,6 +101,15 @@ class SP500Loader:
                 self.sp500_df['Date added'], 
                 errors='coerce'
             )
+            SP500Loader._sp500_cache = (time.time(), self.sp500_df.copy())
+            # Atomic write (temp file + os.replace), so a parallel loader never reads a partial pickle
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                self.sp500_df.to_pickle(tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write S&P 500 cache: {str(e)}")
             logger.info(f"Successfully loaded {len(self.sp500_df)} S&P 500 companies")
             return self.sp500_df
         except Exception as e:
@@ -97,7 +164,7 @@ class SP500Screener:
         """
         Filter for the N most recently added companies to S&P 500.
         
-        Sorts current filtered dataset by 'Date added' and takes top N.
+        Selects the top N of the current filtered dataset by 'Date added'.
         Note: If called multiple times, it operates on already filtered data.
         For flexible limiting after other filters, use .limit(n) instead.
         
@@ -111,8 +178,11 @@ class SP500Screener:
         if self.filtered_df is None:
             self.load_sp500_data()
         
-        sorted_df = self.filtered_df.sort_values('Date added', ascending=not newest)
-        self.filtered_df = sorted_df.head(n).copy()
+        # Partial selection of the N rows instead of sorting the whole table
+        if newest:
+            self.filtered_df = self.filtered_df.nlargest(n, 'Date added')
+        else:
+            self.filtered_df = self.filtered_df.nsmallest(n, 'Date added')
         
         direction = "newest" if newest else "oldest"
         logger.info(f"Filtered to {len(self.filtered_df)} {direction} additions")
@@ -123,9 +193,7 @@ class SP500Screener:
         if self.filtered_df is None:
             self.load_sp500_data()
         
-        sector_df = self.filtered_df[
-            self.filtered_df['GICS Sector'] == sector
-        ].copy()
+        sector_df = self.filtered_df[self.filtered_df['GICS Sector'] == sector]
         
         if len(sector_df) == 0:
             logger.warning(f"No companies found in sector: {sector}")
@@ -143,9 +211,7 @@ class SP500Screener:
         if self.filtered_df is None:
             self.load_sp500_data()
         
-        industry_df = self.filtered_df[
-            self.filtered_df['GICS Sub-Industry'] == industry
-        ].copy()
+        industry_df = self.filtered_df[self.filtered_df['GICS Sub-Industry'] == industry]
         
         if len(industry_df) == 0:
             logger.warning(f"No companies found in industry: {industry}")
@@ -258,7 +324,7 @@ class SP500Screener:
             return self
         
         original_count = len(self.filtered_df)
-        self.filtered_df = self.filtered_df.head(n).copy()
+        self.filtered_df = self.filtered_df.head(n)
         
         logger.info(f"Limited results from {original_count} to {len(self.filtered_df)} companies")
         return self
@@ -288,17 +354,14 @@ class SP500Screener:
             return self
         
         tv_stocks = self.tradingview_data.us_stock
-        matched_stocks = tv_stocks[tv_stocks['name'].isin(tickers)].copy()
+        matched_stocks = tv_stocks[tv_stocks['name'].isin(tickers)]
         
         if len(matched_stocks) == 0:
             logger.warning("No market cap data found for filtered tickers")
             return self
         
         # Select top N by market cap (largest or smallest)
-        if largest:
-            top_stocks = matched_stocks.nlargest(n, 'market_cap_basic')
-        else:
-            top_stocks = matched_stocks.nsmallest(n, 'market_cap_basic')
+        top_stocks = TradingViewData.top_k(matched_stocks, n, 'market_cap_basic', largest=largest)
         
         top_tickers = top_stocks['name'].tolist()
         
@@ -336,9 +399,91 @@ class SP500Screener:
         logger.info(f"Filtered to {len(self.filtered_df)} {direction} market cap companies")
         return self
     
+    @staticmethod
+    def _latest_rsi(ticker: str, range: str, interval: str, delay: float,
+                    use_cache: bool) -> Optional[dict]:
+        """
+        Latest RSI, close and date of one ticker (runs in a worker thread of _calculate_rsi).
+        
+        The data comes from the get_market_df cache while it is fresh, otherwise it is
+        downloaded (and cached). Downloads of all workers start at least delay seconds
+        apart, so the request rate does not grow with max_workers.
+        
+        Returns:
+            Dict with Symbol, RSI, Close and Date, or None if the ticker failed
+        """
+        df = _fresh_market_df(ticker, range, interval) if use_cache else None
+        try:
+            if df is None:
+                _wait_for_request_slot(delay)
+                df = _download_market_df(ticker, range, interval)
+            
+            if df is None or len(df) == 0:
+                logger.warning(f"No data available for {ticker}")
+                return None
+            
+            if 'rsi' not in df.columns:
+                logger.warning(f"RSI column not found for {ticker}")
+                return None
+            
+            latest_rsi = df['rsi'].iloc[-1]
+            
+            if pd.isna(latest_rsi):
+                logger.warning(f"RSI is NaN for {ticker}")
+                return None
+            
+            return {
+                'Symbol': ticker,
+                'RSI': round(latest_rsi, 1),
+                'Close': round(df['close'].iloc[-1], 2),
+                'Date': df['date'].iloc[-1]
+            }
+        
+        except Exception as e:
+            logger.warning(f"Error calculating RSI for {ticker}: {str(e)}")
+            return None
+    
+    def _calculate_rsi(self, tickers: List[str], rsi_period: int, range: str,
+                       interval: str, delay: float, use_cache: bool,
+                       max_workers: int) -> pd.DataFrame:
+        """
+        Latest RSI, close and date for each ticker.
+        
+        The price data goes through the get_market_df cache (memory + disk, 24h for daily
+        and 1h for intraday data), so repeated RSI filters only download expired tickers.
+        The downloads are I/O-bound, so they run concurrently in a thread pool.
+        
+        Returns:
+            DataFrame with Symbol, RSI, Close and Date columns (failed tickers are left out)
+        """
+        _remove_cache_files('sp500_rsi_')  # daily RSI files of earlier versions
+        logger.info(f"Calculating RSI({rsi_period}) for {len(tickers)} tickers "
+                    f"({max_workers} workers, {delay}s delay between requests)...")
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._latest_rsi, ticker, range, interval, delay, use_cache): ticker
+                       for ticker in tickers}
+            for i, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                
+                if i % 10 == 0:
+                    successful = sum(result is not None for result in results.values())
+                    logger.info(f"Progress: {i}/{len(tickers)} tickers processed ({successful} successful)")
+        
+        # Keep the order of the tickers, not the order of completion
+        rsi_results = [results[ticker] for ticker in tickers if results[ticker] is not None]
+        failed_tickers = [ticker for ticker in tickers if results[ticker] is None]
+        
+        if len(failed_tickers) > 0:
+            logger.info(f"Failed to calculate RSI for {len(failed_tickers)} tickers: {', '.join(failed_tickers[:10])}{'...' if len(failed_tickers) > 10 else ''}")
+        
+        return pd.DataFrame(rsi_results, columns=['Symbol', 'RSI', 'Close', 'Date'])
+    
     def filter_by_rsi(self, n: int = 10, rsi_period: int = 14, 
                       range: str = '1y', interval: str = '1d', 
-                      delay: float = 0.5, lowest: bool = True) -> 'SP500Screener':
+                      delay: float = 0.5, lowest: bool = True,
+                      use_cache: bool = True, max_workers: int = 8) -> 'SP500Screener':
         """
         Filter for N companies by RSI values.
         
@@ -347,8 +492,12 @@ class SP500Screener:
             rsi_period: RSI period for calculation (default 14)
             range: Time range for data (default '1y')
             interval: Data interval (default '1d')
-            delay: Delay in seconds between API calls to avoid rate limiting (default 0.5)
+            delay: Minimum delay in seconds between two API calls (shared by all workers)
+                to avoid rate limiting (default 0.5)
             lowest: If True, get lowest RSI. If False, get highest RSI.
+            use_cache: If True, reuse price data cached by get_market_df while it is fresh.
+                If False, download every ticker again (and refresh the cache).
+            max_workers: Number of concurrent downloads (default 8)
             
         Returns:
             Self for method chaining
@@ -363,63 +512,14 @@ class SP500Screener:
             return self
         
         direction = "lowest" if lowest else "highest"
-        logger.info(f"Calculating RSI({rsi_period}) for {len(tickers)} tickers (with {delay}s delay between requests)...")
-        
-        rsi_results = []
-        failed_tickers = []
-        
-        for i, ticker in enumerate(tickers, 1):
-            try:
-                md = MarketData(ticker=ticker, ad_ticker=False, 
-                               range=range, interval=interval)
-                
-                if md.df is None or len(md.df) == 0:
-                    logger.warning(f"No data available for {ticker}")
-                    failed_tickers.append(ticker)
-                    continue
-                
-                if 'rsi' not in md.df.columns:
-                    logger.warning(f"RSI column not found for {ticker}")
-                    failed_tickers.append(ticker)
-                    continue
-                
-                latest_rsi = md.df['rsi'].iloc[-1]
-                
-                if pd.notna(latest_rsi):
-                    rsi_results.append({
-                        'Symbol': ticker,
-                        'RSI': round(latest_rsi, 1),
-                        'Close': round(md.df['close'].iloc[-1], 2),
-                        'Date': md.df['date'].iloc[-1]
-                    })
-                else:
-                    logger.warning(f"RSI is NaN for {ticker}")
-                    failed_tickers.append(ticker)
-                
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(tickers)} tickers processed ({len(rsi_results)} successful)")
-                
-                # Add delay between requests to avoid rate limiting
-                if i < len(tickers):  # Don't sleep after the last ticker
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                logger.warning(f"Error calculating RSI for {ticker}: {str(e)}")
-                failed_tickers.append(ticker)
-                # Still add delay even on error to avoid hammering the API
-                if i < len(tickers):
-                    time.sleep(delay)
-                continue
+        rsi_df = self._calculate_rsi(tickers, rsi_period, range, interval, delay, use_cache,
+                                     max_workers)
         
-        if len(failed_tickers) > 0:
-            logger.info(f"Failed to calculate RSI for {len(failed_tickers)} tickers: {', '.join(failed_tickers[:10])}{'...' if len(failed_tickers) > 10 else ''}")
-        
-        if len(rsi_results) == 0:
+        if len(rsi_df) == 0:
             logger.warning("No RSI data calculated successfully")
             self.filtered_df = pd.DataFrame()
             return self
         
-        rsi_df = pd.DataFrame(rsi_results)
         rsi_df = rsi_df.sort_values('RSI', ascending=lowest).head(n)
         
         self.filtered_df = self.filtered_df.merge(
@@ -435,7 +535,8 @@ class SP500Screener:
     
     def filter_by_rsi_range(self, min_rsi: float, max_rsi: float, 
                             rsi_period: int = 14, range: str = '1y', 
-                            interval: str = '1d', delay: float = 0.5) -> 'SP500Screener':
+                            interval: str = '1d', delay: float = 0.5,
+                            use_cache: bool = True, max_workers: int = 8) -> 'SP500Screener':
         """
         Filter companies with RSI between min and max values.
         
@@ -445,7 +546,10 @@ class SP500Screener:
             rsi_period: RSI period for calculation (default 14)
             range: Time range for data (default '1y')
             interval: Data interval (default '1d')
-            delay: Delay in seconds between API calls (default 0.5)
+            delay: Minimum delay in seconds between two API calls (shared by all workers, default 0.5)
+            use_cache: If True, reuse price data cached by get_market_df while it is fresh.
+                If False, download every ticker again (and refresh the cache).
+            max_workers: Number of concurrent downloads (default 8)
             
         Returns:
             Self for method chaining
@@ -459,59 +563,15 @@ class SP500Screener:
             logger.warning("No tickers to calculate RSI for")
             return self
         
-        logger.info(f"Calculating RSI({rsi_period}) for {len(tickers)} tickers (filtering range {min_rsi}-{max_rsi})...")
-        
-        rsi_results = []
-        failed_tickers = []
+        rsi_df = self._calculate_rsi(tickers, rsi_period, range, interval, delay, use_cache,
+                                     max_workers)
+        rsi_df = rsi_df[rsi_df['RSI'].between(min_rsi, max_rsi)]
         
-        for i, ticker in enumerate(tickers, 1):
-            try:
-                md = MarketData(ticker=ticker, ad_ticker=False, 
-                               range=range, interval=interval)
-                
-                if md.df is None or len(md.df) == 0:
-                    logger.warning(f"No data available for {ticker}")
-                    failed_tickers.append(ticker)
-                    continue
-                
-                if 'rsi' not in md.df.columns:
-                    logger.warning(f"RSI column not found for {ticker}")
-                    failed_tickers.append(ticker)
-                    continue
-                
-                latest_rsi = md.df['rsi'].iloc[-1]
-                
-                if pd.notna(latest_rsi) and min_rsi <= latest_rsi <= max_rsi:
-                    rsi_results.append({
-                        'Symbol': ticker,
-                        'RSI': round(latest_rsi, 1),
-                        'Close': round(md.df['close'].iloc[-1], 2),
-                        'Date': md.df['date'].iloc[-1]
-                    })
-                
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(tickers)} tickers processed ({len(rsi_results)} in range)")
-                
-                if i < len(tickers):
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                logger.warning(f"Error calculating RSI for {ticker}: {str(e)}")
-                failed_tickers.append(ticker)
-                if i < len(tickers):
-                    time.sleep(delay)
-                continue
-        
-        if len(failed_tickers) > 0:
-            logger.info(f"Failed to calculate RSI for {len(failed_tickers)} tickers")
-        
-        if len(rsi_results) == 0:
+        if len(rsi_df) == 0:
             logger.warning(f"No companies found with RSI in range {min_rsi}-{max_rsi}")
             self.filtered_df = pd.DataFrame()
             return self
         
-        rsi_df = pd.DataFrame(rsi_results)
-        
         self.filtered_df = self.filtered_df.merge(
             rsi_df[['Symbol', 'RSI', 'Close', 'Date']], 
             on='Symbol', 
@@ -548,17 +608,14 @@ class SP500Screener:
             return self
         
         tv_stocks = self.tradingview_data.us_stock
-        matched_stocks = tv_stocks[tv_stocks['name'].isin(tickers)].copy()
+        matched_stocks = tv_stocks[tv_stocks['name'].isin(tickers)]
         
         if len(matched_stocks) == 0:
             logger.warning("No market cap data found for filtered tickers")
             return self
         
         # Filter by market cap range
-        filtered_stocks = matched_stocks[
-            (matched_stocks['market_cap_basic'] >= min_cap) & 
-            (matched_stocks['market_cap_basic'] <= max_cap)
-        ].copy()
+        filtered_stocks = matched_stocks[matched_stocks['market_cap_basic'].between(min_cap, max_cap)]
         
         if len(filtered_stocks) == 0:
             logger.warning(f"No companies found with market cap between ${min_cap:,.0f} and ${max_cap:,.0f}")
@@ -616,10 +673,7 @@ class SP500Screener:
         start = pd.to_datetime(start_date)
         end = pd.to_datetime(end_date)
         
-        date_filtered = self.filtered_df[
-            (self.filtered_df['Date added'] >= start) & 
-            (self.filtered_df['Date added'] <= end)
-        ].copy()
+        date_filtered = self.filtered_df[self.filtered_df['Date added'].between(start, end)]
         
         if len(date_filtered) == 0:
             logger.warning(f"No companies found added between {start_date} and {end_date}")
@@ -638,6 +692,17 @@ class SP500Screener:
             self.load_sp500_data()
         
         return self.filtered_df.copy()
+    
+    def get_tickers(self) -> List[str]:
+        """Get the ticker symbols of the filtered results without copying the DataFrame."""
+        if self.filtered_df is None:
+            logger.warning("No data loaded. Loading S&P 500 data...")
+            self.load_sp500_data()
+        
+        if len(self.filtered_df) == 0:
+            return []
+        
+        return self.filtered_df['Symbol'].tolist()
 
 
 if __name__ == "__main__":
@@ -686,7 +751,7 @@ if __name__ == "__main__":
     print(result3[['Symbol', 'Security', 'Date added']].to_string(index=False))
     
     print("\n6. Complete workflow with RSI filtering...")
-    print("(Note: RSI calculation includes 0.5s delay between tickers to avoid rate limiting)")
+    print("(Note: RSI downloads run in parallel, requests start at least 0.5s apart to avoid rate limiting)")
     result4 = (screener
                .reset_filters()
                .filter_by_sector('Energy')
@@ -371,16 +371,16 @@ class USIndexTickerCollector:
         
         logger.info("\n🏆 TOP 10 BY MARKET CAP:")
         top10 = self.df_equity.nlargest(10, 'MarketCap')[['Ticker', 'Indices', 'LongName', 'MarketCap']]
-        for idx, row in top10.iterrows():
-            mc = row['MarketCap']
+        for row in top10.itertuples(index=False):
+            mc = row.MarketCap
             if mc >= 1e12:
                 cap_str = f"${mc/1e12:.2f}T"
             elif mc >= 1e9:
                 cap_str = f"${mc/1e9:.2f}B"
             else:
                 cap_str = f"${mc/1e6:.2f}M"
-            longname = str(row['LongName'])[:35] if row['LongName'] else 'N/A'
-            logger.info(f"  {row['Ticker']:6} [{row['Indices']:25}] {longname:35} - {cap_str}")
+            longname = str(row.LongName)[:35] if row.LongName else 'N/A'
+            logger.info(f"  {row.Ticker:6} [{row.Indices:25}] {longname:35} - {cap_str}")
         
         logger.info("\n" + "="*80)
 
@@ -428,7 +428,7 @@ if __name__ == "__main__":
     print(f"\n✅ Total EQUITY tickers: {len(df_equity2)}")
     
     print("\n📊 Tickers in both indices:")
-    both_indices = df_equity2[df_equity2['Indices'].str.contains(',')]
+    both_indices = df_equity2[df_equity2['Indices'].str.contains(',', regex=False)]
     print(f"Count: {len(both_indices)}")
     print(both_indices[['Ticker', 'Indices', 'LongName']].head(10).to_string(index=False))
     